@@ -2,6 +2,8 @@
 #
 # SPDX-License-Identifier: MIT
 """ALM SDK for Agent Lifecycle Management."""
+from .aio import AsyncALM
 from .alm import ALM
+from .retry import RetryPolicy
 
-__all__ = ["ALM"]
+__all__ = ["ALM", "AsyncALM", "RetryPolicy"]
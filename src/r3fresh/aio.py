@@ -0,0 +1,395 @@
+# SPDX-FileCopyrightText: 2026-present r3fresh <support@r3fresh.dev>
+#
+# SPDX-License-Identifier: MIT
+"""asyncio support for ALM SDK."""
+import asyncio
+import contextvars
+import sys
+import threading
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Union
+
+import httpx
+
+from .alm import ALM
+from .client import REQUEST_TIMEOUT, BaseEventClient, RequestBody
+from .events import Event, EventRecord
+
+
+async def _aiter_chunks(chunks: Iterator[bytes]) -> AsyncIterator[bytes]:
+    """Adapt a streamed request body for httpx.AsyncClient."""
+    for chunk in chunks:
+        yield chunk
+
+
+class AsyncEventClient(BaseEventClient):
+    """Client that uploads batches from a single asyncio task.
+
+    emit() stays synchronous and never awaits, so it can be called from sync tool
+    wrappers running on the loop; a background task drains the queue and posts
+    batches with httpx.AsyncClient.
+    """
+
+    def __init__(
+        self,
+        mode: str = "stdout",
+        endpoint: Optional[str] = None,
+        api_key: Optional[str] = None,
+        batch_size: int = 50,
+        **kwargs: Any,
+    ):
+        """Initialize async event client.
+
+        Args:
+            mode: Event sink mode ("stdout", "http", "file" or "parquet")
+            endpoint: HTTP endpoint URL (required for http mode)
+            api_key: API key for HTTP authentication
+            batch_size: Number of events per batch
+            **kwargs: Sink, batching and delivery options; see BaseEventClient.
+                emit() never blocks the loop, so overflow="block" drops the
+                newest event instead.
+        """
+        super().__init__(
+            mode=mode, endpoint=endpoint, api_key=api_key, batch_size=batch_size, **kwargs
+        )
+        self._http_client: Optional[httpx.AsyncClient] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread: Optional[int] = None
+        self._sender: Optional[asyncio.Task] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._progress: Optional[asyncio.Condition] = None
+        self._flush_requested = False
+        self._closed = False
+        # Guards the queue and counters: emit() may run on worker threads while
+        # the sender task drains the queue on the loop thread
+        self._queue_lock = threading.Lock()
+
+    def emit(self, event: Union[Event, EventRecord]) -> None:
+        """Add an event to the queue and wake the sender if batch size reached.
+
+        Safe to call from the loop thread or from worker threads (e.g. tools run
+        with asyncio.to_thread); never blocks. Events emitted after aclose() are
+        dropped (and counted in stats()).
+        """
+        event = self._prepare(event)
+        if self._closed:
+            self._queue.record_drop(event)
+            return
+        with self._queue_lock:
+            self._enqueue(event)
+            wake = self._should_wake_sender()
+        if self._loop is None:
+            try:
+                self._start(asyncio.get_running_loop())
+            except RuntimeError:
+                # No loop yet; events are sent once the first flush() starts the sender
+                return
+        if wake:
+            self._wake()
+
+    def _start(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Bind to the running loop and start the sender task."""
+        self._loop = loop
+        self._loop_thread = threading.get_ident()
+        self._wakeup = asyncio.Event()
+        self._progress = asyncio.Condition()
+        if self.mode == "http":
+            self._http_client = httpx.AsyncClient(
+                base_url=self._base_url(),
+                headers=self._headers(),
+                timeout=REQUEST_TIMEOUT,
+            )
+        self._sender = loop.create_task(self._run_sender(self._wakeup, self._progress))
+
+    def _after_fork_in_child(self) -> None:
+        """Forget the parent's loop, sender task and connection pool; the next emit() rebinds."""
+        super()._after_fork_in_child()
+        self._http_client = None
+        self._loop = None
+        self._loop_thread = None
+        self._sender = None
+        self._wakeup = None
+        self._progress = None
+        self._flush_requested = False
+        self._queue_lock = threading.Lock()
+
+    def _close_at_exit(self) -> None:
+        """Write the queue to the sink and close it unless aclose() already ran.
+
+        The event loop has normally stopped by now, so this runs synchronously.
+        """
+        if self._closed or self._sink is None:
+            return
+        self._closed = True
+        while True:
+            with self._queue_lock:
+                batch = self._take_batch()
+            if not batch:
+                break
+            self._sink.write(batch)
+        self._sink.close()
+
+    def _wake(self) -> None:
+        """Wake the sender task from any thread."""
+        wakeup, loop = self._wakeup, self._loop
+        if wakeup is None or loop is None:
+            # Not bound to a loop yet; the first flush() starts the sender
+            return
+        if threading.get_ident() == self._loop_thread:
+            wakeup.set()
+        else:
+            loop.call_soon_threadsafe(wakeup.set)
+
+    async def _run_sender(self, wakeup: asyncio.Event, progress: asyncio.Condition) -> None:
+        """Drain the queue in batches until the client is closed.
+
+        With a spool, spooled batches are resent every spool_retry_interval
+        whether or not the queue is busy, starting with any left by a previous
+        process.
+        """
+        loop = asyncio.get_running_loop()
+        next_drain = loop.time()
+        while True:
+            if self._spool is not None and loop.time() >= next_drain:
+                await self._drain_spool()
+                next_drain = loop.time() + self.spool_retry_interval
+            if not (
+                self._closed
+                or self._flush_requested
+                or self._batch_ready()
+            ):
+                wakeup.clear()
+                timeout = self._linger_remaining()
+                if self._spool is not None:
+                    until_drain = max(0.0, next_drain - loop.time())
+                    if timeout is None or timeout > until_drain:
+                        timeout = until_drain
+                if timeout is None:
+                    await wakeup.wait()
+                    continue
+                try:
+                    await asyncio.wait_for(wakeup.wait(), timeout)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+            if not self._queue:
+                self._flush_requested = False
+                if self._closed:
+                    return
+                continue
+
+            with self._queue_lock:
+                batch = self._take_batch()
+            await self._send(batch)
+
+            async with progress:
+                with self._queue_lock:
+                    self._processed += len(batch)
+                progress.notify_all()
+
+    async def _send(self, events: List[EventRecord]) -> None:
+        """Hand a batch of events to the configured sink."""
+        try:
+            if self.mode == "stdout":
+                self._flush_stdout(events)
+            elif self.mode == "http":
+                await self._flush_http(events)
+            elif self._sink is not None:
+                # File writes run in the default executor to keep the loop responsive
+                await asyncio.get_running_loop().run_in_executor(None, self._sink.write, events)
+        except Exception as e:
+            # Must not crash agent if server is down
+            print(f"ALM SDK: Failed to flush events: {e}", file=sys.stderr)
+
+    async def _flush_http(self, events: List[EventRecord]) -> None:
+        """Flush events to HTTP endpoint."""
+        if not self._http_client:
+            return
+
+        failure: Optional[Exception] = None
+        for body, headers in self._upload_requests(events):
+            try:
+                await self.retry_policy.acall(
+                    lambda budget: self._post(body, headers, timeout=budget)
+                )
+            except Exception as e:
+                if self._spool is None or not self.retry_policy.is_retryable(e):
+                    # Keep going so one rejected request doesn't sink the rest of the batch
+                    failure = failure or e
+                    continue
+                self._spool.append(self._materialize(body), headers)
+                print(f"ALM SDK: Spooled undeliverable events to disk: {e}", file=sys.stderr)
+        if failure is not None:
+            raise failure
+
+    async def _post(
+        self,
+        body: RequestBody,
+        headers: Dict[str, str],
+        timeout: Optional[float] = None,
+    ) -> None:
+        """POST an encoded batch, raising on transport errors and non-2xx responses.
+
+        Args:
+            body: Encoded request body, or a callable producing its chunks
+            headers: Request headers
+            timeout: Seconds left of the retry budget; caps REQUEST_TIMEOUT
+        """
+        if self._http_client is None:
+            raise RuntimeError("HTTP client is closed")
+        response = await self._http_client.post(
+            self._upload_path(headers),
+            content=_aiter_chunks(body()) if callable(body) else body,
+            headers=headers,
+            timeout=(
+                min(REQUEST_TIMEOUT, timeout) if timeout is not None else httpx.USE_CLIENT_DEFAULT
+            ),
+        )
+        response.raise_for_status()
+
+    async def _drain_spool(self) -> None:
+        """Resend spooled batches oldest first until the spool is empty or a send fails."""
+        spool = self._spool
+        while spool is not None and not self._closed and self._http_client is not None:
+            record = spool.peek()
+            if record is None:
+                return
+            position, body, headers = record
+            try:
+                await self._post(body, headers)
+            except Exception as e:
+                if self.retry_policy.is_retryable(e):
+                    return
+                print(f"ALM SDK: Dropping spooled batch rejected by endpoint: {e}", file=sys.stderr)
+            spool.commit(position)
+
+    async def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait until every event queued before the call has been handed to the sink.
+
+        Args:
+            timeout: Seconds to wait for the sender (defaults to flush_timeout)
+
+        Returns:
+            False if the sender did not catch up before the deadline, True otherwise
+        """
+        if self._loop is None:
+            self._start(asyncio.get_running_loop())
+        sender, wakeup, progress = self._sender, self._wakeup, self._progress
+        assert sender is not None and wakeup is not None and progress is not None  # set by _start()
+        target = self._enqueued
+        if self._processed >= target:
+            return True
+        if sender.done():
+            return False
+
+        self._flush_requested = True
+        wakeup.set()
+        try:
+            async with progress:
+                await asyncio.wait_for(
+                    progress.wait_for(lambda: self._processed >= target),
+                    self.flush_timeout if timeout is None else timeout,
+                )
+        except asyncio.TimeoutError:
+            return False
+        return True
+
+    async def aclose(self, timeout: Optional[float] = None) -> None:
+        """Stop the sender task (draining what it can) and close the HTTP client.
+
+        Args:
+            timeout: Seconds to wait for the sender (defaults to flush_timeout)
+        """
+        self._closed = True
+        if self._sender is not None and self._wakeup is not None and not self._sender.done():
+            self._wakeup.set()
+            try:
+                await asyncio.wait_for(
+                    asyncio.shield(self._sender),
+                    self.flush_timeout if timeout is None else timeout,
+                )
+            except asyncio.TimeoutError:
+                self._sender.cancel()
+                print(
+                    "ALM SDK: Timed out waiting for background sender; "
+                    f"{len(self._queue)} events not sent",
+                    file=sys.stderr,
+                )
+        if self._spool is not None:
+            self._spool.close()
+        if self._sink is not None:
+            self._sink.close()
+        if self._http_client:
+            await self._http_client.aclose()
+            self._http_client = None
+
+    async def __aenter__(self):
+        """Async context manager entry."""
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit - flush and close."""
+        await self.flush()
+        await self.aclose()
+
+
+class AsyncALM(ALM):
+    """ALM variant for asyncio agents.
+
+    Events are uploaded by one background task per client, so any number of
+    concurrent coroutines can share an instance without blocking the loop. Use
+    ``async with`` for runs and tasks so run.end waits for the upload without
+    blocking.
+
+    The current run is tracked per asyncio context rather than per instance, so
+    concurrent coroutines can each have their own run on a shared AsyncALM.
+    """
+
+    client: AsyncEventClient
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        """Initialize AsyncALM; accepts the same arguments as ALM."""
+        self._run_var: contextvars.ContextVar = contextvars.ContextVar(
+            "r3fresh_current_run", default=None
+        )
+        super().__init__(*args, **kwargs)
+
+    @property
+    def _current_run(self):
+        """Run active in the current asyncio context."""
+        return self._run_var.get()
+
+    @_current_run.setter
+    def _current_run(self, run) -> None:
+        self._run_var.set(run)
+
+    def _make_client(self, **client_kwargs) -> AsyncEventClient:
+        """Create the asyncio event client."""
+        client_kwargs.pop("background", None)
+        return AsyncEventClient(**client_kwargs)
+
+    def flush(self) -> None:
+        """Wake the sender task without waiting; use ``await aflush()`` to wait."""
+        if self.client._loop is not None:
+            self.client._flush_requested = True
+            self.client._wake()
+
+    async def aflush(self) -> None:
+        """Flush queued events and wait for the upload."""
+        await self.client.flush()
+
+    async def aclose(self) -> None:
+        """Flush queued events and close the client."""
+        await self.client.flush()
+        await self.client.aclose()
+
+    def __enter__(self):
+        """Sync context management is not supported; use ``async with``."""
+        raise TypeError("AsyncALM must be used with 'async with'")
+
+    async def __aenter__(self):
+        """Async context manager entry."""
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit - flush and close."""
+        await self.aclose()
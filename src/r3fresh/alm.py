@@ -4,11 +4,13 @@
 """Main ALM class for Agent Lifecycle Management SDK."""
 from typing import Any, Callable, ContextManager, Dict, Optional, Set
 
-from .client import EventClient
-from .events import handoff_event, task_end_event, task_start_event
+from .client import BaseEventClient, EventClient
+from .events import EventEnvelope, handoff_event, task_end_event, task_start_event
 from .policy import Policy
+from .retry import RetryPolicy
 from .run import Run
-from .tool import tool
+from .sampling import Sampler
+from .tool import EVENT_VERBOSITIES, tool
 from .util import new_id, utc_now_iso
 
 
@@ -28,13 +30,45 @@ class ALM:
         max_tool_calls_per_run: Optional[int] = None,
         agent_version: Optional[str] = None,
         policy_version: Optional[str] = None,
+        background: bool = False,
+        flush_timeout: float = 5.0,
+        compression: Optional[str] = None,
+        compression_threshold: int = 1024,
+        spool_dir: Optional[str] = None,
+        spool_max_bytes: int = 64 * 1024 * 1024,
+        spool_max_age: float = 24 * 60 * 60,
+        retry_policy: Optional[RetryPolicy] = None,
+        max_queue_events: Optional[int] = None,
+        max_queue_bytes: Optional[int] = None,
+        overflow: str = "drop_oldest",
+        block_timeout: float = 1.0,
+        linger_ms: Optional[float] = None,
+        max_batch_bytes: Optional[int] = 1024 * 1024,
+        oversize_events: str = "truncate",
+        upload_format: str = "json",
+        serializer: str = "auto",
+        validate_events: bool = False,
+        batch_format: str = "v1",
+        output_dir: Optional[str] = None,
+        parquet_rows_per_file: int = 100_000,
+        parquet_row_group_rows: int = 10_000,
+        file_max_bytes: int = 64 * 1024 * 1024,
+        file_rotate_interval: Optional[float] = None,
+        file_compression: Optional[str] = None,
+        fsync: str = "never",
+        fsync_interval: float = 1.0,
+        stdout_line_buffered: bool = False,
+        wire_format: str = "json",
+        tool_sample_rates: Optional[Dict[str, float]] = None,
+        event_sample_rates: Optional[Dict[str, float]] = None,
+        event_verbosity: str = "full",
     ):
         """Initialize ALM instance.
 
         Args:
             agent_id: Unique identifier for the agent
             env: Environment name (e.g., "development", "production")
-            mode: Event sink mode ("stdout" or "http")
+            mode: Event sink mode ("stdout", "http", "file" or "parquet")
             endpoint: HTTP endpoint URL (required for http mode)
             api_key: API key for HTTP authentication
             allowed_tools: Set of allowed tool names
@@ -43,12 +77,98 @@ class ALM:
             max_tool_calls_per_run: Maximum tool calls per run
             agent_version: Optional agent version string
             policy_version: Optional policy version string
+            background: Send events from a background thread instead of the caller's
+            flush_timeout: Seconds flush()/close() wait for the background sender
+            compression: Compress HTTP batches with "gzip" or "zstd" (None disables)
+            compression_threshold: Minimum body size in bytes before compressing
+            spool_dir: Directory where batches that fail to upload are kept and retried
+            spool_max_bytes: Disk budget for the spool; oldest batches are dropped beyond it
+            spool_max_age: Seconds after which spooled batches are discarded
+            retry_policy: Backoff policy for event uploads (defaults to RetryPolicy())
+            max_queue_events: Maximum events buffered in memory (None = unbounded)
+            max_queue_bytes: Maximum approximate bytes buffered in memory (None = unbounded)
+            overflow: Policy when the buffer is full: "block", "drop_newest",
+                "drop_oldest" or "drop_low_priority"
+            block_timeout: Seconds a full buffer may block emit() under "block"
+            linger_ms: Maximum time an event waits for its batch to fill; enables
+                the background sender
+            max_batch_bytes: Send a batch once it reaches about this many bytes; HTTP
+                requests are split so no body exceeds it (None disables)
+            oversize_events: "truncate" large fields of an event bigger than
+                max_batch_bytes, or "send_alone" to post it by itself
+            upload_format: "json" batches, or "ndjson" to stream batches one event
+                per line to /v1/events:ndjson
+            serializer: JSON backend ("auto", "orjson", "msgspec" or "json")
+            validate_events: Validate every event with pydantic before queuing it
+                (debugging aid; raises on invalid fields)
+            batch_format: "v1" (complete events) or "v2" (fields shared by a batch
+                are sent once in a header)
+            output_dir: Directory for file output (required for file and parquet modes)
+            parquet_rows_per_file: Rows per Parquet file before a new one is started
+            parquet_row_group_rows: Rows buffered before a Parquet row group is written
+            file_max_bytes: Size at which a JSONL file is rotated (file mode)
+            file_rotate_interval: Seconds after which a JSONL file is rotated
+            file_compression: Compress rotated JSONL files with "gzip" or "zstd"
+            fsync: "never", "batch" or "interval" (file mode durability)
+            fsync_interval: Seconds between fsyncs under fsync="interval"
+            stdout_line_buffered: Write and flush each event separately in stdout
+                mode instead of one write per batch
+            wire_format: HTTP body encoding, "json" or "msgpack"
+            tool_sample_rates: Fraction of successful calls to emit events for, per
+                tool name; errors and denials are always emitted and run
+                summaries always count every call
+            event_sample_rates: Fraction to emit per tool event type
+                ("tool.request", "policy.decision" or "tool.response"), combined
+                with tool_sample_rates
+            event_verbosity: "full" (tool.request, policy.decision and
+                tool.response per call) or "compact" (one tool.call per successful
+                call; denied and failed calls still emit all three)
         """
-        self.agent_id = agent_id
-        self.env = env
-        self.agent_version = agent_version
-        self.policy_version = policy_version
-        self.client = EventClient(mode=mode, endpoint=endpoint, api_key=api_key)
+        if event_verbosity not in EVENT_VERBOSITIES:
+            raise ValueError(
+                f"Invalid event_verbosity: {event_verbosity}. Must be one of {EVENT_VERBOSITIES}"
+            )
+        self.event_verbosity = event_verbosity
+        self._agent_id = agent_id
+        self._env = env
+        self._agent_version = agent_version
+        self._policy_version = policy_version
+        self._envelope = self._make_envelope()
+        self.sampler = Sampler(tool_rates=tool_sample_rates, event_rates=event_sample_rates)
+        self.client: BaseEventClient = self._make_client(
+            mode=mode,
+            endpoint=endpoint,
+            api_key=api_key,
+            background=background,
+            flush_timeout=flush_timeout,
+            compression=compression,
+            compression_threshold=compression_threshold,
+            spool_dir=spool_dir,
+            spool_max_bytes=spool_max_bytes,
+            spool_max_age=spool_max_age,
+            retry_policy=retry_policy,
+            max_queue_events=max_queue_events,
+            max_queue_bytes=max_queue_bytes,
+            overflow=overflow,
+            block_timeout=block_timeout,
+            linger_ms=linger_ms,
+            max_batch_bytes=max_batch_bytes,
+            oversize_events=oversize_events,
+            upload_format=upload_format,
+            serializer=serializer,
+            validate_events=validate_events,
+            batch_format=batch_format,
+            output_dir=output_dir,
+            parquet_rows_per_file=parquet_rows_per_file,
+            parquet_row_group_rows=parquet_row_group_rows,
+            file_max_bytes=file_max_bytes,
+            file_rotate_interval=file_rotate_interval,
+            file_compression=file_compression,
+            fsync=fsync,
+            fsync_interval=fsync_interval,
+            stdout_line_buffered=stdout_line_buffered,
+            wire_format=wire_format,
+        )
         self.policy = Policy(
             allowed_tools=allowed_tools,
             denied_tools=denied_tools,
@@ -57,6 +177,59 @@ class ALM:
         )
         self._current_run: Optional[Run] = None
 
+    @property
+    def agent_id(self) -> str:
+        """Agent identifier stamped on every event."""
+        return self._agent_id
+
+    @agent_id.setter
+    def agent_id(self, value: str) -> None:
+        self._agent_id = value
+        self._envelope = self._make_envelope()
+
+    @property
+    def env(self) -> str:
+        """Environment name stamped on every event."""
+        return self._env
+
+    @env.setter
+    def env(self, value: str) -> None:
+        self._env = value
+        self._envelope = self._make_envelope()
+
+    @property
+    def agent_version(self) -> Optional[str]:
+        """Agent version stamped on every event."""
+        return self._agent_version
+
+    @agent_version.setter
+    def agent_version(self, value: Optional[str]) -> None:
+        self._agent_version = value
+        self._envelope = self._make_envelope()
+
+    @property
+    def policy_version(self) -> Optional[str]:
+        """Policy version stamped on every event."""
+        return self._policy_version
+
+    @policy_version.setter
+    def policy_version(self, value: Optional[str]) -> None:
+        self._policy_version = value
+        self._envelope = self._make_envelope()
+
+    def _make_envelope(self) -> EventEnvelope:
+        """Build the fields shared by every event (rebuilt whenever one changes)."""
+        return EventEnvelope(
+            agent_id=self._agent_id,
+            env=self._env,
+            agent_version=self._agent_version,
+            policy_version=self._policy_version,
+        )
+
+    def _make_client(self, **client_kwargs: Any) -> BaseEventClient:
+        """Create the event client (overridden by AsyncALM)."""
+        return EventClient(**client_kwargs)
+
     def task(
         self,
         task_type: Optional[str] = None,
@@ -101,7 +274,16 @@ class ALM:
 
     def flush(self) -> None:
         """Flush queued events."""
-        self.client.flush()
+        if isinstance(self.client, EventClient):
+            self.client.flush()
+
+    def stats(self) -> Dict[str, Any]:
+        """Return event queue depth and dropped event counters."""
+        return self.client.stats()
+
+    async def aflush(self) -> None:
+        """Flush queued events from a coroutine (blocking clients flush inline)."""
+        self.flush()
 
     def _new_run_id(self) -> str:
         """Generate a new run ID."""
@@ -132,17 +314,14 @@ class ALM:
             self._current_run.record_handoff()
 
         event = handoff_event(
+            self._envelope,
             event_id=new_id(),
             timestamp=utc_now_iso(),
-            agent_id=self.agent_id,
-            env=self.env,
             run_id=self._current_run_id(),
             from_agent_id=self.agent_id,
             to_agent_id=to_agent_id,
             reason=reason,
             context=context,
-            agent_version=self.agent_version,
-            policy_version=self.policy_version,
         )
         self.client.emit(event)
 
@@ -175,30 +354,46 @@ class TaskContext:
         self.alm = alm_instance
         self.task_type = task_type
         self.description = description
-        self.task_id = None
+        self.task_id: Optional[str] = None
 
     def __enter__(self):
         """Enter task context - emit task.start."""
+        self._start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Exit task context - emit task.end."""
+        self._end(exc_type, exc_val)
+        return False  # Don't suppress exceptions
+
+    async def __aenter__(self):
+        """Async enter - emit task.start."""
+        self._start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async exit - emit task.end."""
+        self._end(exc_type, exc_val)
+        return False
+
+    def _start(self) -> None:
+        """Emit task.start."""
         self.task_id = new_id()
 
         event = task_start_event(
+            self.alm._envelope,
             event_id=new_id(),
             timestamp=utc_now_iso(),
-            agent_id=self.alm.agent_id,
-            env=self.alm.env,
             run_id=self.alm._current_run_id(),
             task_id=self.task_id,
             task_type=self.task_type,
             description=self.description,
-            agent_version=self.alm.agent_version,
-            policy_version=self.alm.policy_version,
         )
         self.alm.client.emit(event)
 
-        return self
-
-    def __exit__(self, exc_type, exc_val, exc_tb):
-        """Exit task context - emit task.end."""
+    def _end(self, exc_type, exc_val) -> None:
+        """Emit task.end and update run statistics."""
+        assert self.task_id is not None  # set by _start()
         success = exc_type is None
         error = None
 
@@ -208,16 +403,13 @@ class TaskContext:
             error = create_structured_error(exc_val, source="agent")
 
         event = task_end_event(
+            self.alm._envelope,
             event_id=new_id(),
             timestamp=utc_now_iso(),
-            agent_id=self.alm.agent_id,
-            env=self.alm.env,
             run_id=self.alm._current_run_id(),
             task_id=self.task_id,
             success=success,
             error=error,
-            agent_version=self.alm.agent_version,
-            policy_version=self.alm.policy_version,
         )
         self.alm.client.emit(event)
 
@@ -227,5 +419,3 @@ class TaskContext:
                 self.alm._current_run.record_task_completed()
             else:
                 self.alm._current_run.record_task_failed()
-
-        return False  # Don't suppress exceptions
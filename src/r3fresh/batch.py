@@ -0,0 +1,177 @@
+# SPDX-FileCopyrightText: 2026-present r3fresh <support@r3fresh.dev>
+#
+# SPDX-License-Identifier: MIT
+"""Size-aware assembly of HTTP event batches."""
+import gzip
+import struct
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .events import ENVELOPE_FIELDS, Event
+from .serialize import JSON_CONTENT_TYPE, MSGPACK_CONTENT_TYPE, MsgpackSerializer, Serializer
+
+try:
+    import zstandard
+except ImportError:  # zstd compression is optional
+    zstandard = None  # type: ignore[assignment]
+
+OVERSIZE_POLICIES = ("truncate", "send_alone")
+BATCH_FORMATS = ("v1", "v2")
+
+# Fields a v2 batch moves into its header when every event in the batch shares them
+HOISTED_FIELDS = ENVELOPE_FIELDS + ("run_id",)
+
+# Metadata fields that carry caller data and may be arbitrarily large
+TRUNCATABLE_FIELDS = ("result", "args", "context")
+
+_BATCH_PREFIX = b'{"events":['
+_BATCH_SUFFIX = b"]}"
+BATCH_OVERHEAD = len(_BATCH_PREFIX) + len(_BATCH_SUFFIX)
+
+# MessagePack map with one key, "events", followed by an array header
+_MSGPACK_BATCH_PREFIX = b"\x81\xa6events"
+
+
+def truncate_event(
+    event_data: Dict[str, Any],
+    limit: int,
+    dumps: Callable[[Any], bytes],
+) -> Tuple[bytes, Dict[str, Any]]:
+    """Encode an event, replacing large caller-supplied metadata until it fits in limit.
+
+    Replaced fields become a short marker recording their original encoded size, and
+    metadata.truncated lists what was removed. The result may still exceed limit if
+    the remaining fields are large on their own.
+
+    Args:
+        event_data: Event as a JSON-ready dict
+        limit: Maximum encoded size in bytes
+        dumps: Serializer used to encode the event
+
+    Returns:
+        (encoded, event_data): the encoded event and the (possibly truncated) dict
+    """
+    metadata = dict(event_data.get("metadata") or {})
+    truncated = []
+    encoded = dumps(event_data)
+    sizes = {field: len(dumps(metadata[field])) for field in TRUNCATABLE_FIELDS if field in metadata}
+    # Drop the biggest offenders first
+    for field in sorted(sizes, key=sizes.__getitem__, reverse=True):
+        if len(encoded) <= limit:
+            break
+        metadata[field] = f"<truncated: {sizes[field]} bytes>"
+        truncated.append(field)
+        metadata["truncated"] = truncated
+        event_data = {**event_data, "metadata": metadata}
+        encoded = dumps(event_data)
+    return encoded, event_data
+
+
+def split_batches(encoded_events: List[bytes], max_bytes: Optional[int]) -> List[List[bytes]]:
+    """Group encoded events into batches whose request body stays within max_bytes.
+
+    Order is preserved. An event too large for any batch is placed in a batch of its own.
+    """
+    if max_bytes is None:
+        return [encoded_events] if encoded_events else []
+    limit = max_bytes - BATCH_OVERHEAD
+    batches: List[List[bytes]] = []
+    current: List[bytes] = []
+    current_bytes = 0
+    for encoded in encoded_events:
+        # +1 for the separating comma
+        size = len(encoded) + (1 if current else 0)
+        if current and current_bytes + size > limit:
+            batches.append(current)
+            current, current_bytes = [], 0
+            size = len(encoded)
+        current.append(encoded)
+        current_bytes += size
+    if current:
+        batches.append(current)
+    return batches
+
+
+def batch_body(encoded_events: List[bytes]) -> bytes:
+    """Join encoded events into a {"events": [...]} request body."""
+    return _BATCH_PREFIX + b",".join(encoded_events) + _BATCH_SUFFIX
+
+
+def msgpack_batch_body(encoded_events: List[bytes]) -> bytes:
+    """Join MessagePack-encoded events into an {"events": [...]} request body."""
+    count = len(encoded_events)
+    if count < 16:
+        header = bytes([0x90 | count])
+    elif count < 2 ** 16:
+        header = b"\xdc" + struct.pack(">H", count)
+    else:
+        header = b"\xdd" + struct.pack(">I", count)
+    return _MSGPACK_BATCH_PREFIX + header + b"".join(encoded_events)
+
+
+def hoist_batch(events: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Build a v2 batch document: shared fields in a header, the rest per event.
+
+    A field is hoisted only if every event in the batch has the same value for it;
+    events keep whatever differs. expand_batch() reverses this.
+    """
+    header: Dict[str, Any] = {}
+    if events:
+        first = events[0]
+        for field in HOISTED_FIELDS:
+            value = first.get(field)
+            if all(event.get(field) == value for event in events):
+                header[field] = value
+    return {
+        "version": 2,
+        "header": header,
+        "events": [
+            {key: value for key, value in event.items() if key not in header}
+            for event in events
+        ],
+    }
+
+
+def expand_batch(payload: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Decode a batch document (v1 or v2) into a list of complete v1 events.
+
+    Intended for collectors: a v2 header is merged back into each event and the
+    fields are returned in the order of the Event model.
+    """
+    if payload.get("version", 1) == 1:
+        return list(payload.get("events", []))
+    if payload["version"] != 2:
+        raise ValueError(f"Unsupported batch version: {payload['version']}")
+    header = payload.get("header", {})
+    expanded = []
+    for event in payload.get("events", []):
+        merged = {**header, **event}
+        ordered = {field: merged.pop(field) for field in Event.model_fields if field in merged}
+        ordered.update(merged)
+        expanded.append(ordered)
+    return expanded
+
+
+def decode_batch(
+    body: bytes,
+    content_type: str = JSON_CONTENT_TYPE,
+    content_encoding: Optional[str] = None,
+) -> List[Dict[str, Any]]:
+    """Decode an uploaded request body into complete v1 events.
+
+    Handles gzip/zstd Content-Encoding, JSON or MessagePack Content-Type, and v1
+    or v2 batch documents, so collectors need a single call per request.
+    """
+    if content_encoding == "gzip":
+        body = gzip.decompress(body)
+    elif content_encoding == "zstd":
+        if zstandard is None:
+            raise ValueError("zstd-encoded body requires zstandard")
+        body = zstandard.ZstdDecompressor().decompressobj().decompress(body)
+    elif content_encoding:
+        raise ValueError(f"Unsupported Content-Encoding: {content_encoding}")
+    media_type = content_type.split(";")[0].strip().lower()
+    if media_type in (MSGPACK_CONTENT_TYPE, "application/x-msgpack", "application/vnd.msgpack"):
+        payload = MsgpackSerializer().loads(body)
+    else:
+        payload = Serializer().loads(body)
+    return expand_batch(payload)
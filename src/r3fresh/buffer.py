@@ -0,0 +1,159 @@
+# SPDX-FileCopyrightText: 2026-present r3fresh <support@r3fresh.dev>
+#
+# SPDX-License-Identifier: MIT
+"""Bounded in-memory event queue for ALM SDK."""
+import time
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+from .events import EventRecord
+
+OVERFLOW_POLICIES = ("block", "drop_newest", "drop_oldest", "drop_low_priority")
+
+# Event types that are first to go under drop_low_priority: the request and decision
+# are largely repeated by the tool.response that follows them
+LOW_PRIORITY_EVENT_TYPES = frozenset({"tool.request", "policy.decision", "task.start"})
+
+
+def estimate_size(value: Any) -> int:
+    """Cheap approximation of the serialized JSON size of a value, in bytes."""
+    if isinstance(value, str):
+        return len(value) + 2
+    if isinstance(value, dict):
+        return 2 + sum(len(str(k)) + 4 + estimate_size(v) for k, v in value.items())
+    if isinstance(value, (list, tuple)):
+        return 2 + sum(estimate_size(v) + 1 for v in value)
+    if value is None or isinstance(value, bool):
+        return 5
+    if isinstance(value, (int, float)):
+        return 12
+    return len(str(value)) + 2
+
+
+def estimate_event_size(event: EventRecord) -> int:
+    """Approximate serialized size of an event."""
+    # Fixed-width envelope (ids, timestamp, versions, field names) plus the metadata payload
+    raw = event.raw_fields
+    if raw is not None:
+        # Estimate deferred records from their raw values (plus ~16 bytes per key)
+        # so the agent thread never builds the metadata dict just to size it
+        payload = estimate_size(raw) + 16 * len(raw)
+    else:
+        payload = estimate_size(event.metadata)
+    return 320 + len(event.agent_id) + len(event.env) + payload
+
+
+class EventBuffer:
+    """FIFO of pending events bounded by count and approximate bytes.
+
+    The buffer itself never blocks; put() reports whether the event fits so the
+    owning client can wait, flush, or apply the configured drop policy.
+    """
+
+    def __init__(
+        self,
+        max_events: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+        overflow: str = "drop_oldest",
+    ):
+        """Initialize the buffer.
+
+        Args:
+            max_events: Maximum number of queued events (None = unbounded)
+            max_bytes: Maximum approximate queued bytes (None = unbounded)
+            overflow: "block", "drop_newest", "drop_oldest" or "drop_low_priority"
+        """
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError(f"Invalid overflow: {overflow}. Must be one of {OVERFLOW_POLICIES}")
+        self.max_events = max_events
+        self.max_bytes = max_bytes
+        self.overflow = overflow
+        self.bytes = 0
+        self.dropped_events = 0
+        self.dropped_by_type: Dict[str, int] = {}
+        # (event, approximate size, monotonic enqueue time)
+        self._events: Deque[Tuple[EventRecord, int, float]] = deque()
+
+    def __len__(self) -> int:
+        return len(self._events)
+
+    def has_room(self, size: int = 0) -> bool:
+        """Return True if an event of the given size fits without evicting anything."""
+        if self.max_events is not None and len(self._events) >= self.max_events:
+            return False
+        if self.max_bytes is not None and self._events and self.bytes + size > self.max_bytes:
+            return False
+        return True
+
+    def put(self, event: EventRecord, size: Optional[int] = None) -> Tuple[bool, int]:
+        """Append an event, applying the drop policy if the buffer is full.
+
+        "block" behaves like "drop_newest" here; blocking is up to the caller,
+        which should wait for has_room() before calling put().
+
+        Returns:
+            (accepted, evicted): whether the event was queued, and how many
+            previously queued events were dropped to make room
+        """
+        if size is None:
+            size = estimate_event_size(event)
+        evicted = 0
+        while not self.has_room(size):
+            if self.overflow in ("block", "drop_newest"):
+                self.record_drop(event)
+                return False, evicted
+            if self.overflow == "drop_low_priority":
+                if not self._evict_low_priority():
+                    if event.event_type in LOW_PRIORITY_EVENT_TYPES:
+                        self.record_drop(event)
+                        return False, evicted
+                    self._evict_oldest()
+            else:
+                self._evict_oldest()
+            evicted += 1
+        self._events.append((event, size, time.monotonic()))
+        self.bytes += size
+        return True, evicted
+
+    def oldest_age(self) -> Optional[float]:
+        """Seconds the oldest queued event has been waiting, or None if empty."""
+        if not self._events:
+            return None
+        return time.monotonic() - self._events[0][2]
+
+    def take(self, count: int, max_bytes: Optional[int] = None) -> List[EventRecord]:
+        """Remove and return up to count events (and about max_bytes) from the front."""
+        taken: List[EventRecord] = []
+        taken_bytes = 0
+        while self._events and len(taken) < count:
+            size = self._events[0][1]
+            if max_bytes is not None and taken and taken_bytes + size > max_bytes:
+                break
+            event, size, _ = self._events.popleft()
+            self.bytes -= size
+            taken_bytes += size
+            taken.append(event)
+        return taken
+
+    def drain(self) -> List[EventRecord]:
+        """Remove and return every queued event."""
+        return self.take(len(self._events))
+
+    def _evict_oldest(self) -> None:
+        event, size, _ = self._events.popleft()
+        self.bytes -= size
+        self.record_drop(event)
+
+    def _evict_low_priority(self) -> bool:
+        for index, (event, size, _) in enumerate(self._events):
+            if event.event_type in LOW_PRIORITY_EVENT_TYPES:
+                del self._events[index]
+                self.bytes -= size
+                self.record_drop(event)
+                return True
+        return False
+
+    def record_drop(self, event: EventRecord) -> None:
+        """Count an event that was discarded instead of queued."""
+        self.dropped_events += 1
+        self.dropped_by_type[event.event_type] = self.dropped_by_type.get(event.event_type, 0) + 1
@@ -2,17 +2,95 @@
 #
 # SPDX-License-Identifier: MIT
 """Event client for ALM SDK."""
-import json
+import atexit
+import gzip
+import os
 import sys
-from typing import List, Optional
+import threading
+import time
+import weakref
+import zlib
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple, Union
 
 import httpx
 
-from .events import Event
+from .batch import (
+    BATCH_FORMATS,
+    BATCH_OVERHEAD,
+    OVERSIZE_POLICIES,
+    batch_body,
+    hoist_batch,
+    msgpack_batch_body,
+    split_batches,
+    truncate_event,
+)
+from .buffer import EventBuffer, estimate_event_size
+from .events import Event, EventRecord, as_record
+from .retry import RetryPolicy, parse_retry_after
+from .serialize import MsgpackSerializer, Serializer, get_serializer
+from .sinks import FileSink, ParquetSink
+from .spool import DiskSpool
 
+try:
+    import zstandard
+except ImportError:  # zstd compression is optional
+    zstandard = None  # type: ignore[assignment]
 
-class EventClient:
-    """Client for emitting events to stdout or HTTP endpoint."""
+MODES = ("stdout", "http", "file", "parquet")
+COMPRESSION_TYPES = ("gzip", "zstd")
+UPLOAD_FORMATS = ("json", "ndjson")
+WIRE_FORMATS = ("json", "msgpack")
+
+EVENTS_PATH = "/v1/events"
+NDJSON_PATH = "/v1/events:ndjson"
+NDJSON_CONTENT_TYPE = "application/x-ndjson"
+
+# Seconds a single upload request may take; retries further cap it to what is
+# left of RetryPolicy.max_elapsed
+REQUEST_TIMEOUT = 10.0
+
+# A request body: encoded bytes, or a factory returning a fresh chunk iterator
+# (so a streamed body can be regenerated for each retry)
+RequestBody = Union[bytes, Callable[[], Iterator[bytes]]]
+
+# Live clients, so fork handlers can flush them in the parent and reset them in the
+# child, and file output left open is finalized at exit
+_clients: "weakref.WeakSet[BaseEventClient]" = weakref.WeakSet()
+
+
+def _before_fork() -> None:
+    """Send pending events so they are neither lost nor duplicated by the child."""
+    for client in list(_clients):
+        try:
+            client._before_fork()
+        except Exception as e:
+            print(f"ALM SDK: Failed to flush events before fork: {e}", file=sys.stderr)
+
+
+def _after_fork_in_child() -> None:
+    """Drop state inherited from the parent (queued events, sockets, threads)."""
+    for client in list(_clients):
+        client._after_fork_in_child()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(before=_before_fork, after_in_child=_after_fork_in_child)
+
+
+@atexit.register
+def _close_at_exit() -> None:
+    """Write queued events and finalize the files of clients that were never closed."""
+    for client in list(_clients):
+        if client._sink is None:
+            continue
+        try:
+            client._close_at_exit()
+        except Exception as e:
+            print(f"ALM SDK: Failed to close event sink at exit: {e}", file=sys.stderr)
+
+
+class BaseEventClient:
+    """Configuration and batch encoding shared by the sync and async clients."""
 
     def __init__(
         self,
@@ -20,84 +98,763 @@ class EventClient:
         endpoint: Optional[str] = None,
         api_key: Optional[str] = None,
         batch_size: int = 50,
+        flush_timeout: float = 5.0,
+        compression: Optional[str] = None,
+        compression_threshold: int = 1024,
+        spool_dir: Optional[str] = None,
+        spool_max_bytes: int = 64 * 1024 * 1024,
+        spool_max_age: float = 24 * 60 * 60,
+        spool_retry_interval: float = 5.0,
+        retry_policy: Optional[RetryPolicy] = None,
+        max_queue_events: Optional[int] = None,
+        max_queue_bytes: Optional[int] = None,
+        overflow: str = "drop_oldest",
+        block_timeout: float = 1.0,
+        linger_ms: Optional[float] = None,
+        max_batch_bytes: Optional[int] = 1024 * 1024,
+        oversize_events: str = "truncate",
+        upload_format: str = "json",
+        serializer: str = "auto",
+        validate_events: bool = False,
+        batch_format: str = "v1",
+        output_dir: Optional[str] = None,
+        parquet_rows_per_file: int = 100_000,
+        parquet_row_group_rows: int = 10_000,
+        file_max_bytes: int = 64 * 1024 * 1024,
+        file_rotate_interval: Optional[float] = None,
+        file_compression: Optional[str] = None,
+        fsync: str = "never",
+        fsync_interval: float = 1.0,
+        stdout_line_buffered: bool = False,
+        wire_format: str = "json",
     ):
-        """Initialize event client.
+        """Initialize shared client state.
 
         Args:
-            mode: "stdout" or "http"
+            mode: "stdout", "http", "file" or "parquet"
             endpoint: HTTP endpoint URL (required for http mode)
             api_key: API key for HTTP authentication
             batch_size: Number of events to batch before flushing
+            flush_timeout: Seconds flush()/close() wait for a background sender
+            compression: Content-Encoding for HTTP batches ("gzip", "zstd" or None)
+            compression_threshold: Bodies smaller than this many bytes are sent uncompressed
+            spool_dir: Directory for persisting batches that fail to upload (None disables)
+            spool_max_bytes: Maximum bytes kept in the spool before the oldest are dropped
+            spool_max_age: Maximum age in seconds of a spooled batch
+            spool_retry_interval: Seconds between attempts to drain the spool
+            retry_policy: Backoff policy for uploads (defaults to RetryPolicy())
+            max_queue_events: Maximum events held in memory (None = unbounded)
+            max_queue_bytes: Maximum approximate bytes held in memory (None = unbounded)
+            overflow: What to do when the queue is full: "block", "drop_newest",
+                "drop_oldest" or "drop_low_priority"
+            block_timeout: Seconds emit() may block under the "block" policy before
+                dropping the event
+            linger_ms: Send a partial batch once its oldest event has waited this long
+            max_batch_bytes: Send once queued events reach about this many bytes, and
+                split HTTP requests so no uncompressed body exceeds it (None disables)
+            oversize_events: What to do with a single event larger than max_batch_bytes:
+                "truncate" its result/args/context, or "send_alone" in its own request
+            upload_format: "json" posts {"events": [...]} documents to /v1/events;
+                "ndjson" streams one event per line to /v1/events:ndjson with chunked
+                transfer, so memory per flush is bounded by one event
+            serializer: JSON backend: "auto" (orjson or msgspec when installed,
+                else stdlib json), "orjson", "msgspec" or "json"
+            validate_events: Validate every emitted event against the pydantic Event
+                model and raise on invalid fields (a debugging aid; off by default)
+            batch_format: "v1" sends complete events; "v2" hoists fields shared by
+                the whole batch (agent_id, env, versions, run_id) into a header
+                (see r3fresh.batch.expand_batch). Applies to upload_format="json"
+            output_dir: Directory for file output (required for file and parquet modes)
+            parquet_rows_per_file: Rows after which a Parquet file is closed and a
+                new one started
+            parquet_row_group_rows: Rows buffered in memory before they are written
+                as one Parquet row group
+            file_max_bytes: Size at which a JSONL file is closed (file mode)
+            file_rotate_interval: Seconds after which a JSONL file is closed (None disables)
+            file_compression: Compress closed JSONL files with "gzip" or "zstd"
+            fsync: "never" (leave it to the OS), "batch" (after every batch) or
+                "interval" (at most every fsync_interval seconds)
+            fsync_interval: Seconds between fsyncs under fsync="interval"
+            stdout_line_buffered: In stdout mode, write and flush every event on
+                its own instead of one write per batch (for interactive use)
+            wire_format: Encoding of HTTP batch bodies: "json", or "msgpack" sent
+                as Content-Type application/msgpack (see r3fresh.batch.decode_batch)
         """
-        if mode not in ("stdout", "http"):
-            raise ValueError(f"Invalid mode: {mode}. Must be 'stdout' or 'http'")
+        if mode not in MODES:
+            raise ValueError(f"Invalid mode: {mode}. Must be one of {MODES}")
         if mode == "http" and not endpoint:
             raise ValueError("endpoint is required for http mode")
+        if mode in ("file", "parquet") and not output_dir:
+            raise ValueError(f"output_dir is required for {mode} mode")
+        if compression is not None and compression not in COMPRESSION_TYPES:
+            raise ValueError(
+                f"Invalid compression: {compression}. Must be one of {COMPRESSION_TYPES} or None"
+            )
+        if oversize_events not in OVERSIZE_POLICIES:
+            raise ValueError(
+                f"Invalid oversize_events: {oversize_events}. Must be one of {OVERSIZE_POLICIES}"
+            )
+        if upload_format not in UPLOAD_FORMATS:
+            raise ValueError(
+                f"Invalid upload_format: {upload_format}. Must be one of {UPLOAD_FORMATS}"
+            )
+        if batch_format not in BATCH_FORMATS:
+            raise ValueError(
+                f"Invalid batch_format: {batch_format}. Must be one of {BATCH_FORMATS}"
+            )
+        if batch_format == "v2" and upload_format != "json":
+            raise ValueError('batch_format="v2" requires upload_format="json"')
+        if wire_format not in WIRE_FORMATS:
+            raise ValueError(f"Invalid wire_format: {wire_format}. Must be one of {WIRE_FORMATS}")
+        if wire_format == "msgpack" and upload_format != "json":
+            raise ValueError('wire_format="msgpack" requires upload_format="json"')
+        if compression == "zstd" and zstandard is None:
+            print(
+                "ALM SDK: zstandard is not installed; falling back to gzip compression",
+                file=sys.stderr,
+            )
+            compression = "gzip"
 
         self.mode = mode
         self.endpoint = endpoint
         self.api_key = api_key
         self.batch_size = batch_size
-        self._queue: List[Event] = []
+        self.flush_timeout = flush_timeout
+        self.compression = compression
+        self.compression_threshold = compression_threshold
+        self.spool_retry_interval = spool_retry_interval
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.block_timeout = block_timeout
+        self.linger_ms = linger_ms
+        self.max_batch_bytes = max_batch_bytes
+        self.oversize_events = oversize_events
+        self.upload_format = upload_format
+        self.serializer = get_serializer(serializer)
+        self.validate_events = validate_events
+        self.batch_format = batch_format
+        self.stdout_line_buffered = stdout_line_buffered
+        self.wire_format = wire_format
+        # Encoding for HTTP bodies; local sinks always write JSON
+        self._wire: Serializer = MsgpackSerializer() if wire_format == "msgpack" else self.serializer
+        self._queue = EventBuffer(
+            max_events=max_queue_events,
+            max_bytes=max_queue_bytes,
+            overflow=overflow,
+        )
+        # Counters that let flush() wait for exactly the events queued before it;
+        # evicted events count as processed so a barrier never waits on them
+        self._enqueued = 0
+        self._processed = 0
+        self._spool: Optional[DiskSpool] = None
+        if spool_dir and mode == "http":
+            self._spool = DiskSpool(
+                spool_dir,
+                max_bytes=spool_max_bytes,
+                max_age=spool_max_age,
+            )
+        self._sink: Optional[Union[FileSink, ParquetSink]] = None
+        if output_dir and mode == "file":
+            self._sink = FileSink(
+                output_dir,
+                dumps=self.serializer.dumps,
+                max_bytes=file_max_bytes,
+                rotate_interval=file_rotate_interval,
+                compression=file_compression,
+                fsync=fsync,
+                fsync_interval=fsync_interval,
+            )
+        elif output_dir and mode == "parquet":
+            self._sink = ParquetSink(
+                output_dir,
+                dumps=self.serializer.dumps,
+                rows_per_file=parquet_rows_per_file,
+                row_group_rows=parquet_row_group_rows,
+            )
+
+        _clients.add(self)
+
+    def _before_fork(self) -> None:
+        """Hook run in the parent before os.fork(): close the open output file.
+
+        Otherwise the child would inherit a half-written file; each process opens
+        its own files afterwards.
+        """
+        if self._sink is not None:
+            self._sink.roll()
+
+    def _after_fork_in_child(self) -> None:
+        """Hook run in a forked child: clear inherited buffers and counters.
+
+        The spool's files and checkpoint belong to the parent process, so the child
+        does not write to them; create the ALM after forking to spool in workers.
+        """
+        self._queue = EventBuffer(
+            max_events=self._queue.max_events,
+            max_bytes=self._queue.max_bytes,
+            overflow=self._queue.overflow,
+        )
+        self._enqueued = 0
+        self._processed = 0
+        self._spool = None
+        if isinstance(self._sink, FileSink):
+            self._sink.after_fork_in_child()
+
+    def _close_at_exit(self) -> None:
+        """Hook run at interpreter exit for clients writing local files.
+
+        Files keep their .inprogress suffix until the sink is closed, so without
+        this an ALM that is never closed leaves only incomplete files behind.
+        """
+        raise NotImplementedError
+
+    def emit(self, event: Union[Event, EventRecord]) -> None:
+        """Queue an event for the sink."""
+        raise NotImplementedError
+
+    def stats(self) -> Dict[str, Any]:
+        """Return queue depth and drop counters."""
+        return {
+            "queued_events": len(self._queue),
+            "queued_bytes": self._queue.bytes,
+            "dropped_events": self._queue.dropped_events,
+            "dropped_by_type": dict(self._queue.dropped_by_type),
+        }
+
+    def _prepare(self, event: Union[Event, EventRecord]) -> EventRecord:
+        """Convert an emitted event to a record, validating it in debug mode."""
+        record = as_record(event)
+        if self.validate_events:
+            record.to_event()
+        return record
+
+    def _enqueue(self, event: EventRecord, size: Optional[int] = None) -> bool:
+        """Queue an event under the overflow policy; returns False if it was dropped."""
+        accepted, evicted = self._queue.put(event, size)
+        if accepted:
+            self._enqueued += 1
+        self._processed += evicted
+        return accepted
+
+    def _batch_ready(self) -> bool:
+        """Return True once the queue should be sent: by count, bytes, age, or a full buffer."""
+        if len(self._queue) >= self.batch_size or not self._queue.has_room():
+            return True
+        if self.max_batch_bytes is not None and self._queue.bytes >= self.max_batch_bytes:
+            return True
+        return self._linger_remaining() == 0.0
+
+    def _should_wake_sender(self) -> bool:
+        """Return True if the sender must wake: a batch is ready, or a linger timer must start."""
+        return self._batch_ready() or (self.linger_ms is not None and len(self._queue) == 1)
+
+    def _linger_remaining(self) -> Optional[float]:
+        """Seconds until the oldest queued event reaches linger_ms, or None if not lingering."""
+        if self.linger_ms is None:
+            return None
+        age = self._queue.oldest_age()
+        if age is None:
+            return None
+        return max(0.0, self.linger_ms / 1000 - age)
+
+    def _take_batch(self) -> List[EventRecord]:
+        """Remove the next batch from the queue, bounded by count and bytes."""
+        return self._queue.take(self.batch_size, self.max_batch_bytes)
+
+    def _base_url(self) -> str:
+        """Return the endpoint without a trailing slash."""
+        return self.endpoint.rstrip("/")
+
+    def _headers(self) -> Dict[str, str]:
+        """Return headers sent with every HTTP request."""
+        headers = {}
+        if self.api_key:
+            headers["Authorization"] = f"Bearer {self.api_key}"
+        return headers
+
+    def _flush_stdout(self, events: List[EventRecord]) -> None:
+        """Flush events to stdout as JSON lines.
+
+        The batch is encoded into one buffer and written with a single write and
+        flush; with stdout_line_buffered each line is written and flushed on its own.
+        """
+        dumps = self.serializer.dumps
+        stdout = sys.stdout
+        # Text written by the agent must not end up after our bytes
+        stdout.flush()
+        # Replaced or wrapped streams (e.g. under pytest) may not expose a buffer
+        binary = getattr(stdout, "buffer", None)
+        if self.stdout_line_buffered:
+            for event in events:
+                line = event.encode(dumps) + b"\n"
+                if binary is not None:
+                    binary.write(line)
+                    binary.flush()
+                else:
+                    stdout.write(line.decode("utf-8"))
+                    stdout.flush()
+            return
+        data = b"".join([event.encode(dumps) + b"\n" for event in events])
+        if binary is not None:
+            binary.write(data)
+            binary.flush()
+        else:
+            stdout.write(data.decode("utf-8"))
+            stdout.flush()
+
+    def _upload_requests(
+        self,
+        events: List[EventRecord],
+    ) -> Sequence[Tuple[RequestBody, Dict[str, str]]]:
+        """Build the request bodies and headers for a batch in the configured upload format."""
+        if self.upload_format == "ndjson":
+            headers = {"Content-Type": NDJSON_CONTENT_TYPE}
+            if self.compression:
+                headers["Content-Encoding"] = self.compression
+            return [(lambda: self._ndjson_chunks(events), headers)]
+        return self._http_requests(events)
+
+    def _encode_for_upload(self, event: EventRecord) -> bytes:
+        """Encode one event, truncating it if it alone exceeds max_batch_bytes."""
+        return self._upload_item(event)[0]
+
+    def _upload_item(self, event: EventRecord) -> Tuple[bytes, Optional[Dict[str, Any]]]:
+        """Encode one event for upload; also return its dict if it had to be truncated."""
+        if self.wire_format == "json":
+            encoded = event.encode(self._wire.dumps)
+        else:
+            encoded = self._wire.dumps(event.to_dict())
+        if self.max_batch_bytes is not None and self.oversize_events == "truncate":
+            limit = self.max_batch_bytes - BATCH_OVERHEAD
+            if len(encoded) > limit:
+                return truncate_event(event.to_dict(), limit, self._wire.dumps)
+        return encoded, None
+
+    def _http_requests(self, events: List[EventRecord]) -> List[Tuple[bytes, Dict[str, str]]]:
+        """Encode events into one or more POST /v1/events bodies within max_batch_bytes."""
+        if self.batch_format == "v2":
+            return self._v2_requests(events)
+        encoded_events = [self._encode_for_upload(event) for event in events]
+        join = msgpack_batch_body if self.wire_format == "msgpack" else batch_body
+        return [
+            self._finish_request(join(batch))
+            for batch in split_batches(encoded_events, self.max_batch_bytes)
+        ]
+
+    def _v2_requests(self, events: List[EventRecord]) -> List[Tuple[bytes, Dict[str, str]]]:
+        """Encode events as v2 batches with shared fields hoisted into a header.
+
+        Batches are split using the v1 encoded sizes, an upper bound on the v2
+        size of any batch with more than one event.
+        """
+        items = [self._upload_item(event) for event in events]
+        requests = []
+        start = 0
+        for batch in split_batches([encoded for encoded, _ in items], self.max_batch_bytes):
+            end = start + len(batch)
+            event_dicts = [
+                data if data is not None else event.to_dict()
+                for event, (_, data) in zip(events[start:end], items[start:end])
+            ]
+            requests.append(self._finish_request(self._wire.dumps(hoist_batch(event_dicts))))
+            start = end
+        return requests
+
+    def _ndjson_chunks(self, events: List[EventRecord]) -> Iterator[bytes]:
+        """Yield the batch as newline-delimited JSON, encoding one event at a time.
+
+        With compression the stream is compressed incrementally; the size threshold
+        does not apply because the body size is not known up front.
+        """
+        compressor: Any = None
+        if self.compression == "zstd":
+            compressor = zstandard.ZstdCompressor().compressobj()
+        elif self.compression == "gzip":
+            compressor = zlib.compressobj(6, zlib.DEFLATED, 31)  # wbits=31: gzip container
+        for event in events:
+            line = self._encode_for_upload(event) + b"\n"
+            if compressor is None:
+                yield line
+                continue
+            chunk = compressor.compress(line)
+            if chunk:
+                yield chunk
+        if compressor is not None:
+            yield compressor.flush()
+
+    @staticmethod
+    def _materialize(body: RequestBody) -> bytes:
+        """Return a request body as bytes (used when a streamed batch must be spooled)."""
+        return b"".join(body()) if callable(body) else body
+
+    @staticmethod
+    def _upload_path(headers: Dict[str, str]) -> str:
+        """Endpoint path for a request, derived from its Content-Type."""
+        return NDJSON_PATH if headers.get("Content-Type") == NDJSON_CONTENT_TYPE else EVENTS_PATH
+
+    def _finish_request(self, body: bytes) -> Tuple[bytes, Dict[str, str]]:
+        """Compress a request body if worthwhile and return it with its headers."""
+        headers = {"Content-Type": self._wire.content_type}
+        if self.compression and len(body) >= self.compression_threshold:
+            body = self._compress(body)
+            headers["Content-Encoding"] = self.compression
+        return body, headers
+
+    def _compress(self, body: bytes) -> bytes:
+        """Compress a request body with the configured encoding."""
+        if self.compression == "zstd":
+            return zstandard.ZstdCompressor().compress(body)
+        # Level 6 gets nearly all of the ratio on repetitive JSON at a fraction of level 9's cost
+        return gzip.compress(body, compresslevel=6)
+
+
+class EventClient(BaseEventClient):
+    """Client for emitting events to stdout or HTTP endpoint."""
+
+    def __init__(
+        self,
+        mode: str = "stdout",
+        endpoint: Optional[str] = None,
+        api_key: Optional[str] = None,
+        batch_size: int = 50,
+        *,
+        background: bool = False,
+        **kwargs: Any,
+    ):
+        """Initialize event client.
+
+        Args:
+            mode: Event sink mode ("stdout", "http", "file" or "parquet")
+            endpoint: HTTP endpoint URL (required for http mode)
+            api_key: API key for HTTP authentication
+            batch_size: Number of events per batch
+            background: Send batches from a dedicated worker thread so emit() never
+                blocks on the sink (always on when linger_ms is set)
+            **kwargs: Sink, batching and delivery options; see BaseEventClient
+        """
+        super().__init__(
+            mode=mode, endpoint=endpoint, api_key=api_key, batch_size=batch_size, **kwargs
+        )
+        # Linger is driven by a timer, which needs a sender other than the caller
+        self.background = background or self.linger_ms is not None
         self._http_client: Optional[httpx.Client] = None
 
-        if mode == "http":
-            headers = {}
-            if api_key:
-                headers["Authorization"] = f"Bearer {api_key}"
+        # Background worker state
+        self._cond = threading.Condition()
+        self._worker: Optional[threading.Thread] = None
+        self._flush_requested = False
+        self._closed = False
+        self._drainer: Optional[threading.Thread] = None
+        self._drain_wakeup = threading.Event()
+        # Worker and drainer threads still running; the last one out after close()
+        # closes the spool, sink and HTTP client
+        self._senders = 0
+        self._resources_closed = False
+
+        if self.mode == "http":
             self._http_client = httpx.Client(
-                base_url=endpoint.rstrip("/"),
-                headers=headers,
-                timeout=10.0,
+                base_url=self._base_url(),
+                headers=self._headers(),
+                timeout=REQUEST_TIMEOUT,
             )
+            if self._spool is not None:
+                # Batches left over from a previous process are drained right away
+                self._start_drainer()
 
-    def emit(self, event: Event) -> None:
-        """Add an event to the queue and flush if batch size reached."""
-        self._queue.append(event)
-        if len(self._queue) >= self.batch_size:
+    def emit(self, event: Union[Event, EventRecord]) -> None:
+        """Add an event to the queue and flush if batch size reached.
+
+        Events emitted after close() are dropped (and counted in stats()).
+        """
+        event = self._prepare(event)
+        if self._closed:
+            self._queue.record_drop(event)
+            return
+        if self.background:
+            with self._cond:
+                self._ensure_worker()
+                size = estimate_event_size(event)
+                if self._queue.overflow == "block" and not self._queue.has_room(size):
+                    # Let the worker catch up, but never stall the agent for long
+                    self._flush_requested = True
+                    self._cond.notify_all()
+                    self._cond.wait_for(
+                        lambda: self._closed or self._queue.has_room(size),
+                        self.block_timeout,
+                    )
+                self._enqueue(event, size)
+                if self._should_wake_sender():
+                    self._cond.notify_all()
+            return
+
+        if not self._queue.has_room(estimate_event_size(event)):
+            # Inline mode: the caller does the work, so make room by flushing
+            self.flush()
+        self._enqueue(event)
+        if len(self._queue) >= self.batch_size or (
+            self.max_batch_bytes is not None and self._queue.bytes >= self.max_batch_bytes
+        ):
             self.flush()
 
-    def flush(self) -> None:
-        """Flush queued events to stdout or HTTP endpoint."""
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Flush queued events to stdout or HTTP endpoint.
+
+        In background mode this is a barrier: it wakes the worker and waits until
+        every event queued before the call has been handed to the sink.
+
+        Args:
+            timeout: Seconds to wait for the worker (defaults to flush_timeout)
+
+        Returns:
+            False if the worker did not catch up before the deadline, True otherwise
+        """
+        if self.background:
+            return self._wait_for_worker(self.flush_timeout if timeout is None else timeout)
+
         if not self._queue:
-            return
+            return True
+
+        events_to_flush = self._queue.drain()
+        self._processed += len(events_to_flush)
+        self._send(events_to_flush)
+        return True
 
+    def _send(self, events: List[EventRecord]) -> None:
+        """Hand a batch of events to the configured sink."""
         try:
             if self.mode == "stdout":
-                self._flush_stdout()
-            else:
-                self._flush_http()
+                self._flush_stdout(events)
+            elif self.mode == "http":
+                self._flush_http(events)
+            elif self._sink is not None:
+                self._sink.write(events)
         except Exception as e:
             # Must not crash agent if server is down
             # In stdout mode, this shouldn't happen, but catch anyway
             print(f"ALM SDK: Failed to flush events: {e}", file=sys.stderr)
-        finally:
-            self._queue.clear()
-
-    def _flush_stdout(self) -> None:
-        """Flush events to stdout as JSON lines."""
-        # Create a copy of the queue to avoid any mutation issues
-        events_to_flush = list(self._queue)
-        for event in events_to_flush:
-            # model_dump() creates a new dict, ensuring immutability
-            event_dict = event.model_dump(mode='json')
-            print(json.dumps(event_dict, ensure_ascii=False), flush=True)
-
-    def _flush_http(self) -> None:
+
+    def _flush_http(self, events: List[EventRecord]) -> None:
         """Flush events to HTTP endpoint."""
         if not self._http_client:
             return
 
-        # model_dump() creates new dicts, ensuring immutability
-        events_data = [event.model_dump(mode='json') for event in self._queue]
+        failure: Optional[Exception] = None
+        for body, headers in self._upload_requests(events):
+            try:
+                self.retry_policy.call(
+                    lambda budget: self._post(body, headers, timeout=budget)
+                )
+            except Exception as e:
+                if self._spool is None or not self.retry_policy.is_retryable(e):
+                    # Keep going so one rejected request doesn't sink the rest of the batch
+                    failure = failure or e
+                    continue
+                self._spool.append(self._materialize(body), headers)
+                self._drain_wakeup.set()
+                print(f"ALM SDK: Spooled undeliverable events to disk: {e}", file=sys.stderr)
+        if failure is not None:
+            raise failure
+
+    def _post(
+        self,
+        body: RequestBody,
+        headers: Dict[str, str],
+        timeout: Optional[float] = None,
+    ) -> None:
+        """POST an encoded batch, raising on transport errors and non-2xx responses.
+
+        Args:
+            body: Encoded request body, or a callable producing its chunks
+            headers: Request headers
+            timeout: Seconds left of the retry budget; caps REQUEST_TIMEOUT
+        """
+        if self._http_client is None:
+            raise RuntimeError("HTTP client is closed")
         response = self._http_client.post(
-            "/v1/events",
-            json={"events": events_data},
+            self._upload_path(headers),
+            content=body() if callable(body) else body,
+            headers=headers,
+            timeout=(
+                min(REQUEST_TIMEOUT, timeout) if timeout is not None else httpx.USE_CLIENT_DEFAULT
+            ),
         )
         response.raise_for_status()
 
-    def close(self) -> None:
-        """Close the HTTP client if in http mode."""
+    def _start_drainer(self) -> None:
+        """Start the thread that resends spooled batches once the endpoint recovers."""
+        with self._cond:
+            self._senders += 1
+        self._drainer = threading.Thread(
+            target=self._run_drainer,
+            name="r3fresh-spool-drainer",
+            daemon=True,
+        )
+        self._drainer.start()
+
+    def _run_drainer(self) -> None:
+        """Resend spooled batches oldest first, backing off while the endpoint is down."""
+        try:
+            self._drain()
+        finally:
+            self._sender_exited()
+
+    def _drain(self) -> None:
+        spool = self._spool
+        while spool is not None and not self._closed:
+            record = spool.peek()
+            if record is None:
+                self._drain_wakeup.wait(self.spool_retry_interval)
+                self._drain_wakeup.clear()
+                continue
+            position, body, headers = record
+            try:
+                self._post(body, headers)
+            except Exception as e:
+                if self._closed:
+                    return
+                if self.retry_policy.is_retryable(e):
+                    # Still down; keep the batch and try again later
+                    retry_after = parse_retry_after(e) or 0.0
+                    self._drain_wakeup.wait(max(self.spool_retry_interval, retry_after))
+                    self._drain_wakeup.clear()
+                    continue
+                print(f"ALM SDK: Dropping spooled batch rejected by endpoint: {e}", file=sys.stderr)
+            spool.commit(position)
+
+    def _before_fork(self) -> None:
+        """Flush in the parent so the child does not inherit (and resend) pending events."""
+        self.flush()
+        super()._before_fork()
+
+    def _close_at_exit(self) -> None:
+        """Flush and close unless the client was already closed."""
+        if not self._closed:
+            self.flush()
+            self.close()
+
+    def _after_fork_in_child(self) -> None:
+        """Give the child its own queue, locks and connection pool; threads don't survive fork."""
+        super()._after_fork_in_child()
+        self._cond = threading.Condition()
+        self._worker = None
+        self._flush_requested = False
+        self._drainer = None
+        self._drain_wakeup = threading.Event()
+        self._senders = 0
+        if self._http_client is not None:
+            # Never close the inherited client: that would tear down the parent's sockets
+            self._http_client = httpx.Client(
+                base_url=self._base_url(),
+                headers=self._headers(),
+                timeout=REQUEST_TIMEOUT,
+            )
+
+    def _ensure_worker(self) -> None:
+        """Start the background worker if it is not running. Caller holds _cond."""
+        if self._worker is None and not self._closed:
+            self._senders += 1
+            self._worker = threading.Thread(
+                target=self._run_worker,
+                name="r3fresh-event-sender",
+                daemon=True,
+            )
+            self._worker.start()
+
+    def _run_worker(self) -> None:
+        """Drain the queue in batches until the client is closed."""
+        try:
+            self._work()
+        finally:
+            self._sender_exited()
+
+    def _work(self) -> None:
+        while True:
+            with self._cond:
+                while not (
+                    self._closed
+                    or self._flush_requested
+                    or self._batch_ready()
+                ):
+                    self._cond.wait(self._linger_remaining())
+                if not self._queue:
+                    self._flush_requested = False
+                    if self._closed:
+                        return
+                    continue
+                batch = self._take_batch()
+                # Wake emitters blocked on a full queue
+                self._cond.notify_all()
+
+            self._send(batch)
+
+            with self._cond:
+                self._processed += len(batch)
+                self._cond.notify_all()
+
+    def _wait_for_worker(self, timeout: float) -> bool:
+        """Block until the worker has sent everything queued so far, or timeout."""
+        deadline = time.monotonic() + timeout
+        with self._cond:
+            target = self._enqueued
+            if self._processed >= target:
+                return True
+            if self._worker is None or not self._worker.is_alive():
+                return False
+            self._flush_requested = True
+            self._cond.notify_all()
+            while self._processed < target:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                self._cond.wait(remaining)
+            return True
+
+    def close(self, timeout: Optional[float] = None) -> None:
+        """Stop the background worker (draining what it can) and close the HTTP client.
+
+        Args:
+            timeout: Seconds to wait for the worker (defaults to flush_timeout)
+        """
+        worker = None
+        with self._cond:
+            if not self._closed:
+                self._closed = True
+                worker = self._worker
+                self._cond.notify_all()
+        if worker is not None:
+            worker.join(self.flush_timeout if timeout is None else timeout)
+            if worker.is_alive():
+                print(
+                    "ALM SDK: Timed out waiting for background sender; "
+                    f"{len(self._queue)} events not sent",
+                    file=sys.stderr,
+                )
+        if self._drainer is not None:
+            self._drain_wakeup.set()
+            self._drainer.join(self.flush_timeout if timeout is None else timeout)
+        with self._cond:
+            # A thread that outlived the joins closes the resources when it exits
+            idle = self._senders == 0
+        if idle:
+            self._close_resources()
+
+    def _sender_exited(self) -> None:
+        """Called by the worker and drainer on exit; the last one out after close() cleans up."""
+        with self._cond:
+            self._senders -= 1
+            idle = self._closed and self._senders == 0
+        if idle:
+            self._close_resources()
+
+    def _close_resources(self) -> None:
+        """Close the spool, sink and HTTP client once no thread uses them."""
+        with self._cond:
+            if self._resources_closed:
+                return
+            self._resources_closed = True
+        if self._spool is not None:
+            self._spool.close()
+        if self._sink is not None:
+            self._sink.close()
         if self._http_client:
             self._http_client.close()
             self._http_client = None
@@ -2,7 +2,7 @@
 #
 # SPDX-License-Identifier: MIT
 """Event objects for ALM SDK."""
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, Optional, Tuple, Union
 
 from pydantic import BaseModel, ConfigDict, Field
 
@@ -43,57 +43,259 @@ class Event(BaseModel):
     )
 
 
+# Envelope fields in wire order, after the per-event fields
+ENVELOPE_FIELDS = ("agent_id", "env", "schema_version", "sdk_version", "agent_version", "policy_version")
+
+
+class EventEnvelope:
+    """Fields shared by every event an ALM instance emits.
+
+    ALM builds one envelope and rebuilds it when agent_id, env or a version
+    changes; records keep a reference to the envelope they were created with.
+    The encoded form is cached so serializers only encode the per-event fields.
+    """
+
+    __slots__ = ENVELOPE_FIELDS + ("_encoded",)
+
+    def __init__(
+        self,
+        agent_id: str,
+        env: str,
+        agent_version: Optional[str] = None,
+        policy_version: Optional[str] = None,
+        schema_version: str = SCHEMA_VERSION,
+        sdk_version: str = SDK_VERSION,
+    ):
+        self.agent_id = agent_id
+        self.env = env
+        self.schema_version = schema_version
+        self.sdk_version = sdk_version
+        self.agent_version = agent_version
+        self.policy_version = policy_version
+        # (dumps, encoded members without the opening brace)
+        self._encoded: Optional[Tuple[Callable[[Any], bytes], bytes]] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the envelope fields as a dict."""
+        return {field: getattr(self, field) for field in ENVELOPE_FIELDS}
+
+    def encoded_tail(self, dumps: Callable[[Any], bytes]) -> bytes:
+        """Return the envelope encoded as trailing JSON object members plus "}"."""
+        cached = self._encoded
+        if cached is None or cached[0] != dumps:
+            cached = self._encoded = (dumps, dumps(self.to_dict())[1:])
+        return cached[1]
+
+
+class EventRecord:
+    """Lightweight, non-validating event used on the emit path.
+
+    The SDK builds every field itself, so the event helpers return this slotted
+    record instead of running pydantic validation for each event. Event remains
+    the public, validated view: to_event() converts a record, and clients created
+    with validate_events=True validate every record as it is emitted.
+
+    Records made by the helpers below are deferred: they hold a tuple of raw
+    field values and a builder, and the metadata dict is only built when a sink
+    first reads it (usually on the sender thread). Events that are dropped
+    before being sent never build it at all.
+    """
+
+    __slots__ = (
+        "event_id",
+        "timestamp",
+        "event_type",
+        "run_id",
+        "envelope",
+        "_metadata",
+        "_raw",
+        "_build",
+    )
+
+    def __init__(
+        self,
+        event_id: str,
+        timestamp: str,
+        event_type: str,
+        envelope: EventEnvelope,
+        run_id: Optional[str] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+    ):
+        self.event_id = event_id
+        self.timestamp = timestamp
+        self.event_type = event_type
+        self.envelope = envelope
+        self.run_id = run_id
+        self._metadata = metadata if metadata is not None else {}
+        self._raw: Optional[Tuple[Any, ...]] = None
+        self._build: Optional[Callable[..., Dict[str, Any]]] = None
+
+    @classmethod
+    def deferred(
+        cls,
+        event_id: str,
+        timestamp: str,
+        event_type: str,
+        envelope: EventEnvelope,
+        run_id: Optional[str],
+        build: Callable[..., Dict[str, Any]],
+        raw: Tuple[Any, ...],
+    ) -> "EventRecord":
+        """Create a record whose metadata is built from raw by build(*raw) on first use."""
+        record = cls(event_id, timestamp, event_type, envelope, run_id)
+        record._raw = raw
+        record._build = build
+        return record
+
+    @property
+    def metadata(self) -> Dict[str, Any]:
+        """Event metadata, built on first access for deferred records."""
+        raw, build = self._raw, self._build
+        if raw is not None and build is not None:
+            self._metadata = build(*raw)
+            self._raw = None
+            self._build = None
+        return self._metadata
+
+    @metadata.setter
+    def metadata(self, value: Dict[str, Any]) -> None:
+        self._metadata = value
+        self._raw = None
+        self._build = None
+
+    @property
+    def raw_fields(self) -> Optional[Tuple[Any, ...]]:
+        """Raw metadata values of a record not yet materialized, else None."""
+        return self._raw
+
+    @property
+    def agent_id(self) -> str:
+        return self.envelope.agent_id
+
+    @property
+    def env(self) -> str:
+        return self.envelope.env
+
+    @property
+    def agent_version(self) -> Optional[str]:
+        return self.envelope.agent_version
+
+    @property
+    def policy_version(self) -> Optional[str]:
+        return self.envelope.policy_version
+
+    def __repr__(self) -> str:
+        return f"EventRecord(event_type={self.event_type!r}, event_id={self.event_id!r})"
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, EventRecord):
+            return NotImplemented
+        return self.to_dict() == other.to_dict()
+
+    @classmethod
+    def from_event(cls, event: Event) -> "EventRecord":
+        """Create a record from a validated Event."""
+        envelope = EventEnvelope(
+            agent_id=event.agent_id,
+            env=event.env,
+            agent_version=event.agent_version,
+            policy_version=event.policy_version,
+            schema_version=event.schema_version,
+            sdk_version=event.sdk_version,
+        )
+        return cls(
+            event_id=event.event_id,
+            timestamp=event.timestamp,
+            event_type=event.event_type,
+            envelope=envelope,
+            run_id=event.run_id,
+            metadata=event.metadata,
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the event as a dict in Event field order (metadata is not copied)."""
+        envelope = self.envelope
+        return {
+            "event_id": self.event_id,
+            "timestamp": self.timestamp,
+            "event_type": self.event_type,
+            "agent_id": envelope.agent_id,
+            "env": envelope.env,
+            "run_id": self.run_id,
+            "metadata": self.metadata,
+            "schema_version": envelope.schema_version,
+            "sdk_version": envelope.sdk_version,
+            "agent_version": envelope.agent_version,
+            "policy_version": envelope.policy_version,
+        }
+
+    def encode(self, dumps: Callable[[Any], bytes]) -> bytes:
+        """Encode the record, splicing in the envelope's cached encoding.
+
+        Only the per-event fields are serialized; envelope fields follow them,
+        so the member order differs from to_dict() but the object is the same.
+        """
+        head = dumps({
+            "event_id": self.event_id,
+            "timestamp": self.timestamp,
+            "event_type": self.event_type,
+            "run_id": self.run_id,
+            "metadata": self.metadata,
+        })
+        return head[:-1] + b"," + self.envelope.encoded_tail(dumps)
+
+    def to_event(self) -> Event:
+        """Validate the record and return it as a pydantic Event.
+
+        Raises:
+            pydantic.ValidationError: If a field has the wrong type
+        """
+        return Event.model_validate(self.to_dict())
+
+
+def as_record(event: Union[Event, EventRecord]) -> EventRecord:
+    """Return event as an EventRecord, converting validated Events."""
+    if isinstance(event, EventRecord):
+        return event
+    return EventRecord.from_event(event)
+
+
+def _run_start_metadata(purpose: Optional[str]) -> Dict[str, Any]:
+    metadata: Dict[str, Any] = {}
+    if purpose:
+        metadata["purpose"] = purpose
+    return metadata
+
+
 def run_start_event(
+    envelope: EventEnvelope,
     event_id: str,
     timestamp: str,
-    agent_id: str,
-    env: str,
     run_id: str,
     purpose: Optional[str] = None,
-    agent_version: Optional[str] = None,
-    policy_version: Optional[str] = None,
-) -> Event:
+) -> EventRecord:
     """Create a run.start event."""
-    metadata: Dict[str, Any] = {}
-    if purpose:
-        metadata["purpose"] = purpose
-    return Event(
-        event_id=event_id,
-        timestamp=timestamp,
-        event_type="run.start",
-        agent_id=agent_id,
-        env=env,
-        run_id=run_id,
-        metadata=metadata,
-        agent_version=agent_version,
-        policy_version=policy_version,
+    return EventRecord.deferred(
+        event_id, timestamp, "run.start", envelope, run_id, _run_start_metadata, (purpose,)
     )
 
 
-def run_end_event(
-    event_id: str,
-    timestamp: str,
-    agent_id: str,
-    env: str,
-    run_id: str,
+def _run_end_metadata(
     success: bool,
-    error: Optional[Dict[str, Any]] = None,
-    agent_version: Optional[str] = None,
-    policy_version: Optional[str] = None,
-    # Summary fields
-    tool_calls_total: int = 0,
-    tool_calls_allowed: int = 0,
-    tool_calls_denied: int = 0,
-    tool_calls_error: int = 0,
-    tool_calls_retried: int = 0,
-    avg_tool_latency_ms: float = 0.0,
-    avg_policy_latency_ms: float = 0.0,
-    total_run_duration_ms: float = 0.0,
-    tasks_completed: int = 0,
-    tasks_failed: int = 0,
-    handoffs: int = 0,
-) -> Event:
-    """Create a run.end event with summary statistics."""
+    error: Optional[Dict[str, Any]],
+    tool_calls_total: int,
+    tool_calls_allowed: int,
+    tool_calls_denied: int,
+    tool_calls_error: int,
+    tool_calls_retried: int,
+    avg_tool_latency_ms: float,
+    avg_policy_latency_ms: float,
+    total_run_duration_ms: float,
+    tasks_completed: int,
+    tasks_failed: int,
+    handoffs: int,
+    dropped_events: int,
+) -> Dict[str, Any]:
     metadata: Dict[str, Any] = {
         "success": success,
         "summary": {
@@ -114,60 +316,145 @@ def run_end_event(
                 "failed": tasks_failed,
             },
             "handoffs": handoffs,
+            "dropped_events": dropped_events,
         },
     }
     if error:
         metadata["error"] = error
-    return Event(
-        event_id=event_id,
-        timestamp=timestamp,
-        event_type="run.end",
-        agent_id=agent_id,
-        env=env,
-        run_id=run_id,
-        metadata=metadata,
-        agent_version=agent_version,
-        policy_version=policy_version,
+    return metadata
+
+
+def run_end_event(
+    envelope: EventEnvelope,
+    event_id: str,
+    timestamp: str,
+    run_id: str,
+    success: bool,
+    error: Optional[Dict[str, Any]] = None,
+    # Summary fields
+    tool_calls_total: int = 0,
+    tool_calls_allowed: int = 0,
+    tool_calls_denied: int = 0,
+    tool_calls_error: int = 0,
+    tool_calls_retried: int = 0,
+    avg_tool_latency_ms: float = 0.0,
+    avg_policy_latency_ms: float = 0.0,
+    total_run_duration_ms: float = 0.0,
+    tasks_completed: int = 0,
+    tasks_failed: int = 0,
+    handoffs: int = 0,
+    dropped_events: int = 0,
+) -> EventRecord:
+    """Create a run.end event with summary statistics."""
+    return EventRecord.deferred(
+        event_id,
+        timestamp,
+        "run.end",
+        envelope,
+        run_id,
+        _run_end_metadata,
+        (
+            success,
+            error,
+            tool_calls_total,
+            tool_calls_allowed,
+            tool_calls_denied,
+            tool_calls_error,
+            tool_calls_retried,
+            avg_tool_latency_ms,
+            avg_policy_latency_ms,
+            total_run_duration_ms,
+            tasks_completed,
+            tasks_failed,
+            handoffs,
+            dropped_events,
+        ),
     )
 
 
+def _tool_request_metadata(
+    tool_name: str,
+    tool_call_id: str,
+    args: Dict[str, Any],
+    attempt: int,
+    sample_weight: Optional[float],
+) -> Dict[str, Any]:
+    metadata: Dict[str, Any] = {
+        "tool_name": tool_name,
+        "tool_call_id": tool_call_id,
+        "args": args,
+        "attempt": attempt,
+    }
+    if sample_weight is not None:
+        metadata["sample_weight"] = sample_weight
+    return metadata
+
+
 def tool_request_event(
+    envelope: EventEnvelope,
     event_id: str,
     timestamp: str,
-    agent_id: str,
-    env: str,
     run_id: Optional[str],
     tool_name: str,
     tool_call_id: str,
     args: Dict[str, Any],
     attempt: int = 1,
-    agent_version: Optional[str] = None,
-    policy_version: Optional[str] = None,
-) -> Event:
-    """Create a tool.request event."""
-    return Event(
-        event_id=event_id,
-        timestamp=timestamp,
-        event_type="tool.request",
-        agent_id=agent_id,
-        env=env,
-        run_id=run_id,
-        metadata={
-            "tool_name": tool_name,
-            "tool_call_id": tool_call_id,
-            "args": args,
-            "attempt": attempt,
-        },
-        agent_version=agent_version,
-        policy_version=policy_version,
+    sample_weight: Optional[float] = None,
+) -> EventRecord:
+    """Create a tool.request event.
+
+    sample_weight is set on events emitted under sampling (see sampling.Sampler).
+    """
+    return EventRecord.deferred(
+        event_id,
+        timestamp,
+        "tool.request",
+        envelope,
+        run_id,
+        _tool_request_metadata,
+        (tool_name, tool_call_id, args, attempt, sample_weight),
     )
 
 
+def _tool_response_metadata(
+    tool_name: str,
+    tool_call_id: str,
+    status: str,
+    policy_latency_ms: float,
+    tool_latency_ms: float,
+    total_latency_ms: float,
+    attempt: int,
+    retries: int,
+    error: Optional[Dict[str, Any]],
+    result: Optional[Any],
+    stream: Optional[Dict[str, Any]],
+    sample_weight: Optional[float],
+) -> Dict[str, Any]:
+    metadata: Dict[str, Any] = {
+        "tool_name": tool_name,
+        "tool_call_id": tool_call_id,
+        "status": status,
+        "policy_latency_ms": policy_latency_ms,
+        "tool_latency_ms": tool_latency_ms,
+        "total_latency_ms": total_latency_ms,
+        "attempt": attempt,
+        "retries": retries,
+    }
+    if error:
+        metadata["error"] = error
+    if result is not None:
+        metadata["result"] = result
+    if stream is not None:
+        metadata["stream"] = stream
+    if sample_weight is not None:
+        metadata["sample_weight"] = sample_weight
+    return metadata
+
+
 def tool_response_event(
+    envelope: EventEnvelope,
     event_id: str,
     timestamp: str,
-    agent_id: str,
-    env: str,
     run_id: Optional[str],
     tool_name: str,
     tool_call_id: str,
@@ -179,13 +466,59 @@ def tool_response_event(
     retries: int = 0,
     error: Optional[Dict[str, Any]] = None,
     result: Optional[Any] = None,
-    agent_version: Optional[str] = None,
-    policy_version: Optional[str] = None,
-) -> Event:
-    """Create a tool.response event."""
+    stream: Optional[Dict[str, Any]] = None,
+    sample_weight: Optional[float] = None,
+) -> EventRecord:
+    """Create a tool.response event.
+
+    stream carries the statistics of a generator tool (see tool.StreamStats).
+    """
+    return EventRecord.deferred(
+        event_id,
+        timestamp,
+        "tool.response",
+        envelope,
+        run_id,
+        _tool_response_metadata,
+        (
+            tool_name,
+            tool_call_id,
+            status,
+            policy_latency_ms,
+            tool_latency_ms,
+            total_latency_ms,
+            attempt,
+            retries,
+            error,
+            result,
+            stream,
+            sample_weight,
+        ),
+    )
+
+
+def _tool_call_metadata(
+    tool_name: str,
+    tool_call_id: str,
+    args: Dict[str, Any],
+    decision: str,
+    reason: str,
+    status: str,
+    policy_latency_ms: float,
+    tool_latency_ms: float,
+    total_latency_ms: float,
+    attempt: int,
+    retries: int,
+    result: Optional[Any],
+    stream: Optional[Dict[str, Any]],
+    sample_weight: Optional[float],
+) -> Dict[str, Any]:
     metadata: Dict[str, Any] = {
         "tool_name": tool_name,
         "tool_call_id": tool_call_id,
+        "args": args,
+        "decision": decision,
+        "reason": reason,
         "status": status,
         "policy_latency_ms": policy_latency_ms,
         "tool_latency_ms": tool_latency_ms,
@@ -193,28 +526,92 @@ def tool_response_event(
         "attempt": attempt,
         "retries": retries,
     }
-    if error:
-        metadata["error"] = error
     if result is not None:
         metadata["result"] = result
-    return Event(
-        event_id=event_id,
-        timestamp=timestamp,
-        event_type="tool.response",
-        agent_id=agent_id,
-        env=env,
-        run_id=run_id,
-        metadata=metadata,
-        agent_version=agent_version,
-        policy_version=policy_version,
+    if stream is not None:
+        metadata["stream"] = stream
+    if sample_weight is not None:
+        metadata["sample_weight"] = sample_weight
+    return metadata
+
+
+def tool_call_event(
+    envelope: EventEnvelope,
+    event_id: str,
+    timestamp: str,
+    run_id: Optional[str],
+    tool_name: str,
+    tool_call_id: str,
+    args: Dict[str, Any],
+    decision: str,
+    reason: str,
+    status: str,
+    policy_latency_ms: float,
+    tool_latency_ms: float,
+    total_latency_ms: float,
+    attempt: int = 1,
+    retries: int = 0,
+    result: Optional[Any] = None,
+    stream: Optional[Dict[str, Any]] = None,
+    sample_weight: Optional[float] = None,
+) -> EventRecord:
+    """Create a tool.call event.
+
+    Emitted under event_verbosity="compact" in place of the tool.request,
+    policy.decision and tool.response events of a successful call.
+    """
+    return EventRecord.deferred(
+        event_id,
+        timestamp,
+        "tool.call",
+        envelope,
+        run_id,
+        _tool_call_metadata,
+        (
+            tool_name,
+            tool_call_id,
+            args,
+            decision,
+            reason,
+            status,
+            policy_latency_ms,
+            tool_latency_ms,
+            total_latency_ms,
+            attempt,
+            retries,
+            result,
+            stream,
+            sample_weight,
+        ),
     )
 
 
+def _policy_decision_metadata(
+    tool_name: str,
+    tool_call_id: str,
+    decision: str,
+    reason: str,
+    latency_ms: float,
+    attempt: int,
+    sample_weight: Optional[float],
+) -> Dict[str, Any]:
+    metadata: Dict[str, Any] = {
+        "tool_name": tool_name,
+        "tool_call_id": tool_call_id,
+        "decision": decision,
+        "reason": reason,
+        "latency_ms": latency_ms,
+        "attempt": attempt,
+    }
+    if sample_weight is not None:
+        metadata["sample_weight"] = sample_weight
+    return metadata
+
+
 def policy_decision_event(
+    envelope: EventEnvelope,
     event_id: str,
     timestamp: str,
-    agent_id: str,
-    env: str,
     run_id: Optional[str],
     tool_name: str,
     tool_call_id: str,
@@ -222,107 +619,95 @@ def policy_decision_event(
     reason: str,
     latency_ms: float,
     attempt: int = 1,
-    agent_version: Optional[str] = None,
-    policy_version: Optional[str] = None,
-) -> Event:
+    sample_weight: Optional[float] = None,
+) -> EventRecord:
     """Create a policy.decision event."""
-    return Event(
-        event_id=event_id,
-        timestamp=timestamp,
-        event_type="policy.decision",
-        agent_id=agent_id,
-        env=env,
-        run_id=run_id,
-        metadata={
-            "tool_name": tool_name,
-            "tool_call_id": tool_call_id,
-            "decision": decision,
-            "reason": reason,
-            "latency_ms": latency_ms,
-            "attempt": attempt,
-        },
-        agent_version=agent_version,
-        policy_version=policy_version,
+    return EventRecord.deferred(
+        event_id,
+        timestamp,
+        "policy.decision",
+        envelope,
+        run_id,
+        _policy_decision_metadata,
+        (tool_name, tool_call_id, decision, reason, latency_ms, attempt, sample_weight),
     )
 
 
-def task_start_event(
-    event_id: str,
-    timestamp: str,
-    agent_id: str,
-    env: str,
-    run_id: Optional[str],
+def _task_start_metadata(
     task_id: str,
-    task_type: Optional[str] = None,
-    description: Optional[str] = None,
-    agent_version: Optional[str] = None,
-    policy_version: Optional[str] = None,
-) -> Event:
-    """Create a task.start event."""
+    task_type: Optional[str],
+    description: Optional[str],
+) -> Dict[str, Any]:
     metadata: Dict[str, Any] = {"task_id": task_id}
     if task_type:
         metadata["task_type"] = task_type
     if description:
         metadata["description"] = description
-    return Event(
-        event_id=event_id,
-        timestamp=timestamp,
-        event_type="task.start",
-        agent_id=agent_id,
-        env=env,
-        run_id=run_id,
-        metadata=metadata,
-        agent_version=agent_version,
-        policy_version=policy_version,
-    )
+    return metadata
 
 
-def task_end_event(
+def task_start_event(
+    envelope: EventEnvelope,
     event_id: str,
     timestamp: str,
-    agent_id: str,
-    env: str,
     run_id: Optional[str],
+    task_id: str,
+    task_type: Optional[str] = None,
+    description: Optional[str] = None,
+) -> EventRecord:
+    """Create a task.start event."""
+    return EventRecord.deferred(
+        event_id,
+        timestamp,
+        "task.start",
+        envelope,
+        run_id,
+        _task_start_metadata,
+        (task_id, task_type, description),
+    )
+
+
+def _task_end_metadata(
     task_id: str,
     success: bool,
-    error: Optional[Dict[str, Any]] = None,
-    agent_version: Optional[str] = None,
-    policy_version: Optional[str] = None,
-) -> Event:
-    """Create a task.end event."""
+    error: Optional[Dict[str, Any]],
+) -> Dict[str, Any]:
     metadata: Dict[str, Any] = {
         "task_id": task_id,
         "success": success,
     }
     if error:
         metadata["error"] = error
-    return Event(
-        event_id=event_id,
-        timestamp=timestamp,
-        event_type="task.end",
-        agent_id=agent_id,
-        env=env,
-        run_id=run_id,
-        metadata=metadata,
-        agent_version=agent_version,
-        policy_version=policy_version,
-    )
+    return metadata
 
 
-def handoff_event(
+def task_end_event(
+    envelope: EventEnvelope,
     event_id: str,
     timestamp: str,
-    agent_id: str,
-    env: str,
     run_id: Optional[str],
+    task_id: str,
+    success: bool,
+    error: Optional[Dict[str, Any]] = None,
+) -> EventRecord:
+    """Create a task.end event."""
+    return EventRecord.deferred(
+        event_id,
+        timestamp,
+        "task.end",
+        envelope,
+        run_id,
+        _task_end_metadata,
+        (task_id, success, error),
+    )
+
+
+def _handoff_metadata(
     from_agent_id: str,
     to_agent_id: str,
-    reason: Optional[str] = None,
-    context: Optional[Dict[str, Any]] = None,
-    agent_version: Optional[str] = None,
-    policy_version: Optional[str] = None,
-) -> Event:
-    """Create a handoff event."""
+    reason: Optional[str],
+    context: Optional[Dict[str, Any]],
+) -> Dict[str, Any]:
     metadata: Dict[str, Any] = {
         "from_agent_id": from_agent_id,
         "to_agent_id": to_agent_id,
@@ -331,14 +716,26 @@ def handoff_event(
         metadata["reason"] = reason
     if context:
         metadata["context"] = context
-    return Event(
-        event_id=event_id,
-        timestamp=timestamp,
-        event_type="handoff",
-        agent_id=agent_id,
-        env=env,
-        run_id=run_id,
-        metadata=metadata,
-        agent_version=agent_version,
-        policy_version=policy_version,
+    return metadata
+
+
+def handoff_event(
+    envelope: EventEnvelope,
+    event_id: str,
+    timestamp: str,
+    run_id: Optional[str],
+    from_agent_id: str,
+    to_agent_id: str,
+    reason: Optional[str] = None,
+    context: Optional[Dict[str, Any]] = None,
+) -> EventRecord:
+    """Create a handoff event."""
+    return EventRecord.deferred(
+        event_id,
+        timestamp,
+        "handoff",
+        envelope,
+        run_id,
+        _handoff_metadata,
+        (from_agent_id, to_agent_id, reason, context),
     )
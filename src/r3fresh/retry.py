@@ -0,0 +1,131 @@
+# SPDX-FileCopyrightText: 2026-present r3fresh <support@r3fresh.dev>
+#
+# SPDX-License-Identifier: MIT
+"""Retry policy for event uploads."""
+import asyncio
+import random
+import time
+from email.utils import parsedate_to_datetime
+from typing import Awaitable, Callable, FrozenSet, Iterable, Optional
+
+import httpx
+
+# Statuses worth retrying: timeouts, rate limiting and transient server errors
+RETRYABLE_STATUSES = frozenset({408, 429, 500, 502, 503, 504})
+
+
+def is_retryable_error(
+    exc: Exception,
+    retry_statuses: FrozenSet[int] = RETRYABLE_STATUSES,
+) -> bool:
+    """Return True if a failed upload may succeed later (network error or retryable status)."""
+    if isinstance(exc, httpx.HTTPStatusError):
+        return exc.response.status_code in retry_statuses
+    return isinstance(exc, httpx.TransportError)
+
+
+def parse_retry_after(exc: Exception) -> Optional[float]:
+    """Return the Retry-After delay in seconds from a 429/503 response, if present."""
+    if not isinstance(exc, httpx.HTTPStatusError):
+        return None
+    if exc.response.status_code not in (429, 503):
+        return None
+    value = exc.response.headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
+
+
+class RetryPolicy:
+    """Exponential backoff with full jitter, bounded by a total time budget."""
+
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        base_delay: float = 0.1,
+        max_delay: float = 2.0,
+        max_elapsed: float = 5.0,
+        retry_statuses: Optional[Iterable[int]] = None,
+    ):
+        """Initialize retry policy.
+
+        Args:
+            max_attempts: Total attempts per upload, including the first (1 disables retries)
+            base_delay: Backoff ceiling in seconds for the first retry; doubles per retry
+            max_delay: Upper bound in seconds for a single backoff
+            max_elapsed: Total seconds an upload may spend, including waits, before giving up
+            retry_statuses: HTTP statuses to retry (defaults to 408, 429, 500, 502, 503, 504)
+        """
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1")
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.max_elapsed = max_elapsed
+        self.retry_statuses = (
+            frozenset(retry_statuses) if retry_statuses is not None else RETRYABLE_STATUSES
+        )
+
+    def is_retryable(self, exc: Exception) -> bool:
+        """Return True if exc is a transient failure under this policy."""
+        return is_retryable_error(exc, self.retry_statuses)
+
+    def backoff(self, attempt: int) -> float:
+        """Full-jitter delay before retry number `attempt` (1-based)."""
+        ceiling = min(self.max_delay, self.base_delay * (2 ** (attempt - 1)))
+        return random.uniform(0, ceiling)
+
+    def next_delay(self, attempt: int, exc: Exception, elapsed: float) -> Optional[float]:
+        """Return seconds to wait before the next attempt, or None to give up.
+
+        Retry-After is honored on 429/503; if the server asks us to wait longer than
+        the remaining budget we give up rather than hold up the caller.
+        """
+        if attempt >= self.max_attempts or not self.is_retryable(exc):
+            return None
+        delay = parse_retry_after(exc)
+        if delay is None:
+            delay = self.backoff(attempt)
+        if elapsed + delay >= self.max_elapsed:
+            return None
+        return delay
+
+    def call(self, func: Callable[[float], None]) -> None:
+        """Call func(budget), retrying transient failures; re-raises the last error.
+
+        budget is the number of seconds left of max_elapsed; func should use it as
+        its request timeout so a slow attempt cannot overrun the total budget.
+        """
+        start = time.monotonic()
+        attempt = 1
+        while True:
+            try:
+                return func(self.max_elapsed - (time.monotonic() - start))
+            except Exception as e:
+                delay = self.next_delay(attempt, e, time.monotonic() - start)
+                if delay is None:
+                    raise
+            time.sleep(delay)
+            attempt += 1
+
+    async def acall(self, func: Callable[[float], Awaitable[None]]) -> None:
+        """Async version of call() that waits with asyncio.sleep."""
+        start = time.monotonic()
+        attempt = 1
+        while True:
+            try:
+                return await func(self.max_elapsed - (time.monotonic() - start))
+            except Exception as e:
+                delay = self.next_delay(attempt, e, time.monotonic() - start)
+                if delay is None:
+                    raise
+            await asyncio.sleep(delay)
+            attempt += 1
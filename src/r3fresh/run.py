@@ -3,16 +3,19 @@
 # SPDX-License-Identifier: MIT
 """Run context manager for ALM SDK."""
 import time
-from typing import Dict, Optional
+from typing import TYPE_CHECKING, Dict, Optional
 
 from .events import run_end_event, run_start_event
-from .util import create_structured_error, new_id, utc_now_iso
+from .util import create_structured_error, elapsed_ms, new_id, utc_now_iso
+
+if TYPE_CHECKING:
+    from .alm import ALM
 
 
 class Run:
     """Context manager for agent runs."""
 
-    def __init__(self, alm_instance: "ALM", purpose: Optional[str] = None):  # noqa: F821
+    def __init__(self, alm_instance: "ALM", purpose: Optional[str] = None):
         """Initialize a run.
 
         Args:
@@ -20,10 +23,10 @@ class Run:
             purpose: Optional purpose description for the run
         """
         self.alm = alm_instance
-        self.run_id = None
+        self.run_id: Optional[str] = None
         self.purpose = purpose
         self._started = False
-        self._start_time: Optional[float] = None
+        self._start_ns: Optional[int] = None
 
         # Statistics tracking
         self._tool_calls_total = 0
@@ -36,35 +39,62 @@ class Run:
         self._tasks_completed = 0
         self._tasks_failed = 0
         self._handoffs = 0
+        self._dropped_at_start = 0
 
     def __enter__(self):
         """Enter the run context - emit run.start event."""
+        self._start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Exit the run context - emit run.end event with summary."""
+        if not self._started:
+            return
+
+        self._end(exc_type, exc_val)
+
+        # Flush events at end of run
+        self.alm.flush()
+
+        # Return False to not suppress exceptions
+        return False
+
+    async def __aenter__(self):
+        """Async enter - emit run.start event."""
+        self._start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async exit - emit run.end and wait for the flush without blocking the loop."""
+        if not self._started:
+            return
+
+        self._end(exc_type, exc_val)
+        await self.alm.aflush()
+        return False
+
+    def _start(self) -> None:
+        """Start the run and emit run.start."""
         self.run_id = self.alm._new_run_id()
         self._started = True
-        self._start_time = time.time()
+        self._start_ns = time.perf_counter_ns()
+        self._dropped_at_start = self.alm.client.stats()["dropped_events"]
 
         event = run_start_event(
+            self.alm._envelope,
             event_id=new_id(),
             timestamp=utc_now_iso(),
-            agent_id=self.alm.agent_id,
-            env=self.alm.env,
             run_id=self.run_id,
             purpose=self.purpose,
-            agent_version=self.alm.agent_version,
-            policy_version=self.alm.policy_version,
         )
         self.alm.client.emit(event)
 
         # Reset policy budget at start of new run
         self.alm.policy.reset_budget()
 
-        return self
-
-    def __exit__(self, exc_type, exc_val, exc_tb):
-        """Exit the run context - emit run.end event with summary."""
-        if not self._started:
-            return
-
+    def _end(self, exc_type, exc_val) -> None:
+        """Emit run.end with summary statistics."""
+        assert self.run_id is not None  # set by _start()
         success = exc_type is None
         error = None
         if exc_val is not None:
@@ -72,7 +102,7 @@ class Run:
 
         # Calculate summary statistics
         total_run_duration_ms = (
-            (time.time() - self._start_time) * 1000 if self._start_time else 0.0
+            elapsed_ms(self._start_ns) if self._start_ns is not None else 0.0
         )
         avg_tool_latency_ms = (
             sum(self._tool_latencies) / len(self._tool_latencies)
@@ -86,15 +116,12 @@ class Run:
         )
 
         event = run_end_event(
+            self.alm._envelope,
             event_id=new_id(),
             timestamp=utc_now_iso(),
-            agent_id=self.alm.agent_id,
-            env=self.alm.env,
             run_id=self.run_id,
             success=success,
             error=error,
-            agent_version=self.alm.agent_version,
-            policy_version=self.alm.policy_version,
             tool_calls_total=self._tool_calls_total,
             tool_calls_allowed=self._tool_calls_allowed,
             tool_calls_denied=self._tool_calls_denied,
@@ -106,15 +133,10 @@ class Run:
             tasks_completed=self._tasks_completed,
             tasks_failed=self._tasks_failed,
             handoffs=self._handoffs,
+            dropped_events=self.alm.client.stats()["dropped_events"] - self._dropped_at_start,
         )
         self.alm.client.emit(event)
 
-        # Flush events at end of run
-        self.alm.flush()
-
-        # Return False to not suppress exceptions
-        return False
-
     def record_tool_call(
         self,
         allowed: bool,
@@ -134,10 +156,11 @@ class Run:
             self._tool_calls_error += 1
         if retried:
             self._tool_calls_retried += 1
-        if tool_latency_ms > 0:
+        # Every call goes through the policy check, however fast; denied calls
+        # never run the tool, so they are left out of the tool latency average
+        if allowed:
             self._tool_latencies.append(tool_latency_ms)
-        if policy_latency_ms > 0:
-            self._policy_latencies.append(policy_latency_ms)
+        self._policy_latencies.append(policy_latency_ms)
 
     def record_task_completed(self) -> None:
         """Record a completed task."""
@@ -0,0 +1,68 @@
+# SPDX-FileCopyrightText: 2026-present r3fresh <support@r3fresh.dev>
+#
+# SPDX-License-Identifier: MIT
+"""Sampling of tool call events for ALM SDK."""
+import random
+from typing import Callable, Dict, Optional
+
+# Event types emitted for tool calls; only these can be sampled
+SAMPLED_EVENT_TYPES = ("tool.request", "policy.decision", "tool.response", "tool.call")
+
+
+class Sampler:
+    """Decide which tool call events are emitted.
+
+    A tool call's events are kept with probability tool rate x event type rate.
+    One random draw is made per call and compared against each event's rate, so
+    the events of a call are kept consistently (an event type with a higher rate
+    is kept whenever one with a lower rate is). Kept events carry
+    sample_weight = 1 / rate so backends can extrapolate counts.
+    """
+
+    def __init__(
+        self,
+        tool_rates: Optional[Dict[str, float]] = None,
+        event_rates: Optional[Dict[str, float]] = None,
+        draw: Callable[[], float] = random.random,
+    ):
+        """Initialize the sampler.
+
+        Args:
+            tool_rates: Sample rate per tool name (tools not listed use 1.0)
+            event_rates: Sample rate per event type, from SAMPLED_EVENT_TYPES
+            draw: Source of uniform random numbers in [0, 1)
+
+        Raises:
+            ValueError: If a rate is outside (0, 1] or an event type cannot be sampled
+        """
+        self.tool_rates = dict(tool_rates or {})
+        self.event_rates = dict(event_rates or {})
+        for event_type in self.event_rates:
+            if event_type not in SAMPLED_EVENT_TYPES:
+                raise ValueError(
+                    f"Invalid event_sample_rates key: {event_type}. "
+                    f"Must be one of {SAMPLED_EVENT_TYPES}"
+                )
+        for name, rate in {**self.tool_rates, **self.event_rates}.items():
+            if not 0 < rate <= 1:
+                raise ValueError(f"Sample rate for '{name}' must be in (0, 1], got {rate}")
+        self._draw = draw
+        self._events_sampled = any(rate < 1 for rate in self.event_rates.values())
+
+    def applies(self, tool_name: str) -> bool:
+        """Whether any event of this tool's calls may be sampled out."""
+        return self._events_sampled or self.tool_rates.get(tool_name, 1.0) < 1
+
+    def draw(self) -> float:
+        """Random number for one tool call, shared by all of its events."""
+        return self._draw()
+
+    def weight(self, tool_name: str, event_type: str, draw: float) -> Optional[float]:
+        """Sample weight of an event, or None if it is sampled out.
+
+        Events that are not sampled at all (rate 1.0) get weight 1.0.
+        """
+        rate = self.tool_rates.get(tool_name, 1.0) * self.event_rates.get(event_type, 1.0)
+        if draw >= rate:
+            return None
+        return 1.0 / rate
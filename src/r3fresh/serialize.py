@@ -0,0 +1,167 @@
+# SPDX-FileCopyrightText: 2026-present r3fresh <support@r3fresh.dev>
+#
+# SPDX-License-Identifier: MIT
+"""Pluggable JSON serialization backends for ALM SDK.
+
+orjson or msgspec are used when installed; the stdlib json module is the fallback.
+All backends produce compact UTF-8 JSON and convert values JSON has no type for
+(datetimes, sets, bytes, models, dataclasses, ...) the way pydantic's JSON mode
+does, so the wire format does not depend on which one is installed.
+"""
+import json
+from typing import Any, Callable, Dict
+
+from pydantic_core import to_jsonable_python
+
+try:
+    import orjson
+except ImportError:  # optional fast path
+    orjson = None  # type: ignore[assignment]
+
+try:
+    import msgspec
+except ImportError:  # optional fast path
+    msgspec = None  # type: ignore[assignment]
+
+try:
+    import msgpack
+except ImportError:  # MessagePack wire format is optional
+    msgpack = None  # type: ignore[assignment]
+
+SERIALIZERS = ("auto", "orjson", "msgspec", "json")
+
+JSON_CONTENT_TYPE = "application/json"
+MSGPACK_CONTENT_TYPE = "application/msgpack"
+
+
+def to_jsonable(value: Any) -> Any:
+    """Convert a value JSON cannot encode as pydantic's JSON mode does.
+
+    Types pydantic does not know either are converted with str().
+    """
+    return to_jsonable_python(value, fallback=str)
+
+
+class Serializer:
+    """Encode values to JSON bytes and decode them back."""
+
+    name = "json"
+    content_type = JSON_CONTENT_TYPE
+
+    def dumps(self, value: Any) -> bytes:
+        """Encode a value as compact UTF-8 JSON."""
+        return json.dumps(
+            value,
+            ensure_ascii=False,
+            separators=(",", ":"),
+            default=to_jsonable,
+        ).encode("utf-8")
+
+    def loads(self, data: bytes) -> Any:
+        """Decode JSON bytes."""
+        return json.loads(data)
+
+
+class OrjsonSerializer(Serializer):
+    """orjson backend."""
+
+    name = "orjson"
+
+    # orjson encodes datetimes and dataclasses natively, in its own format;
+    # pass them to the default hook instead so they match the other backends
+    _options = (
+        orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS
+        if orjson is not None
+        else 0
+    )
+
+    def dumps(self, value: Any) -> bytes:
+        """Encode a value as compact UTF-8 JSON, falling back to json for what orjson rejects."""
+        try:
+            return orjson.dumps(value, default=to_jsonable, option=self._options)
+        except TypeError:
+            # e.g. integers beyond 64 bits, which never reach the default hook
+            return super().dumps(value)
+
+    def loads(self, data: bytes) -> Any:
+        """Decode JSON bytes."""
+        return orjson.loads(data)
+
+
+class MsgspecSerializer(Serializer):
+    """msgspec backend."""
+
+    name = "msgspec"
+
+    def __init__(self):
+        """Create the reusable msgspec encoder and decoder."""
+        self._encoder = msgspec.json.Encoder()
+        self._decoder = msgspec.json.Decoder()
+
+    def dumps(self, value: Any) -> bytes:
+        """Encode a value as compact UTF-8 JSON, falling back to json for what msgspec rejects."""
+        try:
+            # msgspec encodes bytes (base64), datetimes and dataclasses natively and
+            # has no passthrough options, so convert to plain JSON types first
+            return self._encoder.encode(to_jsonable(value))
+        except (TypeError, OverflowError):
+            return super().dumps(value)
+
+    def loads(self, data: bytes) -> Any:
+        """Decode JSON bytes."""
+        return self._decoder.decode(data)
+
+
+class MsgpackSerializer(Serializer):
+    """MessagePack encoding for HTTP uploads (not a JSON backend).
+
+    Floats are packed as binary doubles and strings as UTF-8, so payloads are
+    smaller and cheaper to produce than JSON text; values without a JSON type are
+    converted as with the JSON backends, so bytes are sent as strings, not bin.
+    """
+
+    name = "msgpack"
+    content_type = MSGPACK_CONTENT_TYPE
+
+    def __init__(self):
+        """Check that msgpack is installed and set the packer options."""
+        if msgpack is None:
+            raise ValueError("wire_format='msgpack' requires msgpack (pip install r3fresh[msgpack])")
+        self._packer_options = {"use_bin_type": True}
+
+    def dumps(self, value: Any) -> bytes:
+        """Encode a value as MessagePack."""
+        return msgpack.packb(to_jsonable(value), **self._packer_options)
+
+    def loads(self, data: bytes) -> Any:
+        """Decode MessagePack bytes."""
+        return msgpack.unpackb(data, raw=False)
+
+
+_FACTORIES: Dict[str, Callable[[], Serializer]] = {
+    "orjson": OrjsonSerializer,
+    "msgspec": MsgspecSerializer,
+    "json": Serializer,
+}
+
+
+def get_serializer(name: str = "auto") -> Serializer:
+    """Return the serializer for a backend name.
+
+    Args:
+        name: "auto" (fastest installed), "orjson", "msgspec" or "json"
+
+    Raises:
+        ValueError: If the name is unknown or the requested backend is not installed
+    """
+    if name not in SERIALIZERS:
+        raise ValueError(f"Invalid serializer: {name}. Must be one of {SERIALIZERS}")
+    if name == "auto":
+        if orjson is not None:
+            return OrjsonSerializer()
+        if msgspec is not None:
+            return MsgspecSerializer()
+        return Serializer()
+    if (name == "orjson" and orjson is None) or (name == "msgspec" and msgspec is None):
+        raise ValueError(f"Serializer '{name}' requested but the {name} package is not installed")
+    return _FACTORIES[name]()
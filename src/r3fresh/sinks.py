@@ -0,0 +1,372 @@
+# SPDX-FileCopyrightText: 2026-present r3fresh <support@r3fresh.dev>
+#
+# SPDX-License-Identifier: MIT
+"""Local file sinks for ALM SDK."""
+import gzip
+import os
+import shutil
+import sys
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from .events import EventRecord
+
+try:
+    import zstandard
+except ImportError:  # zstd compression is optional
+    zstandard = None  # type: ignore[assignment]
+
+try:
+    import pyarrow
+    import pyarrow.parquet
+except ImportError:  # parquet output is optional
+    pyarrow = None  # type: ignore[assignment]
+
+FSYNC_POLICIES = ("never", "batch", "interval")
+SEGMENT_COMPRESSION_TYPES = ("gzip", "zstd")
+
+# Suffix of a file still being written; renamed to its final name once closed so
+# readers scanning the directory only ever see complete files
+IN_PROGRESS_SUFFIX = ".inprogress"
+
+
+def _segment_name(prefix: str, seq: int, extension: str) -> str:
+    """File name unique across processes and restarts, sortable by creation time."""
+    stamp = time.strftime("%Y%m%dT%H%M%S", time.gmtime())
+    return f"{prefix}-{stamp}-{os.getpid()}-{seq:06d}{extension}"
+
+
+class ParquetSink:
+    """Write events to rolling Parquet files, one row per event.
+
+    Envelope fields and the metadata fields common to tool and policy events get
+    typed columns; the complete metadata is kept as a JSON string in "metadata".
+    Flushed batches are buffered in memory and written as one row group once
+    row_group_rows rows are pending, so small flushes don't fragment the file; a
+    file is closed once it holds rows_per_file rows. Rows still buffered are
+    written on roll() and close().
+    """
+
+    # Metadata fields promoted to their own columns: (name, arrow type factory)
+    METADATA_COLUMNS = (
+        ("tool_name", "string"),
+        ("tool_call_id", "string"),
+        ("status", "string"),
+        ("decision", "string"),
+        ("attempt", "int64"),
+        ("latency_ms", "float64"),
+        ("policy_latency_ms", "float64"),
+        ("tool_latency_ms", "float64"),
+        ("total_latency_ms", "float64"),
+    )
+    ENVELOPE_COLUMNS = (
+        "event_id",
+        "timestamp",
+        "event_type",
+        "agent_id",
+        "env",
+        "run_id",
+        "schema_version",
+        "sdk_version",
+        "agent_version",
+        "policy_version",
+    )
+
+    def __init__(
+        self,
+        directory: str,
+        dumps: Callable[[Any], bytes],
+        rows_per_file: int = 100_000,
+        prefix: str = "events",
+        row_group_rows: int = 10_000,
+    ):
+        """Initialize the sink.
+
+        Args:
+            directory: Directory the Parquet files are written to
+            dumps: Serializer used for the metadata JSON column
+            rows_per_file: Rows after which the current file is closed
+            prefix: File name prefix
+            row_group_rows: Buffered rows after which a row group is written
+        """
+        if pyarrow is None:
+            raise ValueError("mode='parquet' requires pyarrow (pip install r3fresh[parquet])")
+        if rows_per_file < 1:
+            raise ValueError("rows_per_file must be at least 1")
+        if row_group_rows < 1:
+            raise ValueError("row_group_rows must be at least 1")
+        self.directory = directory
+        self.rows_per_file = rows_per_file
+        self.prefix = prefix
+        self.row_group_rows = row_group_rows
+        self._dumps = dumps
+        self._lock = threading.Lock()
+        self._writer: Any = None
+        self._path: Optional[str] = None
+        # Rows of the current file, written or still pending
+        self._rows = 0
+        self._pending: List[Any] = []
+        self._pending_rows = 0
+        self._seq = 0
+        self.schema = pyarrow.schema(
+            [(name, pyarrow.string()) for name in self.ENVELOPE_COLUMNS]
+            + [(name, getattr(pyarrow, kind)()) for name, kind in self.METADATA_COLUMNS]
+            + [("metadata", pyarrow.string())]
+        )
+        os.makedirs(directory, exist_ok=True)
+
+    def write(self, events: List[EventRecord]) -> None:
+        """Buffer events as rows, writing row groups and rolling files as thresholds are reached."""
+        with self._lock:
+            while events:
+                take = self.rows_per_file - self._rows
+                batch = self._record_batch(events[:take])
+                self._pending.append(batch)
+                self._pending_rows += batch.num_rows
+                self._rows += batch.num_rows
+                events = events[take:]
+                if self._rows >= self.rows_per_file:
+                    self._close_file()
+                elif self._pending_rows >= self.row_group_rows:
+                    self._write_row_group()
+
+    def roll(self) -> None:
+        """Write buffered rows and close the current file; the next write starts a new one."""
+        with self._lock:
+            self._close_file()
+
+    def close(self) -> None:
+        """Write buffered rows and close the current file."""
+        self.roll()
+
+    def _record_batch(self, events: List[EventRecord]) -> Any:
+        columns: Dict[str, List[Any]] = {name: [] for name in self.schema.names}
+        for event in events:
+            data = event.to_dict()
+            for name in self.ENVELOPE_COLUMNS:
+                columns[name].append(data[name])
+            metadata = event.metadata
+            for name, kind in self.METADATA_COLUMNS:
+                value = metadata.get(name)
+                if kind == "string" and value is not None and not isinstance(value, str):
+                    value = str(value)
+                columns[name].append(value)
+            columns["metadata"].append(self._dumps(metadata).decode("utf-8"))
+        return pyarrow.RecordBatch.from_pydict(columns, schema=self.schema)
+
+    def _open(self) -> None:
+        name = _segment_name(self.prefix, self._seq, ".parquet")
+        self._seq += 1
+        self._path = os.path.join(self.directory, name)
+        self._writer = pyarrow.parquet.ParquetWriter(self._path + IN_PROGRESS_SUFFIX, self.schema)
+
+    def _write_row_group(self) -> None:
+        if not self._pending:
+            return
+        if self._writer is None:
+            self._open()
+        table = pyarrow.Table.from_batches(self._pending, schema=self.schema)
+        self._writer.write_table(table, row_group_size=table.num_rows)
+        self._pending = []
+        self._pending_rows = 0
+
+    def _close_file(self) -> None:
+        self._write_row_group()
+        if self._writer is None or self._path is None:
+            return
+        self._writer.close()
+        os.replace(self._path + IN_PROGRESS_SUFFIX, self._path)
+        self._writer = None
+        self._path = None
+        self._rows = 0
+
+
+class FileSink:
+    """Write events as JSON lines to rotating files.
+
+    Each flushed batch is encoded up front and handed to the OS with a single
+    write, so it survives the process exiting abruptly. The active file is closed
+    and a new one started once it reaches max_bytes or has been open for
+    rotate_interval seconds; closed files can be compressed, which happens on a
+    background thread so rotation never stalls the thread that writes events (or
+    os.fork()). fsync controls durability against OS crashes: "never" leaves
+    writeback to the OS, "batch" fsyncs after every batch, and "interval" does so
+    at most every fsync_interval seconds.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        dumps: Callable[[Any], bytes],
+        max_bytes: int = 64 * 1024 * 1024,
+        rotate_interval: Optional[float] = None,
+        compression: Optional[str] = None,
+        fsync: str = "never",
+        fsync_interval: float = 1.0,
+        buffer_size: int = 1024 * 1024,
+        prefix: str = "events",
+    ):
+        """Initialize the sink.
+
+        Args:
+            directory: Directory the JSONL files are written to
+            dumps: Serializer used to encode events
+            max_bytes: Size at which the active file is closed
+            rotate_interval: Seconds after which the active file is closed (None disables)
+            compression: Compress closed files with "gzip" or "zstd" (None disables)
+            fsync: "never", "batch" or "interval"
+            fsync_interval: Seconds between fsyncs under the "interval" policy
+            buffer_size: Size of the write buffer in bytes
+            prefix: File name prefix
+        """
+        if fsync not in FSYNC_POLICIES:
+            raise ValueError(f"Invalid fsync: {fsync}. Must be one of {FSYNC_POLICIES}")
+        if compression is not None and compression not in SEGMENT_COMPRESSION_TYPES:
+            raise ValueError(
+                f"Invalid file_compression: {compression}. "
+                f"Must be one of {SEGMENT_COMPRESSION_TYPES} or None"
+            )
+        if compression == "zstd" and zstandard is None:
+            raise ValueError("file_compression='zstd' requires zstandard (pip install r3fresh[zstd])")
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.rotate_interval = rotate_interval
+        self.compression = compression
+        self.fsync = fsync
+        self.fsync_interval = fsync_interval
+        self.buffer_size = buffer_size
+        self.prefix = prefix
+        self._dumps = dumps
+        self._lock = threading.Lock()
+        self._file: Any = None
+        self._path: Optional[str] = None
+        self._bytes = 0
+        self._opened_at = 0.0
+        self._synced_at = 0.0
+        self._seq = 0
+        # Closed files waiting for (or undergoing) compression, and the thread doing it
+        self._compress_cond = threading.Condition()
+        self._to_compress: List[str] = []
+        self._compressing = 0
+        self._compressor: Optional[threading.Thread] = None
+        os.makedirs(directory, exist_ok=True)
+
+    def write(self, events: List[EventRecord]) -> None:
+        """Append events as JSON lines, rotating and syncing per the configured policy."""
+        dumps = self._dumps
+        data = b"".join([event.encode(dumps) + b"\n" for event in events])
+        with self._lock:
+            now = time.monotonic()
+            if self._file is not None and (
+                self._bytes + len(data) > self.max_bytes
+                or (self.rotate_interval is not None and now - self._opened_at >= self.rotate_interval)
+            ):
+                self._close_file()
+            if self._file is None:
+                self._open(now)
+            self._file.write(data)
+            # One syscall per batch; without it the batch could sit in the buffer
+            # and be lost if the process exits without closing the sink
+            self._file.flush()
+            self._bytes += len(data)
+            if self.fsync == "batch" or (
+                self.fsync == "interval" and now - self._synced_at >= self.fsync_interval
+            ):
+                self._sync(now)
+
+    def roll(self) -> None:
+        """Close the current file (if any); the next write starts a new one."""
+        with self._lock:
+            self._close_file()
+
+    def close(self) -> None:
+        """Flush and close the current file and wait for pending compression."""
+        self.roll()
+        with self._compress_cond:
+            self._compress_cond.wait_for(lambda: not self._to_compress and not self._compressing)
+
+    def after_fork_in_child(self) -> None:
+        """Reset state inherited from the parent; its files are compressed by the parent."""
+        self._lock = threading.Lock()
+        self._file = None
+        self._path = None
+        self._bytes = 0
+        self._compress_cond = threading.Condition()
+        self._to_compress = []
+        self._compressing = 0
+        self._compressor = None
+
+    def _open(self, now: float) -> None:
+        name = _segment_name(self.prefix, self._seq, ".jsonl")
+        self._seq += 1
+        self._path = os.path.join(self.directory, name)
+        self._file = open(self._path + IN_PROGRESS_SUFFIX, "ab", buffering=self.buffer_size)
+        self._bytes = 0
+        self._opened_at = now
+        self._synced_at = now
+
+    def _sync(self, now: float) -> None:
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._synced_at = now
+
+    def _close_file(self) -> None:
+        if self._file is None or self._path is None:
+            return
+        if self.fsync != "never":
+            self._sync(time.monotonic())
+        self._file.close()
+        os.replace(self._path + IN_PROGRESS_SUFFIX, self._path)
+        if self.compression is not None:
+            self._submit_compression(self._path)
+        self._file = None
+        self._path = None
+        self._bytes = 0
+
+    def _submit_compression(self, path: str) -> None:
+        """Queue a closed file for the compressor thread, starting it if needed."""
+        with self._compress_cond:
+            self._to_compress.append(path)
+            if self._compressor is None or not self._compressor.is_alive():
+                self._compressor = threading.Thread(
+                    target=self._run_compressor,
+                    name="r3fresh-file-compressor",
+                    daemon=True,
+                )
+                self._compressor.start()
+
+    def _run_compressor(self) -> None:
+        """Compress queued files until none are left."""
+        while True:
+            with self._compress_cond:
+                if not self._to_compress:
+                    self._compressor = None
+                    self._compress_cond.notify_all()
+                    return
+                path = self._to_compress.pop(0)
+                self._compressing += 1
+            try:
+                self._compress(path)
+            except OSError as e:
+                # The uncompressed file is kept, so no events are lost
+                print(f"ALM SDK: Failed to compress {path}: {e}", file=sys.stderr)
+            finally:
+                with self._compress_cond:
+                    self._compressing -= 1
+                    self._compress_cond.notify_all()
+
+    def _compress(self, path: str) -> None:
+        """Compress a closed file next to the original, then remove the original."""
+        extension = ".gz" if self.compression == "gzip" else ".zst"
+        tmp_path = path + extension + IN_PROGRESS_SUFFIX
+        with open(path, "rb") as source:
+            if self.compression == "gzip":
+                with gzip.open(tmp_path, "wb", compresslevel=6) as target:
+                    shutil.copyfileobj(source, target)
+            else:
+                with open(tmp_path, "wb") as raw:
+                    with zstandard.ZstdCompressor().stream_writer(raw) as target:
+                        shutil.copyfileobj(source, target)
+        os.replace(tmp_path, path + extension)
+        os.remove(path)
@@ -0,0 +1,213 @@
+# SPDX-FileCopyrightText: 2026-present r3fresh <support@r3fresh.dev>
+#
+# SPDX-License-Identifier: MIT
+"""Durable on-disk spool for event batches that could not be delivered."""
+import json
+import os
+import struct
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+# Record layout: created_at (float64), headers length (uint32), body length (uint32)
+_RECORD_HEADER = struct.Struct(">dII")
+_SEGMENT_PREFIX = "segment-"
+_SEGMENT_SUFFIX = ".log"
+_CHECKPOINT = "checkpoint.json"
+
+# (segment sequence number, offset just past the record)
+SpoolPosition = Tuple[int, int]
+
+
+class DiskSpool:
+    """Append-only segment files plus a checkpoint of the oldest undelivered record.
+
+    Batches are stored already encoded (and compressed), together with the HTTP
+    headers needed to replay them. Readers peek at the oldest record and commit
+    its position once it has been delivered; fully consumed segments are deleted.
+    Retention limits bound disk usage: the oldest data is discarded first when
+    the spool exceeds max_bytes, and records older than max_age are skipped.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        max_bytes: int = 64 * 1024 * 1024,
+        max_age: float = 24 * 60 * 60,
+        segment_bytes: int = 4 * 1024 * 1024,
+    ):
+        """Open (or create) a spool directory.
+
+        Args:
+            directory: Directory holding segment files and the checkpoint
+            max_bytes: Maximum bytes kept on disk before the oldest data is dropped
+            max_age: Maximum age in seconds of a spooled batch before it is dropped
+            segment_bytes: Size at which the active segment is closed and a new one started
+        """
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        self.segment_bytes = segment_bytes
+        self.dropped_batches = 0
+        self._lock = threading.Lock()
+
+        os.makedirs(directory, exist_ok=True)
+        self._segments: List[int] = self._list_segments()
+        self._read_seq, self._read_offset = self._load_checkpoint()
+        for seq in [seq for seq in self._segments if seq < self._read_seq]:
+            # Left behind by a crash between checkpoint and delete
+            self._segments.remove(seq)
+            self._remove_segment(seq)
+        # Always append to a fresh segment so we never write after a torn record
+        self._write_seq = (self._segments[-1] + 1) if self._segments else 0
+        self._segments.append(self._write_seq)
+        self._writer = open(self._segment_path(self._write_seq), "ab")
+        if self._read_seq not in self._segments:
+            self._read_seq, self._read_offset = self._segments[0], 0
+
+    def append(self, body: bytes, headers: Dict[str, str]) -> None:
+        """Persist an encoded batch and the headers needed to resend it."""
+        meta = json.dumps(headers).encode("utf-8")
+        record = _RECORD_HEADER.pack(time.time(), len(meta), len(body)) + meta + body
+        with self._lock:
+            if self._writer.tell() and self._writer.tell() + len(record) > self.segment_bytes:
+                self._roll()
+            self._writer.write(record)
+            self._writer.flush()
+            self._enforce_max_bytes()
+
+    def peek(self) -> Optional[Tuple[SpoolPosition, bytes, Dict[str, str]]]:
+        """Return the oldest undelivered batch as (position, body, headers), or None."""
+        with self._lock:
+            while True:
+                record = self._read_at(self._read_seq, self._read_offset)
+                if record is None:
+                    if self._read_seq == self._write_seq:
+                        return None
+                    # Consumed (or torn) closed segment: move on to the next one
+                    self._advance_segment()
+                    continue
+                created_at, next_offset, body, headers = record
+                if time.time() - created_at > self.max_age:
+                    self.dropped_batches += 1
+                    self._commit((self._read_seq, next_offset))
+                    continue
+                return (self._read_seq, next_offset), body, headers
+
+    def commit(self, position: SpoolPosition) -> None:
+        """Mark everything up to position as delivered."""
+        with self._lock:
+            self._commit(position)
+
+    def pending_bytes(self) -> int:
+        """Approximate number of undelivered bytes on disk."""
+        with self._lock:
+            return self._pending_bytes()
+
+    def close(self) -> None:
+        """Close the active segment file."""
+        with self._lock:
+            self._writer.close()
+
+    def _segment_path(self, seq: int) -> str:
+        return os.path.join(self.directory, f"{_SEGMENT_PREFIX}{seq:020d}{_SEGMENT_SUFFIX}")
+
+    def _list_segments(self) -> List[int]:
+        segments = []
+        for name in os.listdir(self.directory):
+            if name.startswith(_SEGMENT_PREFIX) and name.endswith(_SEGMENT_SUFFIX):
+                try:
+                    segments.append(int(name[len(_SEGMENT_PREFIX):-len(_SEGMENT_SUFFIX)]))
+                except ValueError:
+                    continue
+        return sorted(segments)
+
+    def _load_checkpoint(self) -> SpoolPosition:
+        try:
+            with open(os.path.join(self.directory, _CHECKPOINT)) as f:
+                data = json.load(f)
+            return int(data["segment"]), int(data["offset"])
+        except (OSError, ValueError, KeyError, TypeError):
+            return (self._segments[0] if self._segments else 0), 0
+
+    def _save_checkpoint(self) -> None:
+        path = os.path.join(self.directory, _CHECKPOINT)
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "w") as f:
+            json.dump({"segment": self._read_seq, "offset": self._read_offset}, f)
+        os.replace(tmp_path, path)
+
+    def _read_at(self, seq: int, offset: int):
+        """Read one record, returning None at end of segment or on a torn record."""
+        try:
+            with open(self._segment_path(seq), "rb") as f:
+                f.seek(offset)
+                header = f.read(_RECORD_HEADER.size)
+                if len(header) < _RECORD_HEADER.size:
+                    return None
+                created_at, meta_len, body_len = _RECORD_HEADER.unpack(header)
+                meta = f.read(meta_len)
+                body = f.read(body_len)
+        except OSError:
+            return None
+        if len(meta) < meta_len or len(body) < body_len:
+            return None
+        next_offset = offset + _RECORD_HEADER.size + meta_len + body_len
+        return created_at, next_offset, body, json.loads(meta)
+
+    def _commit(self, position: SpoolPosition) -> None:
+        # A record peeked before max_bytes evicted its segment may be committed
+        # after the read position has moved past it; there is nothing to advance
+        if position[0] not in self._segments or position <= (self._read_seq, self._read_offset):
+            return
+        self._read_seq, self._read_offset = position
+        self._save_checkpoint()
+
+    def _advance_segment(self) -> None:
+        """Delete the current read segment and continue at the next one."""
+        old_seq = self._read_seq
+        if old_seq in self._segments:
+            self._segments.remove(old_seq)
+        self._remove_segment(old_seq)
+        self._read_seq, self._read_offset = self._segments[0], 0
+        self._save_checkpoint()
+
+    def _remove_segment(self, seq: int) -> None:
+        try:
+            os.remove(self._segment_path(seq))
+        except OSError:
+            pass
+
+    def _roll(self) -> None:
+        self._writer.close()
+        self._write_seq += 1
+        self._segments.append(self._write_seq)
+        self._writer = open(self._segment_path(self._write_seq), "ab")
+
+    def _segment_size(self, seq: int) -> int:
+        try:
+            return os.path.getsize(self._segment_path(seq))
+        except OSError:
+            return 0
+
+    def _pending_bytes(self) -> int:
+        return sum(self._segment_size(seq) for seq in self._segments) - self._read_offset
+
+    def _enforce_max_bytes(self) -> None:
+        """Drop the oldest closed segments until the spool fits in max_bytes."""
+        while self._pending_bytes() > self.max_bytes:
+            if self._read_seq == self._write_seq:
+                # Only the active segment is left; start a new one so the old data can go
+                self._roll()
+            seq = self._read_seq
+            self.dropped_batches += self._count_records(seq, self._read_offset)
+            self._advance_segment()
+
+    def _count_records(self, seq: int, offset: int) -> int:
+        count = 0
+        while True:
+            record = self._read_at(seq, offset)
+            if record is None:
+                return count
+            count += 1
+            offset = record[1]
@@ -2,26 +2,432 @@
 #
 # SPDX-License-Identifier: MIT
 """Tool decorator for ALM SDK."""
+import asyncio
+import inspect
 import time
-from functools import wraps
-from typing import Any, Callable, Dict, Optional
+from functools import partial, wraps
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+)
 
-from .events import policy_decision_event, tool_request_event, tool_response_event
+from .events import (
+    policy_decision_event,
+    tool_call_event,
+    tool_request_event,
+    tool_response_event,
+)
 from .util import (
     create_structured_error,
+    elapsed_ms,
+    make_args_normalizer,
     new_id,
-    normalize_args,
     redact_sensitive,
     utc_now_iso,
 )
 
+if TYPE_CHECKING:
+    from .alm import ALM
+
+# "full" emits tool.request, policy.decision and tool.response for every call;
+# "compact" emits one tool.call for successful calls
+EVENT_VERBOSITIES = ("full", "compact")
+
+
+class StreamStats:
+    """Progress of a generator tool's stream, reported in tool.response metadata.stream."""
+
+    def __init__(self):
+        self.start_ns = time.perf_counter_ns()
+        self.first_item_ns: Optional[int] = None
+        self.items = 0
+        self.bytes = 0
+
+    def record(self, item: Any) -> None:
+        """Count one yielded item (str and bytes items also count towards bytes)."""
+        if self.first_item_ns is None:
+            self.first_item_ns = time.perf_counter_ns()
+        self.items += 1
+        if isinstance(item, (bytes, bytearray)):
+            self.bytes += len(item)
+        elif isinstance(item, str):
+            self.bytes += len(item.encode("utf-8"))
+
+    def duration_ms(self) -> float:
+        """Milliseconds since the stream started."""
+        return elapsed_ms(self.start_ns)
+
+    def summary(self, completed: bool) -> Dict[str, Any]:
+        """Stream statistics; completed is False if the consumer closed it early."""
+        return {
+            "items": self.items,
+            "bytes": self.bytes,
+            "time_to_first_item_ms": (
+                elapsed_ms(self.start_ns, self.first_item_ns)
+                if self.first_item_ns is not None
+                else None
+            ),
+            "duration_ms": self.duration_ms(),
+            "completed": completed,
+        }
+
+
+class ToolCall:
+    """Events and statistics for one invocation of a tool, across its attempts.
+
+    The sync and async wrappers differ only in how they call the tool; both
+    drive a ToolCall through start_attempt() and then succeeded() or failed().
+
+    When sampling applies to the tool, or event_verbosity is "compact", events
+    are held back until the call's outcome is known. Errors and denials emit
+    every event. A successful call emits the events the sampler keeps, each
+    with its sample_weight, or in compact mode a single tool.call event.
+    """
+
+    def __init__(self, alm_instance: "ALM", name: str, args: Dict[str, Any]):
+        """Initialize the call.
+
+        Args:
+            alm_instance: The ALM instance
+            name: Tool name
+            args: Normalized and redacted call arguments
+        """
+        self.alm = alm_instance
+        self.name = name
+        self.args = args
+        # Generate tool_call_id for correlation across events
+        self.tool_call_id = new_id()
+
+        # Track attempts and retries
+        self.attempt = 1
+        self.max_retries = 0  # Could be made configurable in the future
+        self.retries = 0
+
+        # time.perf_counter_ns() readings
+        self.total_start_ns = 0
+        self.tool_start_ns = 0
+        self.policy_latency_ms = 0.0
+
+        self.decision = "allow"
+        self.reason = ""
+
+        self._sampled = alm_instance.sampler.applies(name)
+        self._compact = alm_instance.event_verbosity == "compact"
+        self._pending: List[Tuple[str, Callable[..., Any]]] = []
+
+    def start_attempt(self) -> None:
+        """Emit tool.request and the policy decision; raise PermissionError if denied."""
+        alm_instance = self.alm
+        # Capture start time at the very beginning for accurate latency
+        self.total_start_ns = time.perf_counter_ns()
+
+        # Emit tool.request
+        self._emit(
+            "tool.request",
+            partial(
+                tool_request_event,
+                alm_instance._envelope,
+                event_id=new_id(),
+                timestamp=utc_now_iso(),
+                run_id=alm_instance._current_run_id(),
+                tool_name=self.name,
+                tool_call_id=self.tool_call_id,
+                args=self.args,
+                attempt=self.attempt,
+            ),
+        )
+
+        # Check policy and measure policy latency
+        policy_start_ns = time.perf_counter_ns()
+        allowed, reason = alm_instance.policy.check_tool(self.name)
+        self.policy_latency_ms = elapsed_ms(policy_start_ns)
+        self.decision = "allow" if allowed else "deny"
+        self.reason = reason
+
+        # Emit policy.decision
+        self._emit(
+            "policy.decision",
+            partial(
+                policy_decision_event,
+                alm_instance._envelope,
+                event_id=new_id(),
+                timestamp=utc_now_iso(),
+                run_id=alm_instance._current_run_id(),
+                tool_name=self.name,
+                tool_call_id=self.tool_call_id,
+                decision=self.decision,
+                reason=reason,
+                latency_ms=self.policy_latency_ms,
+                attempt=self.attempt,
+            ),
+        )
+
+        if not allowed:
+            self._denied(reason)
+
+        # The tool runs next; time it from here
+        self.tool_start_ns = time.perf_counter_ns()
+
+    def succeeded(self, result: Any, stream: Optional[StreamStats] = None) -> Any:
+        """Record a successful attempt and emit tool.response; returns result.
+
+        For generator tools, stream holds the stream statistics and result is None.
+        """
+        alm_instance = self.alm
+        # Record successful tool call for budget
+        alm_instance.policy.record_tool_call()
+
+        tool_latency_ms = elapsed_ms(self.tool_start_ns)
+        total_latency_ms = elapsed_ms(self.total_start_ns)
+        self._emit_response(
+            status="success",
+            tool_latency_ms=tool_latency_ms,
+            total_latency_ms=total_latency_ms,
+            result=redact_sensitive(result) if result is not None else None,
+            stream=stream.summary(completed=True) if stream is not None else None,
+        )
+
+        # Record statistics
+        if alm_instance._current_run:
+            alm_instance._current_run.record_tool_call(
+                allowed=True,
+                denied=False,
+                error=False,
+                retried=self.retries > 0,
+                tool_latency_ms=tool_latency_ms,
+                policy_latency_ms=self.policy_latency_ms,
+            )
+        return result
+
+    def failed(
+        self,
+        exception: BaseException,
+        stream: Optional[StreamStats] = None,
+        cancelled: bool = False,
+    ) -> bool:
+        """Record a failed attempt.
+
+        Streams are never retried: items already yielded cannot be taken back.
+        Cancelled calls (asyncio.CancelledError) are never retried either; their
+        tool.response has status="cancelled" and they count as errors in run
+        statistics.
+
+        Returns:
+            True if the tool should be retried; otherwise tool.response has been
+            emitted and the caller should re-raise
+        """
+        alm_instance = self.alm
+        tool_latency_ms = elapsed_ms(self.tool_start_ns)
+        total_latency_ms = elapsed_ms(self.total_start_ns)
+
+        # Create structured error
+        error = create_structured_error(
+            exception, source="tool", retryable=False if cancelled else None
+        )
+
+        # Check if we should retry (retryable error and attempts left)
+        should_retry = (
+            stream is None
+            and error.get("retryable", False)
+            and self.attempt <= self.max_retries
+            and self.attempt < 3
+        )  # Cap at 3 attempts
+
+        if should_retry:
+            # Retry - increment attempt and retry count
+            self.attempt += 1
+            self.retries += 1
+            # Record failed attempt
+            if alm_instance._current_run:
+                alm_instance._current_run.record_tool_call(
+                    allowed=True,
+                    denied=False,
+                    error=True,
+                    retried=True,
+                    tool_latency_ms=tool_latency_ms,
+                    policy_latency_ms=self.policy_latency_ms,
+                )
+            return True
+
+        # No retry or max retries reached - emit error response
+        self._emit_response(
+            status="cancelled" if cancelled else "error",
+            tool_latency_ms=tool_latency_ms,
+            total_latency_ms=total_latency_ms,
+            error=error,
+            stream=stream.summary(completed=False) if stream is not None else None,
+        )
+
+        # Record statistics
+        if alm_instance._current_run:
+            alm_instance._current_run.record_tool_call(
+                allowed=True,
+                denied=False,
+                error=True,
+                retried=self.retries > 0,
+                tool_latency_ms=tool_latency_ms,
+                policy_latency_ms=self.policy_latency_ms,
+            )
+
+        # Still record tool call for budget purposes
+        alm_instance.policy.record_tool_call()
+        return False
+
+    def _denied(self, reason: str) -> None:
+        """Emit tool.response with status="denied" and raise PermissionError."""
+        total_latency_ms = elapsed_ms(self.total_start_ns)
+        denied_error = create_structured_error(
+            PermissionError(f"Tool '{self.name}' denied: {reason}"),
+            source="policy",
+        )
+        self._emit_response(
+            status="denied",
+            tool_latency_ms=0.0,  # Tool didn't execute
+            total_latency_ms=total_latency_ms,
+            error=denied_error,
+        )
+
+        # Record statistics
+        if self.alm._current_run:
+            self.alm._current_run.record_tool_call(
+                allowed=False,
+                denied=True,
+                error=False,
+                retried=self.retries > 0,
+                tool_latency_ms=0.0,
+                policy_latency_ms=self.policy_latency_ms,
+            )
+
+        raise PermissionError(f"Tool '{self.name}' denied: {reason}")
+
+    def _emit_response(
+        self,
+        status: str,
+        tool_latency_ms: float,
+        total_latency_ms: float,
+        error: Optional[Dict[str, Any]] = None,
+        result: Optional[Any] = None,
+        stream: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        if self._compact and status == "success":
+            # The held-back request and decision are summarized by tool.call
+            self._pending = []
+            self._emit(
+                "tool.call",
+                partial(
+                    tool_call_event,
+                    self.alm._envelope,
+                    event_id=new_id(),
+                    timestamp=utc_now_iso(),
+                    run_id=self.alm._current_run_id(),
+                    tool_name=self.name,
+                    tool_call_id=self.tool_call_id,
+                    args=self.args,
+                    decision=self.decision,
+                    reason=self.reason,
+                    status=status,
+                    policy_latency_ms=self.policy_latency_ms,
+                    tool_latency_ms=tool_latency_ms,
+                    total_latency_ms=total_latency_ms,
+                    attempt=self.attempt,
+                    retries=self.retries,
+                    result=result,
+                    stream=stream,
+                ),
+            )
+        else:
+            self._emit(
+                "tool.response",
+                partial(
+                    tool_response_event,
+                    self.alm._envelope,
+                    event_id=new_id(),
+                    timestamp=utc_now_iso(),
+                    run_id=self.alm._current_run_id(),
+                    tool_name=self.name,
+                    tool_call_id=self.tool_call_id,
+                    status=status,
+                    policy_latency_ms=self.policy_latency_ms,
+                    tool_latency_ms=tool_latency_ms,
+                    total_latency_ms=total_latency_ms,
+                    attempt=self.attempt,
+                    retries=self.retries,
+                    error=error,
+                    result=result,
+                    stream=stream,
+                ),
+            )
+        if self._sampled or self._compact:
+            self._release(keep_all=status != "success" or not self._sampled)
+
+    def _emit(self, event_type: str, make_event: Callable[..., Any]) -> None:
+        """Emit an event now, or hold it back until the outcome is known."""
+        if self._sampled or self._compact:
+            self._pending.append((event_type, make_event))
+        else:
+            self.alm.client.emit(make_event())
+
+    def _release(self, keep_all: bool) -> None:
+        """Emit held-back events: all of them, or those the sampler keeps.
+
+        Events emitted with keep_all carry no sample_weight.
+        """
+        pending, self._pending = self._pending, []
+        client = self.alm.client
+        if keep_all:
+            for _, make_event in pending:
+                client.emit(make_event())
+            return
+        sampler = self.alm.sampler
+        draw = sampler.draw()
+        for event_type, make_event in pending:
+            weight = sampler.weight(self.name, event_type, draw)
+            if weight is not None:
+                client.emit(make_event(sample_weight=weight))
+
+    def stream_closed(self, stream: StreamStats) -> None:
+        """Emit tool.response for a stream the consumer closed before it was exhausted."""
+        alm_instance = self.alm
+        alm_instance.policy.record_tool_call()
+        tool_latency_ms = elapsed_ms(self.tool_start_ns)
+        self._emit_response(
+            status="success",
+            tool_latency_ms=tool_latency_ms,
+            total_latency_ms=elapsed_ms(self.total_start_ns),
+            stream=stream.summary(completed=False),
+        )
+        if alm_instance._current_run:
+            alm_instance._current_run.record_tool_call(
+                allowed=True,
+                denied=False,
+                error=False,
+                retried=False,
+                tool_latency_ms=tool_latency_ms,
+                policy_latency_ms=self.policy_latency_ms,
+            )
+
 
 def tool(
-    alm_instance: "ALM",  # noqa: F821
+    alm_instance: "ALM",
     tool_name: Optional[str] = None,
 ) -> Callable:
     """Decorator factory for wrapping tool functions.
 
+    Both regular functions and ``async def`` tools are supported; async tools get
+    an async wrapper that awaits the tool, so latencies cover the awaited work.
+    Generator and async generator tools are wrapped in a generator that passes
+    items through and emits tool.response once the stream is exhausted, fails or
+    is closed, with item count, bytes, time to first item and duration. Values
+    and exceptions passed with send()/throw() (asend()/athrow()) are forwarded
+    to the tool, and a generator's return value is preserved.
+
     Args:
         alm_instance: The ALM instance
         tool_name: Optional name for the tool (defaults to function name)
@@ -32,241 +438,113 @@ def tool(
 
     def decorator(func: Callable) -> Callable:
         name = tool_name or func.__name__
+        # Resolve the signature once rather than on every call
+        normalize_args = make_args_normalizer(func)
+
+        def start_call(args: tuple, kwargs: Dict[str, Any]) -> ToolCall:
+            # Normalize args to named parameters for better analytics, then redact
+            # sensitive info; the args are the same for every attempt
+            return ToolCall(alm_instance, name, redact_sensitive(normalize_args(args, kwargs)))
+
+        if inspect.isgeneratorfunction(func):
+
+            @wraps(func)
+            def generator_wrapper(*args: Any, **kwargs: Any) -> Iterator[Any]:
+                # Like the tool itself, nothing happens until iteration starts
+                call = start_call(args, kwargs)
+                call.start_attempt()
+                stream = StreamStats()
+                iterator = func(*args, **kwargs)
+                try:
+                    item = next(iterator)
+                    while True:
+                        stream.record(item)
+                        # Forward send() and throw() to the tool, as yield from would
+                        try:
+                            sent = yield item
+                        except GeneratorExit:
+                            iterator.close()
+                            call.stream_closed(stream)
+                            raise
+                        except BaseException as thrown:
+                            item = iterator.throw(thrown)
+                        else:
+                            item = iterator.send(sent)
+                except StopIteration as stop:
+                    call.succeeded(None, stream)
+                    return stop.value
+                except Exception as e:
+                    call.failed(e, stream)
+                    raise
 
-        @wraps(func)
-        def wrapper(*args: Any, **kwargs: Any) -> Any:
-            # Generate tool_call_id for correlation across events
-            tool_call_id = new_id()
-
-            # Track attempts and retries
-            attempt = 1
-            max_retries = 0  # Could be made configurable in the future
-            retries = 0
-
-            while True:
-                # Capture start time at the very beginning for accurate latency
-                total_start_time = time.time()
+            return generator_wrapper
 
-                # Normalize args to named parameters for better analytics
-                normalized_args = normalize_args(func, args, kwargs)
-                # Redact sensitive info from normalized args
-                redacted_args = redact_sensitive(normalized_args)
+        if inspect.isasyncgenfunction(func):
 
-                # Emit tool.request
-                request_event = tool_request_event(
-                    event_id=new_id(),
-                    timestamp=utc_now_iso(),
-                    agent_id=alm_instance.agent_id,
-                    env=alm_instance.env,
-                    run_id=alm_instance._current_run_id(),
-                    tool_name=name,
-                    tool_call_id=tool_call_id,
-                    args=redacted_args,
-                    attempt=attempt,
-                    agent_version=alm_instance.agent_version,
-                    policy_version=alm_instance.policy_version,
-                )
-                alm_instance.client.emit(request_event)
-
-                # Check policy and measure policy latency
-                policy_start_time = time.time()
-                allowed, reason = alm_instance.policy.check_tool(name)
-                policy_latency_ms = (time.time() - policy_start_time) * 1000
-
-                if not allowed:
-                    # Emit policy.decision deny
-                    decision_event = policy_decision_event(
-                        event_id=new_id(),
-                        timestamp=utc_now_iso(),
-                        agent_id=alm_instance.agent_id,
-                        env=alm_instance.env,
-                        run_id=alm_instance._current_run_id(),
-                        tool_name=name,
-                        tool_call_id=tool_call_id,
-                        decision="deny",
-                        reason=reason,
-                        latency_ms=policy_latency_ms,
-                        attempt=attempt,
-                        agent_version=alm_instance.agent_version,
-                        policy_version=alm_instance.policy_version,
-                    )
-                    alm_instance.client.emit(decision_event)
-
-                    # Emit tool.response with status="denied" before raising
-                    total_latency_ms = (time.time() - total_start_time) * 1000
-                    denied_error = create_structured_error(
-                        PermissionError(f"Tool '{name}' denied: {reason}"),
-                        source="policy",
-                    )
-                    denied_response_event = tool_response_event(
-                        event_id=new_id(),
-                        timestamp=utc_now_iso(),
-                        agent_id=alm_instance.agent_id,
-                        env=alm_instance.env,
-                        run_id=alm_instance._current_run_id(),
-                        tool_name=name,
-                        tool_call_id=tool_call_id,
-                        status="denied",
-                        policy_latency_ms=policy_latency_ms,
-                        tool_latency_ms=0.0,  # Tool didn't execute
-                        total_latency_ms=total_latency_ms,
-                        attempt=attempt,
-                        retries=retries,
-                        error=denied_error,
-                        result=None,
-                        agent_version=alm_instance.agent_version,
-                        policy_version=alm_instance.policy_version,
-                    )
-                    alm_instance.client.emit(denied_response_event)
-
-                    # Record statistics
-                    if alm_instance._current_run:
-                        alm_instance._current_run.record_tool_call(
-                            allowed=False,
-                            denied=True,
-                            error=False,
-                            retried=retries > 0,
-                            tool_latency_ms=0.0,
-                            policy_latency_ms=policy_latency_ms,
-                        )
-
-                    raise PermissionError(f"Tool '{name}' denied: {reason}")
-
-                # Emit policy.decision allow
-                decision_event = policy_decision_event(
-                    event_id=new_id(),
-                    timestamp=utc_now_iso(),
-                    agent_id=alm_instance.agent_id,
-                    env=alm_instance.env,
-                    run_id=alm_instance._current_run_id(),
-                    tool_name=name,
-                    tool_call_id=tool_call_id,
-                    decision="allow",
-                    reason=reason,
-                    latency_ms=policy_latency_ms,
-                    attempt=attempt,
-                    agent_version=alm_instance.agent_version,
-                    policy_version=alm_instance.policy_version,
-                )
-                alm_instance.client.emit(decision_event)
+            @wraps(func)
+            async def async_generator_wrapper(*args: Any, **kwargs: Any) -> AsyncIterator[Any]:
+                call = start_call(args, kwargs)
+                call.start_attempt()
+                stream = StreamStats()
+                iterator = func(*args, **kwargs)
+                try:
+                    item = await iterator.__anext__()
+                    while True:
+                        stream.record(item)
+                        try:
+                            sent = yield item
+                        except GeneratorExit:
+                            await iterator.aclose()
+                            call.stream_closed(stream)
+                            raise
+                        except BaseException as thrown:
+                            item = await iterator.athrow(thrown)
+                        else:
+                            item = await iterator.asend(sent)
+                except StopAsyncIteration:
+                    call.succeeded(None, stream)
+                except asyncio.CancelledError as e:
+                    call.failed(e, stream, cancelled=True)
+                    raise
+                except Exception as e:
+                    call.failed(e, stream)
+                    raise
 
-                # Execute tool and time it
-                tool_start_time = time.time()
-                status = "success"
-                error = None
-                result = None
+            return async_generator_wrapper
+
+        if inspect.iscoroutinefunction(func):
+
+            @wraps(func)
+            async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+                call = start_call(args, kwargs)
+                while True:
+                    call.start_attempt()
+                    try:
+                        result = await func(*args, **kwargs)
+                    except asyncio.CancelledError as e:
+                        # Timeouts and task cancellation still end the call
+                        call.failed(e, cancelled=True)
+                        raise
+                    except Exception as e:
+                        if call.failed(e):
+                            continue
+                        raise
+                    return call.succeeded(result)
+
+            return async_wrapper
 
+        @wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            call = start_call(args, kwargs)
+            while True:
+                call.start_attempt()
                 try:
                     result = func(*args, **kwargs)
-                    # Record successful tool call for budget
-                    alm_instance.policy.record_tool_call()
-
-                    # Emit successful tool.response
-                    tool_latency_ms = (time.time() - tool_start_time) * 1000
-                    total_latency_ms = (time.time() - total_start_time) * 1000
-
-                    response_event = tool_response_event(
-                        event_id=new_id(),
-                        timestamp=utc_now_iso(),
-                        agent_id=alm_instance.agent_id,
-                        env=alm_instance.env,
-                        run_id=alm_instance._current_run_id(),
-                        tool_name=name,
-                        tool_call_id=tool_call_id,
-                        status=status,
-                        policy_latency_ms=policy_latency_ms,
-                        tool_latency_ms=tool_latency_ms,
-                        total_latency_ms=total_latency_ms,
-                        attempt=attempt,
-                        retries=retries,
-                        error=error,
-                        result=redact_sensitive(result) if result is not None else None,
-                        agent_version=alm_instance.agent_version,
-                        policy_version=alm_instance.policy_version,
-                    )
-                    alm_instance.client.emit(response_event)
-
-                    # Record statistics
-                    if alm_instance._current_run:
-                        alm_instance._current_run.record_tool_call(
-                            allowed=True,
-                            denied=False,
-                            error=False,
-                            retried=retries > 0,
-                            tool_latency_ms=tool_latency_ms,
-                            policy_latency_ms=policy_latency_ms,
-                        )
-
-                    return result
-
                 except Exception as e:
-                    tool_latency_ms = (time.time() - tool_start_time) * 1000
-                    total_latency_ms = (time.time() - total_start_time) * 1000
-
-                    # Create structured error
-                    error = create_structured_error(e, source="tool")
-
-                    # Check if we should retry (retryable error and attempts left)
-                    should_retry = (
-                        error.get("retryable", False)
-                        and attempt <= max_retries
-                        and attempt < 3
-                    )  # Cap at 3 attempts
-
-                    if should_retry:
-                        # Retry - increment attempt and retry count
-                        attempt += 1
-                        retries += 1
-                        # Record failed attempt
-                        if alm_instance._current_run:
-                            alm_instance._current_run.record_tool_call(
-                                allowed=True,
-                                denied=False,
-                                error=True,
-                                retried=True,
-                                tool_latency_ms=tool_latency_ms,
-                                policy_latency_ms=policy_latency_ms,
-                            )
-                        # Continue loop to retry
+                    if call.failed(e):
                         continue
-
-                    # No retry or max retries reached - emit error response
-                    status = "error"
-                    response_event = tool_response_event(
-                        event_id=new_id(),
-                        timestamp=utc_now_iso(),
-                        agent_id=alm_instance.agent_id,
-                        env=alm_instance.env,
-                        run_id=alm_instance._current_run_id(),
-                        tool_name=name,
-                        tool_call_id=tool_call_id,
-                        status=status,
-                        policy_latency_ms=policy_latency_ms,
-                        tool_latency_ms=tool_latency_ms,
-                        total_latency_ms=total_latency_ms,
-                        attempt=attempt,
-                        retries=retries,
-                        error=error,
-                        result=None,
-                        agent_version=alm_instance.agent_version,
-                        policy_version=alm_instance.policy_version,
-                    )
-                    alm_instance.client.emit(response_event)
-
-                    # Record statistics
-                    if alm_instance._current_run:
-                        alm_instance._current_run.record_tool_call(
-                            allowed=True,
-                            denied=False,
-                            error=True,
-                            retried=retries > 0,
-                            tool_latency_ms=tool_latency_ms,
-                            policy_latency_ms=policy_latency_ms,
-                        )
-
-                    # Still record tool call for budget purposes
-                    alm_instance.policy.record_tool_call()
                     raise
+                return call.succeeded(result)
 
         return wrapper
 
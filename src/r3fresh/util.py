@@ -3,6 +3,7 @@
 # SPDX-License-Identifier: MIT
 """Utility functions for ALM SDK."""
 import inspect
+import time
 from datetime import datetime, timezone
 from typing import Any, Callable, Dict, Optional
 from uuid import uuid4
@@ -14,6 +15,17 @@ def utc_now_iso() -> str:
     return now.strftime("%Y-%m-%dT%H:%M:%S.%f")[:-3] + "Z"
 
 
+def elapsed_ms(start_ns: int, end_ns: Optional[int] = None) -> float:
+    """Milliseconds between two time.perf_counter_ns() readings, to the microsecond.
+
+    Durations use the monotonic performance counter so they are unaffected by
+    wall-clock adjustments; timestamps still come from utc_now_iso().
+    """
+    if end_ns is None:
+        end_ns = time.perf_counter_ns()
+    return (end_ns - start_ns) // 1000 / 1000
+
+
 def new_id() -> str:
     """Generate a new UUID string."""
     return str(uuid4())
@@ -28,7 +40,7 @@ def safe_error(e: Exception) -> Dict[str, str]:
 
 
 def create_structured_error(
-    exception: Exception,
+    exception: BaseException,
     source: str = "tool",
     code: Optional[str] = None,
     retryable: Optional[bool] = None,
@@ -97,11 +109,77 @@ def redact_sensitive(value: Any, max_length: int = 1000) -> Any:
     return value
 
 
+def make_args_normalizer(func: Callable) -> Callable[[tuple, Dict[str, Any]], Dict[str, Any]]:
+    """Precompute how to normalize a function's call arguments.
+
+    inspect.signature() is resolved once here instead of on every call. For plain
+    signatures (no *args, **kwargs or positional-only parameters) the returned
+    function binds arguments directly from the parameter list; anything unusual
+    falls back to Signature.bind(), and callables without a usable signature keep
+    the original args/kwargs structure.
+
+    Args:
+        func: The function whose calls will be normalized
+
+    Returns:
+        Function mapping (args, kwargs) to the normalize_args() result
+    """
+    try:
+        sig = inspect.signature(func)
+    except (TypeError, ValueError):
+        return _unbound_args
+
+    def bind(args: tuple, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        try:
+            bound = sig.bind(*args, **kwargs)
+            bound.apply_defaults()
+            # Return normalized dict with parameter names
+            return {"inputs": dict(bound.arguments)}
+        except (TypeError, AttributeError):
+            return _unbound_args(args, kwargs)
+
+    params = list(sig.parameters.values())
+    if any(p.kind not in (p.POSITIONAL_OR_KEYWORD, p.KEYWORD_ONLY) for p in params):
+        return bind
+
+    names = tuple(p.name for p in params)
+    name_set = frozenset(names)
+    positional_count = sum(1 for p in params if p.kind == p.POSITIONAL_OR_KEYWORD)
+    defaults = {p.name: p.default for p in params if p.default is not p.empty}
+
+    def fast_bind(args: tuple, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        if len(args) > positional_count or not name_set.issuperset(kwargs):
+            return bind(args, kwargs)
+        inputs: Dict[str, Any] = {}
+        for index, name in enumerate(names):
+            if index < len(args):
+                if name in kwargs:
+                    return bind(args, kwargs)  # duplicate argument: let bind() report it
+                inputs[name] = args[index]
+            elif name in kwargs:
+                inputs[name] = kwargs[name]
+            elif name in defaults:
+                inputs[name] = defaults[name]
+            else:
+                return bind(args, kwargs)  # missing argument
+        return {"inputs": inputs}
+
+    return fast_bind
+
+
+def _unbound_args(args: tuple, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "args": list(args) if args else [],
+        "kwargs": kwargs if kwargs else {},
+    }
+
+
 def normalize_args(func: Callable, args: tuple, kwargs: Dict[str, Any]) -> Dict[str, Any]:
     """Normalize function arguments to a dict of parameter names to values.
 
     Binds positional args to their parameter names for better analytics/search.
-    Falls back to keeping args/kwargs structure if binding fails.
+    Falls back to keeping args/kwargs structure if binding fails. Callers that
+    normalize many calls to the same function should use make_args_normalizer().
 
     Args:
         func: The function to bind arguments to
@@ -111,15 +189,4 @@ def normalize_args(func: Callable, args: tuple, kwargs: Dict[str, Any]) -> Dict[
     Returns:
         Dict with normalized arguments (either {"inputs": {...}} or {"args": [...], "kwargs": {...}})
     """
-    try:
-        sig = inspect.signature(func)
-        bound = sig.bind(*args, **kwargs)
-        bound.apply_defaults()
-        # Return normalized dict with parameter names
-        return {"inputs": dict(bound.arguments)}
-    except (TypeError, AttributeError):
-        # If binding fails (e.g., built-in functions, complex signatures), fall back to original
-        return {
-            "args": list(args) if args else [],
-            "kwargs": kwargs if kwargs else {},
-        }
+    return make_args_normalizer(func)(args, kwargs)
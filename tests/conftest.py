@@ -0,0 +1,66 @@
+"""Shared fixtures for the ALM SDK tests."""
+import json
+
+import pytest
+
+from r3fresh.events import EventEnvelope, handoff_event, tool_response_event
+
+TIMESTAMP = "2026-01-01T00:00:00.000Z"
+
+
+@pytest.fixture
+def stdout_events(capsys):
+    """Return a function that parses the JSON lines written to stdout since its last call."""
+
+    def read():
+        return [json.loads(line) for line in capsys.readouterr().out.splitlines() if line]
+
+    return read
+
+
+@pytest.fixture
+def envelope():
+    """Envelope for events built directly by tests."""
+    return EventEnvelope(agent_id="test-agent", env="test", agent_version="1.0")
+
+
+@pytest.fixture
+def make_handoffs(envelope):
+    """Return a factory for handoff events event-0 ... event-{count - 1}."""
+
+    def make(count, run_id="run-1"):
+        return [
+            handoff_event(
+                envelope,
+                event_id=f"event-{i}",
+                timestamp=TIMESTAMP,
+                run_id=run_id,
+                from_agent_id="test-agent",
+                to_agent_id="other-agent",
+            )
+            for i in range(count)
+        ]
+
+    return make
+
+
+@pytest.fixture
+def make_response(envelope):
+    """Return a factory for the successful tool.response event of call i."""
+
+    def make(i, result=None, run_id="run-1", tool_name="fetch"):
+        return tool_response_event(
+            envelope,
+            event_id=f"response-{i}",
+            timestamp=TIMESTAMP,
+            run_id=run_id,
+            tool_name=tool_name,
+            tool_call_id=f"call-{i}",
+            status="success",
+            policy_latency_ms=0.1,
+            tool_latency_ms=1.0,
+            total_latency_ms=1.1,
+            result=result,
+        )
+
+    return make
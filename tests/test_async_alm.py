@@ -0,0 +1,93 @@
+"""Test AsyncALM with async runs and tasks."""
+import asyncio
+
+from r3fresh import AsyncALM
+
+
+def test_async_run_emits_events(stdout_events):
+    """Test that async with run/task emits the full event sequence."""
+    async def main():
+        async with AsyncALM(agent_id="test-agent", env="test", mode="stdout") as alm:
+
+            @alm.tool("add_numbers")
+            def add_numbers(a: int, b: int) -> int:
+                return a + b
+
+            async with alm.run(purpose="Test async run"):
+                async with alm.task(description="add"):
+                    assert add_numbers(2, 3) == 5
+        return alm
+
+    alm = asyncio.run(main())
+
+    events = stdout_events()
+    event_types = [e["event_type"] for e in events]
+    assert event_types == [
+        "run.start",
+        "task.start",
+        "tool.request",
+        "policy.decision",
+        "tool.response",
+        "task.end",
+        "run.end",
+    ]
+    assert events[-1]["metadata"]["summary"]["tasks"]["completed"] == 1
+    assert alm.client._sender.done()
+
+
+def test_concurrent_runs_share_one_client(stdout_events):
+    """Test that concurrent coroutines keep their own run_id on a shared AsyncALM."""
+    async def main():
+        alm = AsyncALM(agent_id="test-agent", env="test", mode="stdout")
+
+        @alm.tool("noop")
+        def noop() -> None:
+            return None
+
+        async def agent(i: int) -> str:
+            async with alm.run(purpose=f"agent {i}") as run:
+                for _ in range(3):
+                    noop()
+                    await asyncio.sleep(0)
+                return run.run_id
+
+        run_ids = await asyncio.gather(*(agent(i) for i in range(20)))
+        await alm.aclose()
+        return run_ids
+
+    run_ids = asyncio.run(main())
+
+    events = stdout_events()
+    assert len(events) == 20 * (2 + 3 * 3)
+    for run_id in run_ids:
+        run_events = [e for e in events if e["run_id"] == run_id]
+        assert len(run_events) == 2 + 3 * 3
+        run_end = run_events[-1]
+        assert run_end["event_type"] == "run.end"
+        assert run_end["metadata"]["summary"]["tool_calls"]["total"] == 3
+
+
+def test_emit_from_worker_threads(stdout_events):
+    """Test that tools run in worker threads can emit concurrently with the sender."""
+    async def main():
+        async with AsyncALM(agent_id="test-agent", env="test", mode="stdout") as alm:
+
+            @alm.tool("work")
+            def work(i: int) -> int:
+                return i
+
+            def many(start: int) -> None:
+                for i in range(start, start + 200):
+                    work(i)
+
+            async with alm.run():
+                await asyncio.gather(*(asyncio.to_thread(many, n * 200) for n in range(4)))
+            stats = alm.stats()
+            return stats
+
+    stats = asyncio.run(main())
+
+    events = stdout_events()
+    responses = [e for e in events if e["event_type"] == "tool.response"]
+    assert sorted(e["metadata"]["result"] for e in responses) == list(range(800))
+    assert stats["dropped_events"] == 0
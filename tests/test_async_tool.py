@@ -0,0 +1,130 @@
+"""Test async def tools."""
+import asyncio
+import inspect
+
+import pytest
+
+from r3fresh import ALM, AsyncALM
+
+
+def test_async_tool_is_awaited_and_timed(stdout_events):
+    """Test that latency covers the awaited work and the response follows it."""
+    async def main():
+        async with AsyncALM(agent_id="test-agent", env="test", mode="stdout") as alm:
+
+            @alm.tool("fetch")
+            async def fetch(url: str) -> str:
+                await asyncio.sleep(0.05)
+                return f"body of {url}"
+
+            assert inspect.iscoroutinefunction(fetch)
+            async with alm.run(purpose="async tool"):
+                return await fetch("https://example.com")
+
+    result = asyncio.run(main())
+
+    events = stdout_events()
+
+    assert result == "body of https://example.com"
+    response = next(e for e in events if e["event_type"] == "tool.response")
+    assert response["metadata"]["status"] == "success"
+    assert response["metadata"]["result"] == result
+    assert response["metadata"]["tool_latency_ms"] >= 40
+    request = next(e for e in events if e["event_type"] == "tool.request")
+    assert request["metadata"]["args"] == {"inputs": {"url": "https://example.com"}}
+    summary = events[-1]["metadata"]["summary"]
+    assert summary["tool_calls"]["total"] == 1
+    assert summary["latencies"]["avg_tool_ms"] >= 40
+
+
+def test_async_tool_error_and_denial(stdout_events):
+    """Test that failures and policy denials are reported for async tools."""
+
+    async def main():
+        alm = AsyncALM(agent_id="test-agent", env="test", mode="stdout", denied_tools={"blocked"})
+
+        @alm.tool("broken")
+        async def broken() -> None:
+            await asyncio.sleep(0)
+            raise ValueError("boom")
+
+        @alm.tool("blocked")
+        async def blocked() -> None:
+            raise AssertionError("must not run")
+
+        async with alm.run():
+            with pytest.raises(ValueError):
+                await broken()
+            with pytest.raises(PermissionError):
+                await blocked()
+        await alm.aclose()
+
+    asyncio.run(main())
+
+    events = stdout_events()
+
+    statuses = [e["metadata"]["status"] for e in events if e["event_type"] == "tool.response"]
+    assert statuses == ["error", "denied"]
+    summary = events[-1]["metadata"]["summary"]["tool_calls"]
+    assert (summary["error"], summary["denied"]) == (1, 1)
+
+
+def test_async_tool_on_sync_alm(stdout_events):
+    """Test that a blocking ALM can instrument async tools too."""
+    alm = ALM(agent_id="test-agent", env="test", mode="stdout")
+
+    @alm.tool()
+    async def double(x: int) -> int:
+        await asyncio.sleep(0)
+        return x * 2
+
+    async def main():
+        result = await double(21)
+        alm.flush()
+        return result
+
+    result = asyncio.run(main())
+
+    events = stdout_events()
+
+    assert result == 42
+    assert [e["event_type"] for e in events] == ["tool.request", "policy.decision", "tool.response"]
+    assert events[-1]["metadata"]["result"] == 42
+
+
+def test_cancelled_async_tool_emits_response(stdout_events):
+    """Test that a tool cancelled by a timeout still emits tool.response and is counted."""
+
+    async def main():
+        async with AsyncALM(agent_id="test-agent", env="test", mode="stdout") as alm:
+
+            @alm.tool("slow")
+            async def slow() -> None:
+                await asyncio.sleep(10)
+
+            @alm.tool("slow_stream")
+            async def slow_stream():
+                yield "first"
+                await asyncio.sleep(10)
+                yield "second"
+
+            async def consume():
+                return [item async for item in slow_stream()]
+
+            async with alm.run():
+                with pytest.raises(asyncio.TimeoutError):
+                    await asyncio.wait_for(slow(), 0.01)
+                with pytest.raises(asyncio.TimeoutError):
+                    await asyncio.wait_for(consume(), 0.01)
+
+    asyncio.run(main())
+
+    events = stdout_events()
+
+    responses = [e["metadata"] for e in events if e["event_type"] == "tool.response"]
+    assert [r["status"] for r in responses] == ["cancelled", "cancelled"]
+    assert responses[0]["error"]["type"] == "CancelledError"
+    assert responses[0]["error"]["retryable"] is False
+    assert responses[1]["stream"]["items"] == 1
+    summary = events[-1]["metadata"]["summary"]["tool_calls"]
+    assert (summary["total"], summary["error"]) == (2, 2)
@@ -0,0 +1,122 @@
+"""Test background sender mode."""
+import threading
+import time
+
+from r3fresh import ALM
+
+
+def test_background_sender_emits_all_events(stdout_events):
+    """Test that background mode delivers every event by the time the run ends."""
+    alm = ALM(
+        agent_id="test-agent",
+        env="test",
+        mode="stdout",
+        background=True,
+    )
+
+    @alm.tool("echo")
+    def echo(value: str) -> str:
+        return value
+
+    with alm.run(purpose="Test background sender"):
+        for i in range(30):
+            echo(str(i))
+
+    events = stdout_events()
+
+    # run.start + 3 events per tool call + run.end
+    assert len(events) == 2 + 30 * 3
+    assert events[0]["event_type"] == "run.start"
+    assert events[-1]["event_type"] == "run.end"
+
+    alm.client.close()
+    assert not alm.client._worker.is_alive()
+
+
+def test_background_emit_does_not_block_on_sink():
+    """Test that emit() returns immediately even when the sink is slow."""
+    alm = ALM(agent_id="test-agent", env="test", mode="stdout", background=True)
+    client = alm.client
+    release = threading.Event()
+    sent = []
+
+    def slow_sink(events):
+        release.wait(5)
+        sent.extend(events)
+
+    client._flush_stdout = slow_sink
+
+    start = time.monotonic()
+    with alm.task(description="fill a batch"):
+        for _ in range(client.batch_size):
+            alm.handoff(to_agent_id="other-agent")
+    assert time.monotonic() - start < 1.0
+
+    # The worker is stuck in the sink, so the barrier times out
+    assert client.flush(timeout=0.05) is False
+
+    release.set()
+    assert client.flush() is True
+    assert len(sent) == client.batch_size + 2
+    client.close()
+
+
+def test_client_positional_arguments():
+    """Test that mode, endpoint, api_key and batch_size stay positional."""
+    from r3fresh.aio import AsyncEventClient
+    from r3fresh.client import EventClient
+
+    client = EventClient("http", "http://collector", "key", 10)
+    assert (client.mode, client.endpoint, client.api_key, client.batch_size) == (
+        "http",
+        "http://collector",
+        "key",
+        10,
+    )
+    assert client.background is False
+    client.close()
+
+    async_client = AsyncEventClient("http", "http://collector")
+    assert (async_client.mode, async_client.endpoint) == ("http", "http://collector")
+
+
+def test_close_leaves_resources_to_a_slow_worker(tmp_path, capsys):
+    """Test that close() does not close the sink under a worker still sending."""
+    from r3fresh.client import EventClient
+    from r3fresh.events import EventEnvelope, handoff_event
+
+    client = EventClient(mode="file", output_dir=str(tmp_path), background=True, batch_size=1)
+    release = threading.Event()
+    writes = []
+    closed = []
+    sink_write = client._sink.write
+
+    def slow_write(events):
+        release.wait(5)
+        writes.append(closed[:])
+        sink_write(events)
+
+    client._sink.write = slow_write
+    client._sink.close = lambda: closed.append(True)
+    event = handoff_event(
+        EventEnvelope(agent_id="test-agent", env="test"),
+        event_id="event-1",
+        timestamp="2026-01-01T00:00:00.000Z",
+        run_id=None,
+        from_agent_id="test-agent",
+        to_agent_id="other-agent",
+    )
+    client.emit(event)
+
+    client.close(timeout=0.05)
+    assert "Timed out waiting for background sender" in capsys.readouterr().err
+    assert closed == []
+
+    # Emitting after close drops the event instead of queueing it forever
+    client.emit(event)
+    assert client.stats()["dropped_events"] == 1
+
+    release.set()
+    client._worker.join(5)
+    assert writes == [[]]
+    assert closed == [True]
@@ -0,0 +1,65 @@
+"""Test byte-size-aware batch splitting."""
+import json
+
+from r3fresh.client import EventClient
+
+
+def test_batches_split_by_serialized_size(make_response):
+    """Test that no request body exceeds max_batch_bytes and event order is kept."""
+    client = EventClient(mode="http", endpoint="http://localhost", max_batch_bytes=4000)
+    events = [make_response(i, "x" * 500) for i in range(20)]
+
+    requests = client._http_requests(events)
+
+    assert len(requests) > 1
+    assert all(len(body) <= 4000 for body, _ in requests)
+    event_ids = [e["event_id"] for body, _ in requests for e in json.loads(body)["events"]]
+    assert event_ids == [f"response-{i}" for i in range(20)]
+    client.close()
+
+
+def test_oversize_event_is_truncated(make_response):
+    """Test that a single event over the limit has its result replaced by a marker."""
+    client = EventClient(mode="http", endpoint="http://localhost", max_batch_bytes=2000)
+    events = [make_response(0, "small"), make_response(1, "x" * 10_000), make_response(2, "small")]
+
+    requests = client._http_requests(events)
+
+    assert all(len(body) <= 2000 for body, _ in requests)
+    decoded = [e for body, _ in requests for e in json.loads(body)["events"]]
+    big = decoded[1]["metadata"]
+    assert big["truncated"] == ["result"]
+    assert big["result"].startswith("<truncated:")
+    assert decoded[0]["metadata"]["result"] == "small"
+    client.close()
+
+
+def test_oversize_event_sent_alone(make_response):
+    """Test that send_alone isolates an oversize event in its own request."""
+    client = EventClient(
+        mode="http",
+        endpoint="http://localhost",
+        max_batch_bytes=2000,
+        oversize_events="send_alone",
+    )
+    events = [make_response(0, "small"), make_response(1, "x" * 10_000), make_response(2, "small")]
+
+    requests = client._http_requests(events)
+
+    assert len(requests) == 3
+    alone = json.loads(requests[1][0])["events"]
+    assert len(alone) == 1 and alone[0]["metadata"]["result"] == "x" * 10_000
+    client.close()
+
+
+def test_inline_emit_flushes_at_max_batch_bytes(make_response):
+    """Test that foreground mode flushes once queued bytes reach max_batch_bytes."""
+    client = EventClient(mode="http", endpoint="http://localhost", max_batch_bytes=4000)
+    flushes = []
+    client.flush = lambda: flushes.append(len(client._take_batch()))
+
+    for i in range(5):
+        client.emit(make_response(i, "x" * 1500))
+
+    assert flushes and flushes[0] < client.batch_size
+    client.close()
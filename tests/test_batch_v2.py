@@ -0,0 +1,63 @@
+"""Test the v2 batch format with hoisted common fields."""
+import json
+
+import pytest
+
+from r3fresh.batch import expand_batch
+from r3fresh.client import EventClient
+from r3fresh.events import EventEnvelope, handoff_event
+
+
+def test_v2_hoists_shared_fields_and_expands_to_v1(make_response):
+    """Test that v2 bodies are smaller and expand back to the v1 events."""
+    events = [make_response(i) for i in range(20)]
+    v1 = EventClient(mode="http", endpoint="http://localhost")
+    v2 = EventClient(mode="http", endpoint="http://localhost", batch_format="v2")
+
+    v1_body = v1._http_requests(events)[0][0]
+    v2_body = v2._http_requests(events)[0][0]
+    payload = json.loads(v2_body)
+
+    assert payload["version"] == 2
+    assert payload["header"]["agent_id"] == "test-agent"
+    assert payload["header"]["run_id"] == "run-1"
+    assert "agent_id" not in payload["events"][0]
+    assert len(v2_body) < len(v1_body) * 0.8
+    assert expand_batch(payload) == [event.to_dict() for event in events]
+    assert expand_batch(json.loads(v1_body)) == expand_batch(payload)
+    v1.close()
+    v2.close()
+
+
+def test_v2_keeps_fields_that_differ_within_a_batch(make_response):
+    """Test that only uniform fields are hoisted."""
+    other = EventEnvelope(agent_id="other-agent", env="test")
+    events = [
+        make_response(0, run_id="run-1"),
+        make_response(1, run_id="run-2"),
+        handoff_event(
+            other,
+            event_id="handoff-0",
+            timestamp="2026-01-01T00:00:00.000Z",
+            run_id="run-2",
+            from_agent_id="other-agent",
+            to_agent_id="test-agent",
+        ),
+    ]
+    client = EventClient(mode="http", endpoint="http://localhost", batch_format="v2")
+
+    payload = json.loads(client._http_requests(events)[0][0])
+
+    assert "run_id" not in payload["header"]
+    assert "agent_id" not in payload["header"]
+    assert payload["header"]["env"] == "test"
+    assert [e["agent_id"] for e in expand_batch(payload)] == ["test-agent", "test-agent", "other-agent"]
+    client.close()
+
+
+def test_v2_requires_json_upload_format():
+    """Test that v2 is rejected for NDJSON streaming."""
+    with pytest.raises(ValueError):
+        EventClient(mode="http", endpoint="http://localhost", batch_format="v2", upload_format="ndjson")
+    with pytest.raises(ValueError):
+        expand_batch({"version": 3, "events": []})
@@ -0,0 +1,85 @@
+"""Test the bounded event queue and overflow policies."""
+import threading
+
+from r3fresh import ALM
+from r3fresh.buffer import EventBuffer
+from r3fresh.events import policy_decision_event
+
+
+def _decision(envelope, i):
+    return policy_decision_event(
+        envelope,
+        event_id=f"decision-{i}",
+        timestamp="2026-01-01T00:00:00.000Z",
+        run_id=None,
+        tool_name="tool",
+        tool_call_id=f"call-{i}",
+        decision="allow",
+        reason="allowed",
+        latency_ms=0.1,
+    )
+
+
+def test_drop_policies(envelope, make_response):
+    """Test drop_newest, drop_oldest and drop_low_priority eviction order."""
+    newest = EventBuffer(max_events=2, overflow="drop_newest")
+    for i in range(3):
+        newest.put(make_response(i))
+    assert [e.event_id for e in newest.drain()] == ["response-0", "response-1"]
+    assert newest.dropped_events == 1
+
+    oldest = EventBuffer(max_events=2, overflow="drop_oldest")
+    for i in range(3):
+        oldest.put(make_response(i))
+    assert [e.event_id for e in oldest.drain()] == ["response-1", "response-2"]
+
+    low = EventBuffer(max_events=2, overflow="drop_low_priority")
+    low.put(make_response(0))
+    low.put(_decision(envelope, 1))
+    low.put(make_response(2))
+    accepted, _ = low.put(_decision(envelope, 3))
+    assert accepted is False
+    assert [e.event_id for e in low.drain()] == ["response-0", "response-2"]
+    assert low.dropped_by_type == {"policy.decision": 2}
+
+
+def test_byte_limit(make_response):
+    """Test that max_bytes bounds the approximate queued bytes."""
+    buffer = EventBuffer(max_bytes=2000, overflow="drop_oldest")
+    for i in range(50):
+        buffer.put(make_response(i))
+    assert 0 < buffer.bytes <= 2000
+    assert buffer.dropped_events > 0
+    assert len(buffer) + buffer.dropped_events == 50
+
+
+def test_dropped_events_reported_in_run_end(stdout_events):
+    """Test that events dropped while the sender is stuck are counted in run.end."""
+    alm = ALM(
+        agent_id="test-agent",
+        env="test",
+        mode="stdout",
+        background=True,
+        max_queue_events=5,
+        overflow="drop_oldest",
+    )
+    stuck = threading.Event()
+    original_sink = alm.client._flush_stdout
+
+    def slow_sink(events):
+        stuck.wait(5)
+        original_sink(events)
+
+    alm.client._flush_stdout = slow_sink
+
+    with alm.run(purpose="Test overflow"):
+        for _ in range(alm.client.batch_size):
+            alm.handoff(to_agent_id="other-agent")
+        dropped = alm.stats()["dropped_events"]
+        assert dropped > 0
+        stuck.set()
+
+    alm.client.close()
+    events = stdout_events()
+    run_end = next(e for e in events if e["event_type"] == "run.end")
+    assert run_end["metadata"]["summary"]["dropped_events"] >= dropped
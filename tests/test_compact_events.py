@@ -0,0 +1,107 @@
+"""Test event_verbosity="compact"."""
+import pytest
+
+from r3fresh import ALM
+
+
+def test_successful_call_emits_single_tool_call(stdout_events):
+    """Test that a successful call is summarized by one tool.call event."""
+    alm = ALM(agent_id="test-agent", env="test", mode="stdout", event_verbosity="compact")
+
+    @alm.tool("add")
+    def add(a: int, b: int) -> int:
+        return a + b
+
+    def main():
+        with alm.run():
+            assert add(2, b=3) == 5
+
+    main()
+
+    events = stdout_events()
+
+    assert [e["event_type"] for e in events] == ["run.start", "tool.call", "run.end"]
+    metadata = events[1]["metadata"]
+    assert metadata["tool_name"] == "add"
+    assert metadata["args"] == {"inputs": {"a": 2, "b": 3}}
+    assert (metadata["decision"], metadata["reason"]) == ("allow", "allowed")
+    assert (metadata["status"], metadata["result"]) == ("success", 5)
+    for field in ("policy_latency_ms", "tool_latency_ms", "total_latency_ms"):
+        assert metadata[field] >= 0
+    summary = events[-1]["metadata"]["summary"]["tool_calls"]
+    assert (summary["total"], summary["allowed"]) == (1, 1)
+
+
+def test_denied_and_failed_calls_stay_expressive(stdout_events):
+    """Test that denials and errors still emit request, decision and response."""
+    alm = ALM(
+        agent_id="test-agent",
+        env="test",
+        mode="stdout",
+        event_verbosity="compact",
+        denied_tools={"blocked"},
+    )
+
+    @alm.tool("blocked")
+    def blocked() -> None:
+        pass
+
+    @alm.tool("broken")
+    def broken() -> None:
+        raise RuntimeError("boom")
+
+    def main():
+        with pytest.raises(PermissionError):
+            blocked()
+        with pytest.raises(RuntimeError):
+            broken()
+        alm.flush()
+
+    main()
+
+    events = stdout_events()
+
+    assert [e["event_type"] for e in events] == [
+        "tool.request",
+        "policy.decision",
+        "tool.response",
+    ] * 2
+    assert [e["metadata"]["status"] for e in events if e["event_type"] == "tool.response"] == [
+        "denied",
+        "error",
+    ]
+
+
+def test_compact_with_sampling(stdout_events):
+    """Test that tool.call events are sampled and weighted like other tool events."""
+    alm = ALM(
+        agent_id="test-agent",
+        env="test",
+        mode="stdout",
+        event_verbosity="compact",
+        tool_sample_rates={"hot": 0.5},
+    )
+    draws = iter([0.2, 0.7])
+    alm.sampler._draw = lambda: next(draws)
+
+    @alm.tool("hot")
+    def hot() -> int:
+        return 1
+
+    def main():
+        hot()
+        hot()
+        alm.flush()
+
+    main()
+
+    events = stdout_events()
+
+    assert [e["event_type"] for e in events] == ["tool.call"]
+    assert events[0]["metadata"]["sample_weight"] == 2.0
+
+
+def test_invalid_verbosity():
+    """Test that an unknown event_verbosity is rejected."""
+    with pytest.raises(ValueError):
+        ALM(agent_id="test-agent", event_verbosity="terse")
@@ -0,0 +1,46 @@
+"""Test compressed HTTP batch bodies."""
+import gzip
+import json
+
+import pytest
+
+from r3fresh.client import EventClient
+
+
+def test_gzip_compression_above_threshold(make_handoffs):
+    """Test that large batches are gzip-encoded and decode to the same payload."""
+    client = EventClient(mode="http", endpoint="http://localhost", compression="gzip")
+    body, headers = client._http_requests(make_handoffs(50))[0]
+
+    assert headers["Content-Encoding"] == "gzip"
+    payload = json.loads(gzip.decompress(body))
+    assert len(payload["events"]) == 50
+    assert payload["events"][0]["event_id"] == "event-0"
+    client.close()
+
+
+def test_small_batch_is_not_compressed(make_handoffs):
+    """Test that bodies under compression_threshold are sent as plain JSON."""
+    client = EventClient(
+        mode="http",
+        endpoint="http://localhost",
+        compression="gzip",
+        compression_threshold=1_000_000,
+    )
+    body, headers = client._http_requests(make_handoffs(2))[0]
+
+    assert "Content-Encoding" not in headers
+    assert len(json.loads(body)["events"]) == 2
+    client.close()
+
+
+def test_zstd_compression(make_handoffs):
+    """Test zstd encoding when zstandard is installed."""
+    zstandard = pytest.importorskip("zstandard")
+    client = EventClient(mode="http", endpoint="http://localhost", compression="zstd")
+    body, headers = client._http_requests(make_handoffs(50))[0]
+
+    assert headers["Content-Encoding"] == "zstd"
+    payload = json.loads(zstandard.ZstdDecompressor().decompressobj().decompress(body))
+    assert len(payload["events"]) == 50
+    client.close()
@@ -0,0 +1,115 @@
+"""Test the lightweight event record used on the emit path."""
+import json
+
+import pytest
+from pydantic import ValidationError
+
+from r3fresh import ALM
+from r3fresh.buffer import EventBuffer
+from r3fresh.client import EventClient
+from r3fresh.serialize import get_serializer
+from r3fresh.events import Event, EventEnvelope, EventRecord, tool_request_event
+
+
+def _request(envelope):
+    return tool_request_event(
+        envelope,
+        event_id="event-1",
+        timestamp="2026-01-01T00:00:00.000Z",
+        run_id="run-1",
+        tool_name="search",
+        tool_call_id="call-1",
+        args={"inputs": {"q": "x"}},
+    )
+
+
+def test_record_matches_validated_event(envelope):
+    """Test that a record serializes exactly like the equivalent pydantic Event."""
+    record = _request(envelope)
+
+    assert isinstance(record, EventRecord)
+    assert not hasattr(record, "__dict__")
+    event = record.to_event()
+    assert isinstance(event, Event)
+    assert record.to_dict() == event.model_dump(mode="json")
+    assert list(record.to_dict()) == list(Event.model_fields)
+    assert EventRecord.from_event(event) == record
+
+
+def test_emit_accepts_pydantic_events(envelope, stdout_events):
+    """Test that validated Events can still be emitted directly."""
+    client = EventClient(mode="stdout")
+    client.emit(_request(envelope).to_event())
+    client.flush()
+
+    (event,) = stdout_events()
+    assert event["event_type"] == "tool.request"
+    assert event["metadata"]["tool_name"] == "search"
+
+
+def test_validate_events_rejects_bad_fields(envelope):
+    """Test that validate_events surfaces invalid records at emit time."""
+    alm = ALM(agent_id="test-agent", validate_events=True)
+    bad = _request(envelope)
+    bad.envelope = EventEnvelope(agent_id=None, env="test")
+
+    with pytest.raises(ValidationError):
+        alm.client.emit(bad)
+    assert alm.stats()["queued_events"] == 0
+
+
+def test_envelope_is_spliced_into_encoding(envelope):
+    """Test that the cached envelope encoding yields the same event as to_dict()."""
+    record = _request(envelope)
+    dumps = get_serializer("json").dumps
+
+    assert json.loads(record.encode(dumps)) == record.to_dict()
+    assert envelope.encoded_tail(dumps) is envelope.encoded_tail(dumps)
+
+
+def test_envelope_rebuilt_when_versions_change(stdout_events):
+    """Test that events pick up version changes made on the ALM instance."""
+    alm = ALM(agent_id="test-agent", env="test", agent_version="1.0")
+    alm.handoff("other-agent")
+    alm.agent_version = "2.0"
+    alm.policy_version = "p1"
+    alm.handoff("other-agent")
+    alm.flush()
+
+    first, second = stdout_events()
+    assert (first["agent_version"], first["policy_version"]) == ("1.0", None)
+    assert (second["agent_version"], second["policy_version"]) == ("2.0", "p1")
+
+
+def test_metadata_is_built_only_when_serialized(envelope):
+    """Test that emit() keeps raw fields and the sink materializes them."""
+    calls = []
+
+    def build(status):
+        calls.append(status)
+        return {"status": status}
+
+    record = EventRecord.deferred(
+        "event-1", "2026-01-01T00:00:00.000Z", "tool.response", envelope, "run-1", build, ("ok",)
+    )
+    client = EventClient(mode="http", endpoint="http://localhost", batch_size=100)
+    client.emit(record)
+
+    assert calls == []
+    assert record.raw_fields == ("ok",)
+    body, _ = client._http_requests(client._queue.drain())[0]
+    assert json.loads(body)["events"][0]["metadata"] == {"status": "ok"}
+    assert record.to_dict()["metadata"] == {"status": "ok"}
+    assert calls == ["ok"] and record.raw_fields is None
+    client.close()
+
+
+def test_dropped_events_are_never_materialized(envelope):
+    """Test that events dropped from a full buffer skip metadata building."""
+    buffer = EventBuffer(max_events=1, overflow="drop_newest")
+    kept, dropped = _request(envelope), _request(envelope)
+    buffer.put(kept)
+    buffer.put(dropped)
+
+    assert buffer.dropped_events == 1
+    assert kept.raw_fields is not None and dropped.raw_fields is not None
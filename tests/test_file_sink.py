@@ -0,0 +1,171 @@
+"""Test the rotating JSONL file sink."""
+import gzip
+import json
+import os
+import subprocess
+import sys
+import threading
+
+import pytest
+
+from r3fresh import ALM
+
+
+def _files(directory, suffix):
+    return sorted(name for name in os.listdir(directory) if name.endswith(suffix))
+
+
+def test_file_sink_writes_json_lines(tmp_path):
+    """Test that a run is written as JSON lines and the file is finalized on close."""
+    with ALM(agent_id="test-agent", env="test", mode="file", output_dir=str(tmp_path)) as alm:
+        with alm.run(purpose="file"):
+
+            @alm.tool("add")
+            def add(a: int, b: int) -> int:
+                return a + b
+
+            add(1, 2)
+
+    files = _files(tmp_path, ".jsonl")
+    assert len(files) == 1
+    with open(os.path.join(tmp_path, files[0]), "rb") as f:
+        events = [json.loads(line) for line in f]
+    assert [e["event_type"] for e in events] == [
+        "run.start", "tool.request", "policy.decision", "tool.response", "run.end",
+    ]
+    assert not _files(tmp_path, ".inprogress")
+
+
+def test_file_sink_rotates_by_size_and_compresses(tmp_path):
+    """Test size-based rotation with gzip-compressed closed segments."""
+    alm = ALM(
+        agent_id="test-agent",
+        mode="file",
+        output_dir=str(tmp_path),
+        file_max_bytes=2000,
+        file_compression="gzip",
+        fsync="batch",
+    )
+    for i in range(30):
+        alm.handoff("other-agent", reason=f"handoff-{i}")
+        alm.flush()
+
+    # fsync="batch" makes every flushed batch visible in the active file
+    active = _files(tmp_path, ".jsonl.inprogress")
+    assert len(active) == 1
+    with open(os.path.join(tmp_path, active[0]), "rb") as f:
+        assert f.read().endswith(b"}\n")
+    alm.client.close()
+
+    segments = _files(tmp_path, ".jsonl.gz")
+    assert len(segments) > 1
+    reasons = []
+    for name in segments:
+        assert os.path.getsize(os.path.join(tmp_path, name)) > 0
+        with gzip.open(os.path.join(tmp_path, name)) as f:
+            reasons.extend(json.loads(line)["metadata"]["reason"] for line in f)
+    assert reasons == [f"handoff-{i}" for i in range(30)]
+    assert not _files(tmp_path, ".jsonl") and not _files(tmp_path, ".inprogress")
+
+
+def test_compression_runs_off_the_writing_thread(tmp_path):
+    """Test that rotated files are compressed in the background and close() waits for it."""
+    alm = ALM(
+        agent_id="test-agent",
+        mode="file",
+        output_dir=str(tmp_path),
+        file_rotate_interval=0,
+        file_compression="gzip",
+    )
+    sink = alm.client._sink
+    compress = sink._compress
+    release = threading.Event()
+    threads = []
+
+    def slow_compress(path):
+        threads.append(threading.get_ident())
+        release.wait(5)
+        compress(path)
+
+    sink._compress = slow_compress
+    for name in ("a", "b", "c"):
+        alm.handoff(name)
+        alm.flush()
+    # Rotation returned without waiting for the blocked compressor
+    assert not _files(tmp_path, ".jsonl.gz")
+
+    release.set()
+    alm.client.close()
+    assert threading.get_ident() not in threads
+    assert len(_files(tmp_path, ".jsonl.gz")) == 3
+    assert not _files(tmp_path, ".jsonl") and not _files(tmp_path, ".inprogress")
+
+
+def test_flushed_batches_reach_the_os(tmp_path):
+    """Test that a flushed batch is in the file without fsync or close (survives os._exit)."""
+    alm = ALM(agent_id="test-agent", mode="file", output_dir=str(tmp_path))
+    alm.handoff("other-agent")
+    alm.flush()
+
+    (active,) = _files(tmp_path, ".jsonl.inprogress")
+    with open(os.path.join(tmp_path, active), "rb") as f:
+        assert json.loads(f.read())["event_type"] == "handoff"
+    alm.client.close()
+
+
+def test_file_sink_rotates_by_time(tmp_path):
+    """Test that file_rotate_interval starts a new file for later batches."""
+    alm = ALM(agent_id="test-agent", mode="file", output_dir=str(tmp_path), file_rotate_interval=0)
+    alm.handoff("a")
+    alm.flush()
+    alm.handoff("b")
+    alm.flush()
+    alm.client.close()
+
+    assert len(_files(tmp_path, ".jsonl")) == 2
+
+
+def test_file_sink_rejects_bad_options(tmp_path):
+    """Test option validation."""
+    with pytest.raises(ValueError):
+        ALM(agent_id="test-agent", mode="file")
+    with pytest.raises(ValueError):
+        ALM(agent_id="test-agent", mode="file", output_dir=str(tmp_path), fsync="always")
+
+
+UNCLOSED_SCRIPTS = {
+    "sync": """
+import sys
+from r3fresh import ALM
+alm = ALM(agent_id="test-agent", mode="file", output_dir=sys.argv[1], background=True)
+for _ in range(3):
+    alm.handoff("other-agent")
+""",
+    "async": """
+import asyncio, sys
+from r3fresh import AsyncALM
+alm = AsyncALM(agent_id="test-agent", mode="file", output_dir=sys.argv[1])
+async def main():
+    for _ in range(3):
+        alm.handoff("other-agent")
+asyncio.run(main())
+""",
+}
+
+
+@pytest.mark.parametrize("kind", sorted(UNCLOSED_SCRIPTS))
+def test_unclosed_client_is_finalized_at_exit(tmp_path, kind):
+    """Test that queued events are written and the file renamed when the process exits."""
+    src = os.path.join(os.path.dirname(os.path.dirname(__file__)), "src")
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join([src, os.environ.get("PYTHONPATH", "")]))
+    subprocess.run(
+        [sys.executable, "-c", UNCLOSED_SCRIPTS[kind], str(tmp_path)],
+        env=env,
+        check=True,
+        timeout=30,
+    )
+
+    assert not _files(tmp_path, ".inprogress")
+    (name,) = _files(tmp_path, ".jsonl")
+    with open(os.path.join(tmp_path, name), "rb") as f:
+        assert len(f.readlines()) == 3
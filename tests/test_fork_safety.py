@@ -0,0 +1,46 @@
+"""Test fork safety of the event client."""
+import json
+import os
+
+import pytest
+
+from r3fresh import ALM
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+def test_forked_child_does_not_resend_parent_events():
+    """Test that pending events are flushed before fork and not inherited by the child."""
+    alm = ALM(agent_id="test-agent", env="test", mode="stdout", background=True)
+    sent = []
+    alm.client._flush_stdout = lambda events: sent.extend(e.event_id for e in events)
+
+    for _ in range(3):
+        alm.handoff(to_agent_id="parent-target")
+    assert sent == []
+
+    read_fd, write_fd = os.pipe()
+    pid = os.fork()
+    if pid == 0:
+        try:
+            os.close(read_fd)
+            inherited = len(sent)
+            alm.handoff(to_agent_id="child-target")
+            ok = alm.client.flush(timeout=5)
+            result = {"ok": ok, "inherited": inherited, "child_sent": sent[inherited:]}
+            os.write(write_fd, json.dumps(result).encode())
+        finally:
+            os._exit(0)
+
+    os.close(write_fd)
+    with os.fdopen(read_fd) as pipe:
+        result = json.loads(pipe.read())
+    os.waitpid(pid, 0)
+
+    # The parent flushed its 3 events before forking
+    assert len(sent) == 3
+    # The child's worker is a fresh thread that sends only the child's own event
+    assert result["ok"] is True
+    assert result["inherited"] == 3
+    assert len(result["child_sent"]) == 1
+    assert result["child_sent"][0] not in sent
+    alm.client.close()
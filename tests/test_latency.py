@@ -0,0 +1,48 @@
+"""Test latency measurement."""
+from r3fresh import ALM
+from r3fresh.util import elapsed_ms
+
+
+def test_elapsed_ms_has_microsecond_resolution():
+    """Test that durations are reported in milliseconds truncated to microseconds."""
+    assert elapsed_ms(1_000_000, 1_234_567_890) == 1233.567
+    assert elapsed_ms(0, 999) == 0.0
+    assert elapsed_ms(0, 1_000) == 0.001
+
+
+def test_fast_policy_checks_count_towards_average(stdout_events):
+    """Test that every call contributes its policy latency, and denied calls no tool latency."""
+    alm = ALM(agent_id="test-agent", env="test", mode="stdout", denied_tools={"blocked"})
+
+    @alm.tool("fast")
+    def fast() -> None:
+        pass
+
+    @alm.tool("blocked")
+    def blocked() -> None:
+        pass
+
+    with alm.run() as run:
+        fast()
+        try:
+            blocked()
+        except PermissionError:
+            pass
+        run.record_tool_call(
+            allowed=True,
+            denied=False,
+            error=False,
+            retried=False,
+            tool_latency_ms=3.0,
+            policy_latency_ms=0.0,
+        )
+        assert len(run._policy_latencies) == 3
+        assert len(run._tool_latencies) == 2
+
+    events = stdout_events()
+    response = next(e for e in events if e["event_type"] == "tool.response")
+    for field in ("policy_latency_ms", "tool_latency_ms", "total_latency_ms"):
+        value = response["metadata"][field]
+        assert value >= 0
+        assert round(value, 3) == value
+    assert response["metadata"]["total_latency_ms"] >= response["metadata"]["tool_latency_ms"]
@@ -0,0 +1,52 @@
+"""Test time- and size-based batch flushing."""
+import asyncio
+import time
+
+from r3fresh import ALM, AsyncALM
+
+
+def test_linger_flushes_partial_batch(stdout_events):
+    """Test that a partial batch is sent once linger_ms elapses, without another emit()."""
+    alm = ALM(agent_id="test-agent", env="test", mode="stdout", linger_ms=20)
+    assert alm.client.background is True
+
+    alm.handoff(to_agent_id="other-agent")
+    deadline = time.monotonic() + 5
+    events = stdout_events()
+    while not events and time.monotonic() < deadline:
+        time.sleep(0.005)
+        events = stdout_events()
+
+    assert [e["event_type"] for e in events] == ["handoff"]
+    alm.client.close()
+
+
+def test_max_batch_bytes_triggers_send():
+    """Test that reaching max_batch_bytes sends before batch_size is reached."""
+    alm = ALM(agent_id="test-agent", env="test", mode="stdout", background=True, max_batch_bytes=2000)
+    batches = []
+    alm.client._flush_stdout = batches.append
+
+    for _ in range(20):
+        alm.handoff(to_agent_id="other-agent", context={"payload": "x" * 200})
+    assert alm.client.flush() is True
+
+    assert len(batches) > 1
+    assert sum(len(batch) for batch in batches) == 20
+    alm.client.close()
+
+
+def test_async_linger(stdout_events):
+    """Test that the async sender also honors linger_ms."""
+    async def main():
+        alm = AsyncALM(agent_id="test-agent", env="test", mode="stdout", linger_ms=10)
+        alm.handoff(to_agent_id="other-agent")
+        for _ in range(500):
+            sent_before_close = bool(stdout_events())
+            if sent_before_close:
+                break
+            await asyncio.sleep(0.01)
+        await alm.aclose()
+        return sent_before_close
+
+    assert asyncio.run(main()) is True
@@ -0,0 +1,100 @@
+"""Test the MessagePack wire format for HTTP uploads."""
+import json
+
+import pytest
+
+pytest.importorskip("msgpack")
+
+from r3fresh.batch import decode_batch  # noqa: E402
+from r3fresh.client import EventClient  # noqa: E402
+from r3fresh.events import (  # noqa: E402
+    handoff_event,
+    policy_decision_event,
+    run_end_event,
+    run_start_event,
+    task_end_event,
+    task_start_event,
+    tool_request_event,
+    tool_response_event,
+)
+
+COMMON = {"timestamp": "2026-01-01T00:00:00.000Z", "run_id": "run-1"}
+
+
+def _all_event_types(envelope):
+    return [
+        run_start_event(envelope, event_id="e0", purpose="p", **COMMON),
+        task_start_event(envelope, event_id="e1", task_id="t1", task_type="x", **COMMON),
+        tool_request_event(
+            envelope, event_id="e2", tool_name="add", tool_call_id="c1",
+            args={"inputs": {"a": 1, "b": 2.5}}, **COMMON,
+        ),
+        policy_decision_event(
+            envelope, event_id="e3", tool_name="add", tool_call_id="c1",
+            decision="allow", reason="default", latency_ms=0.0123, **COMMON,
+        ),
+        tool_response_event(
+            envelope, event_id="e4", tool_name="add", tool_call_id="c1", status="success",
+            policy_latency_ms=0.0123, tool_latency_ms=1.5, total_latency_ms=1.6, result=3.5,
+            **COMMON,
+        ),
+        task_end_event(envelope, event_id="e5", task_id="t1", success=True, **COMMON),
+        handoff_event(
+            envelope, event_id="e6", from_agent_id="test-agent", to_agent_id="other",
+            context={"k": [1, None, True]}, **COMMON,
+        ),
+        run_end_event(envelope, event_id="e7", success=True, tool_calls_total=1, **COMMON),
+    ]
+
+
+@pytest.mark.parametrize("batch_format", ["v1", "v2"])
+@pytest.mark.parametrize("compression", [None, "gzip"])
+def test_msgpack_round_trips_every_event_type(batch_format, compression, envelope):
+    """Test that msgpack bodies decode to the same events as JSON bodies."""
+    events = _all_event_types(envelope)
+    client = EventClient(
+        mode="http",
+        endpoint="http://localhost",
+        wire_format="msgpack",
+        batch_format=batch_format,
+        compression=compression,
+        compression_threshold=0,
+    )
+
+    (body, headers), = client._http_requests(events)
+
+    assert headers["Content-Type"] == "application/msgpack"
+    decoded = decode_batch(body, headers["Content-Type"], headers.get("Content-Encoding"))
+    assert decoded == [event.to_dict() for event in events]
+    client.close()
+
+
+def test_msgpack_is_smaller_than_json(envelope):
+    """Test that msgpack shrinks the uncompressed payload."""
+    events = _all_event_types(envelope) * 10
+    as_json = EventClient(mode="http", endpoint="http://localhost")
+    as_msgpack = EventClient(mode="http", endpoint="http://localhost", wire_format="msgpack")
+
+    json_body = as_json._http_requests(events)[0][0]
+    msgpack_body = as_msgpack._http_requests(events)[0][0]
+
+    assert len(msgpack_body) < len(json_body)
+    assert decode_batch(msgpack_body, "application/msgpack") == json.loads(json_body)["events"]
+    as_json.close()
+    as_msgpack.close()
+
+
+def test_msgpack_batches_split_by_size(envelope):
+    """Test that size-based splitting yields valid msgpack bodies."""
+    events = _all_event_types(envelope) * 10
+    client = EventClient(
+        mode="http", endpoint="http://localhost", wire_format="msgpack", max_batch_bytes=1000
+    )
+
+    requests = client._http_requests(events)
+
+    assert len(requests) > 1
+    assert all(len(body) <= 1000 for body, _ in requests)
+    decoded = [e for body, headers in requests for e in decode_batch(body, headers["Content-Type"])]
+    assert [e["event_id"] for e in decoded] == [event.event_id for event in events]
+    client.close()
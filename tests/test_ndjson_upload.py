@@ -0,0 +1,75 @@
+"""Test streaming NDJSON uploads."""
+import asyncio
+import gzip
+import json
+
+import httpx
+
+from r3fresh.aio import AsyncEventClient
+from r3fresh.client import EventClient
+
+
+def _record(requests):
+    def handler(request):
+        requests.append((request, request.read()))
+        return httpx.Response(200)
+
+    return handler
+
+
+def test_ndjson_streamed_upload(make_handoffs):
+    """Test that ndjson mode streams one event per line with chunked transfer."""
+    requests = []
+    client = EventClient(mode="http", endpoint="http://collector", upload_format="ndjson")
+    client._http_client = httpx.Client(
+        base_url="http://collector",
+        transport=httpx.MockTransport(_record(requests)),
+    )
+    for event in make_handoffs(5):
+        client.emit(event)
+    client.flush()
+
+    request, body = requests[0]
+    assert request.url.path == "/v1/events:ndjson"
+    assert request.headers["Content-Type"] == "application/x-ndjson"
+    assert request.headers["Transfer-Encoding"] == "chunked"
+    lines = body.decode().splitlines()
+    assert [json.loads(line)["event_id"] for line in lines] == [f"event-{i}" for i in range(5)]
+    client.close()
+
+
+def test_ndjson_gzip_stream(make_handoffs):
+    """Test that a streamed body is gzip-compressed incrementally."""
+    client = EventClient(
+        mode="http",
+        endpoint="http://collector",
+        upload_format="ndjson",
+        compression="gzip",
+    )
+    ((body_factory, headers),) = client._upload_requests(make_handoffs(50))
+
+    assert headers["Content-Encoding"] == "gzip"
+    lines = gzip.decompress(b"".join(body_factory())).decode().splitlines()
+    assert len(lines) == 50
+    client.close()
+
+
+def test_async_ndjson_upload(make_handoffs):
+    """Test that the async client streams ndjson through httpx.AsyncClient."""
+    requests = []
+
+    async def main():
+        client = AsyncEventClient(mode="http", endpoint="http://collector", upload_format="ndjson")
+        for event in make_handoffs(3):
+            client.emit(event)
+        client._http_client = httpx.AsyncClient(
+            base_url="http://collector",
+            transport=httpx.MockTransport(_record(requests)),
+        )
+        await client.flush()
+        await client.aclose()
+
+    asyncio.run(main())
+    request, body = requests[0]
+    assert request.url.path == "/v1/events:ndjson"
+    assert len(body.decode().splitlines()) == 3
@@ -0,0 +1,73 @@
+"""Test precomputed argument normalization for tools."""
+import inspect
+
+import pytest
+
+from r3fresh import ALM
+from r3fresh.util import make_args_normalizer
+
+
+def _reference(func, args, kwargs):
+    try:
+        bound = inspect.signature(func).bind(*args, **kwargs)
+    except TypeError:
+        return {"args": list(args), "kwargs": kwargs}
+    bound.apply_defaults()
+    return {"inputs": dict(bound.arguments)}
+
+
+def plain(a, b=2, *, c=3):
+    return a
+
+
+def variadic(a, *rest, **options):
+    return a
+
+
+def positional_only(a, /, b=1):
+    return a
+
+
+@pytest.mark.parametrize(
+    "func, args, kwargs",
+    [
+        (plain, (1,), {}),
+        (plain, (1, 5), {"c": 6}),
+        (plain, (), {"c": 6, "a": 1}),
+        (plain, (1,), {"a": 1}),  # duplicate
+        (plain, (), {}),  # missing
+        (plain, (1, 2, 3), {}),  # too many
+        (plain, (1,), {"d": 4}),  # unknown
+        (variadic, (1, 2, 3), {"x": 4}),
+        (positional_only, (1,), {"b": 2}),
+    ],
+)
+def test_matches_signature_bind(func, args, kwargs):
+    """Test that the precomputed normalizer agrees with Signature.bind()."""
+    assert make_args_normalizer(func)(args, kwargs) == _reference(func, args, kwargs)
+
+
+def test_unsignaturable_callable_falls_back():
+    """Test callables without an inspectable signature keep args/kwargs."""
+    assert make_args_normalizer(object())((1,), {}) == {"args": [1], "kwargs": {}}
+
+
+def test_signature_resolved_once_per_tool(monkeypatch):
+    """Test that calling a tool repeatedly does not re-inspect its signature."""
+    calls = []
+    real_signature = inspect.signature
+
+    def counting_signature(func, *args, **kwargs):
+        calls.append(func)
+        return real_signature(func, *args, **kwargs)
+
+    monkeypatch.setattr(inspect, "signature", counting_signature)
+    alm = ALM(agent_id="test-agent", mode="http", endpoint="http://localhost", max_queue_events=1000)
+
+    @alm.tool("add")
+    def add(a: int, b: int = 1) -> int:
+        return a + b
+
+    for i in range(5):
+        assert add(i) == i + 1
+    assert [func.__name__ for func in calls if getattr(func, "__name__", None) == "add"] == ["add"]
@@ -0,0 +1,86 @@
+"""Test the Parquet file sink."""
+import json
+import os
+
+import pytest
+
+pq = pytest.importorskip("pyarrow.parquet")
+
+from r3fresh import ALM  # noqa: E402
+
+
+def _parquet_files(directory):
+    return sorted(name for name in os.listdir(directory) if name.endswith(".parquet"))
+
+
+def test_parquet_sink_flattens_tool_metadata(tmp_path):
+    """Test that tool events land in typed columns and the full metadata is kept."""
+    with ALM(agent_id="test-agent", env="test", mode="parquet", output_dir=str(tmp_path)) as alm:
+        with alm.run(purpose="parquet"):
+
+            @alm.tool("add")
+            def add(a: int, b: int) -> int:
+                return a + b
+
+            add(1, 2)
+
+    files = _parquet_files(tmp_path)
+    assert len(files) == 1
+    table = pq.read_table(os.path.join(tmp_path, files[0]))
+    rows = table.to_pylist()
+
+    assert [row["event_type"] for row in rows] == [
+        "run.start", "tool.request", "policy.decision", "tool.response", "run.end",
+    ]
+    response = rows[3]
+    assert response["tool_name"] == "add"
+    assert response["status"] == "success"
+    assert response["attempt"] == 1
+    assert table.schema.field("tool_latency_ms").type == "double"
+    assert json.loads(response["metadata"])["result"] == 3
+    assert rows[0]["agent_id"] == "test-agent"
+
+
+def test_parquet_files_roll_by_row_count(tmp_path):
+    """Test that files are closed after parquet_rows_per_file rows."""
+    alm = ALM(
+        agent_id="test-agent",
+        mode="parquet",
+        output_dir=str(tmp_path),
+        parquet_rows_per_file=4,
+    )
+    for _ in range(10):
+        alm.handoff("other-agent")
+    alm.flush()
+
+    # Two full files are complete; the rest is still being written
+    assert len(_parquet_files(tmp_path)) == 2
+    alm.client.close()
+
+    files = _parquet_files(tmp_path)
+    assert [pq.read_metadata(os.path.join(tmp_path, name)).num_rows for name in files] == [4, 4, 2]
+    assert not [name for name in os.listdir(tmp_path) if name.endswith(".inprogress")]
+
+
+def test_parquet_mode_requires_output_dir():
+    """Test that parquet mode needs a directory."""
+    with pytest.raises(ValueError):
+        ALM(agent_id="test-agent", mode="parquet")
+
+
+def test_small_flushes_share_a_row_group(tmp_path):
+    """Test that rows are buffered into row groups of parquet_row_group_rows rows."""
+    alm = ALM(
+        agent_id="test-agent",
+        mode="parquet",
+        output_dir=str(tmp_path),
+        parquet_row_group_rows=4,
+    )
+    for _ in range(10):
+        alm.handoff("other-agent")
+        alm.flush()
+    alm.client.close()
+
+    (name,) = _parquet_files(tmp_path)
+    metadata = pq.read_metadata(os.path.join(tmp_path, name))
+    assert [metadata.row_group(i).num_rows for i in range(metadata.num_row_groups)] == [4, 4, 2]
@@ -0,0 +1,94 @@
+"""Test retry with backoff for event uploads."""
+import httpx
+import pytest
+
+from r3fresh import RetryPolicy
+from r3fresh.client import EventClient
+
+
+def _client(handler, retry_policy, events):
+    client = EventClient(mode="http", endpoint="http://collector", retry_policy=retry_policy)
+    client._http_client = httpx.Client(
+        base_url="http://collector",
+        transport=httpx.MockTransport(handler),
+    )
+    for event in events:
+        client.emit(event)
+    return client
+
+
+def test_transient_errors_are_retried(make_handoffs):
+    """Test that 503 and connection errors are retried until the upload succeeds."""
+    responses = [httpx.ConnectError("refused"), httpx.Response(503), httpx.Response(200)]
+    attempts = []
+
+    def handler(request):
+        attempts.append(request)
+        response = responses.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+    client = _client(handler, RetryPolicy(max_attempts=3, base_delay=0.001), make_handoffs(1))
+    client.flush()
+    assert len(attempts) == 3
+    client.close()
+
+
+def test_client_errors_are_not_retried(make_handoffs):
+    """Test that a 400 fails immediately."""
+    attempts = []
+
+    def handler(request):
+        attempts.append(request)
+        return httpx.Response(400)
+
+    client = _client(handler, RetryPolicy(max_attempts=5, base_delay=0.001), make_handoffs(1))
+    client.flush()
+    assert len(attempts) == 1
+    client.close()
+
+
+def test_retry_after_is_honored_within_budget():
+    """Test that Retry-After sets the delay, and a delay beyond max_elapsed gives up."""
+    policy = RetryPolicy(max_attempts=5, max_elapsed=10.0)
+    request = httpx.Request("POST", "http://collector/v1/events")
+
+    throttled = httpx.HTTPStatusError(
+        "throttled",
+        request=request,
+        response=httpx.Response(429, headers={"Retry-After": "2"}, request=request),
+    )
+    assert policy.next_delay(1, throttled, elapsed=0.0) == 2.0
+    assert policy.next_delay(1, throttled, elapsed=9.0) is None
+
+    unavailable = httpx.HTTPStatusError(
+        "down",
+        request=request,
+        response=httpx.Response(503, request=request),
+    )
+    delay = policy.next_delay(2, unavailable, elapsed=0.0)
+    assert 0 <= delay <= policy.base_delay * 2
+    assert policy.next_delay(5, unavailable, elapsed=0.0) is None
+
+
+def test_invalid_policy():
+    """Test that max_attempts must allow at least one attempt."""
+    with pytest.raises(ValueError):
+        RetryPolicy(max_attempts=0)
+
+
+def test_slow_attempts_respect_total_budget(make_handoffs):
+    """Test that each attempt's timeout is capped by what is left of max_elapsed."""
+    timeouts = []
+
+    def handler(request):
+        timeouts.append(request.extensions["timeout"]["read"])
+        raise httpx.ReadTimeout("slow", request=request)
+
+    policy = RetryPolicy(max_attempts=5, base_delay=0.001, max_elapsed=0.5)
+    client = _client(handler, policy, make_handoffs(1))
+    client.flush()
+    assert 0 < timeouts[0] <= 0.5
+    assert all(later <= earlier for earlier, later in zip(timeouts, timeouts[1:]))
+    client.close()
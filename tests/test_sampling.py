@@ -0,0 +1,139 @@
+"""Test sampling of tool call events."""
+import pytest
+
+from r3fresh import ALM
+from r3fresh.sampling import Sampler
+
+
+def _tool_events(events):
+    return [e for e in events if e["event_type"] not in ("run.start", "run.end")]
+
+
+def test_sampled_tool_keeps_errors_and_exact_summary(stdout_events):
+    """Test that successes are sampled, errors and denials are kept, and summaries are exact."""
+    alm = ALM(
+        agent_id="test-agent",
+        env="test",
+        mode="stdout",
+        tool_sample_rates={"lookup": 0.25, "blocked": 0.25},
+        denied_tools={"blocked"},
+    )
+    draws = iter([0.1, 0.9, 0.9, 0.9] * 5)
+    alm.sampler._draw = lambda: next(draws)
+
+    @alm.tool("lookup")
+    def lookup(key: str) -> str:
+        if key == "bad":
+            raise KeyError(key)
+        return key.upper()
+
+    @alm.tool("blocked")
+    def blocked() -> None:
+        pass
+
+    def main():
+        with alm.run():
+            for i in range(20):
+                lookup(f"k{i}")
+            with pytest.raises(KeyError):
+                lookup("bad")
+            with pytest.raises(PermissionError):
+                blocked()
+
+    main()
+
+    events = stdout_events()
+
+    responses = [e["metadata"] for e in events if e["event_type"] == "tool.response"]
+    successes = [r for r in responses if r["status"] == "success"]
+    assert len(successes) == 5
+    assert all(r["sample_weight"] == 4.0 for r in successes)
+    (error,) = [r for r in responses if r["status"] == "error"]
+    assert "sample_weight" not in error
+    (denied,) = [r for r in responses if r["status"] == "denied"]
+    assert "sample_weight" not in denied
+    # All three events of the failed call were kept, in order
+    error_events = [
+        e["event_type"] for e in events if e["metadata"].get("tool_call_id") == error["tool_call_id"]
+    ]
+    assert error_events == ["tool.request", "policy.decision", "tool.response"]
+    summary = events[-1]["metadata"]["summary"]["tool_calls"]
+    assert (summary["total"], summary["error"], summary["denied"]) == (22, 1, 1)
+
+
+def test_event_type_rates_and_unsampled_tools(stdout_events):
+    """Test per event type rates and that tools without a rate are unaffected."""
+    alm = ALM(
+        agent_id="test-agent",
+        env="test",
+        mode="stdout",
+        tool_sample_rates={"hot": 0.5},
+        event_sample_rates={"tool.request": 0.5, "policy.decision": 0.1},
+    )
+    alm.sampler._draw = lambda: 0.3
+
+    @alm.tool("hot")
+    def hot() -> int:
+        return 1
+
+    @alm.tool("cold")
+    def cold() -> int:
+        return 2
+
+    def main():
+        hot()
+        cold()
+        alm.flush()
+
+    main()
+
+    events = _tool_events(stdout_events())
+
+    # hot: request rate 0.25 and decision rate 0.05 are below the draw; response rate 0.5 is not
+    assert [(e["event_type"], e["metadata"]["tool_name"]) for e in events] == [
+        ("tool.response", "hot"),
+        ("tool.request", "cold"),
+        ("tool.response", "cold"),
+    ]
+    assert events[0]["metadata"]["sample_weight"] == 2.0
+    assert events[1]["metadata"]["sample_weight"] == 2.0
+    assert events[2]["metadata"]["sample_weight"] == 1.0
+
+
+def test_denied_calls_are_always_emitted(stdout_events):
+    """Test that a denied call emits all of its events under sampling."""
+    alm = ALM(
+        agent_id="test-agent",
+        env="test",
+        mode="stdout",
+        tool_sample_rates={"blocked": 0.01},
+        denied_tools={"blocked"},
+    )
+    alm.sampler._draw = lambda: 0.99
+
+    @alm.tool("blocked")
+    def blocked() -> None:
+        pass
+
+    def main():
+        with pytest.raises(PermissionError):
+            blocked()
+        alm.flush()
+
+    main()
+
+    events = stdout_events()
+
+    assert [e["event_type"] for e in events] == ["tool.request", "policy.decision", "tool.response"]
+    assert events[-1]["metadata"]["status"] == "denied"
+
+
+def test_invalid_rates():
+    """Test that out-of-range rates and unknown event types are rejected."""
+    with pytest.raises(ValueError):
+        Sampler(tool_rates={"t": 0})
+    with pytest.raises(ValueError):
+        Sampler(tool_rates={"t": 1.5})
+    with pytest.raises(ValueError):
+        Sampler(event_rates={"run.end": 0.5})
+    assert not Sampler(event_rates={"tool.request": 1.0}).applies("anything")
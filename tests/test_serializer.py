@@ -0,0 +1,122 @@
+"""Test pluggable JSON serializers."""
+import dataclasses
+import json
+from datetime import datetime, timezone
+
+import pytest
+from pydantic import BaseModel
+
+from r3fresh import ALM
+from r3fresh.client import EventClient
+from r3fresh.events import run_start_event
+from r3fresh.serialize import SERIALIZERS, MsgpackSerializer, get_serializer
+
+
+class Point(BaseModel):
+    x: int
+    y: int
+
+
+@dataclasses.dataclass
+class Quote:
+    symbol: str
+    at: datetime
+
+
+SAMPLE = {
+    "event_type": "tool.response",
+    "metadata": {
+        "result": "héllo",
+        "n": [1, 2.5, None, True],
+        "when": datetime(2026, 1, 1, 12, 0, tzinfo=timezone.utc),
+        "tags": {"a"},
+        "raw": b"ab",
+        "point": Point(x=1, y=2),
+        "quote": Quote(symbol="ABC", at=datetime(2026, 1, 1, 12, 0)),
+    },
+}
+
+# What pydantic's JSON mode (the baseline event encoding) produces for SAMPLE
+SAMPLE_JSON = {
+    "event_type": "tool.response",
+    "metadata": {
+        "result": "héllo",
+        "n": [1, 2.5, None, True],
+        "when": "2026-01-01T12:00:00Z",
+        "tags": ["a"],
+        "raw": "ab",
+        "point": {"x": 1, "y": 2},
+        "quote": {"symbol": "ABC", "at": "2026-01-01T12:00:00"},
+    },
+}
+
+
+def _available():
+    names = []
+    for name in SERIALIZERS[1:]:
+        try:
+            get_serializer(name)
+        except ValueError:
+            continue
+        names.append(name)
+    return names
+
+
+@pytest.mark.parametrize("name", _available())
+def test_backends_produce_identical_json(name):
+    expected = get_serializer("json").dumps(SAMPLE)
+    encoded = get_serializer(name).dumps(SAMPLE)
+    assert encoded == expected
+    assert json.loads(encoded) == SAMPLE_JSON
+
+
+def test_msgpack_converts_like_json():
+    """Test that the MessagePack wire format converts values like the JSON backends."""
+    pytest.importorskip("msgpack")
+    serializer = get_serializer("json")
+    msgpack_serializer = MsgpackSerializer()
+    assert msgpack_serializer.loads(msgpack_serializer.dumps(SAMPLE)) == serializer.loads(
+        serializer.dumps(SAMPLE)
+    )
+
+
+def test_auto_prefers_installed_fast_backend():
+    pytest.importorskip("orjson")
+    assert get_serializer("auto").name == "orjson"
+
+
+def test_invalid_serializer_rejected():
+    with pytest.raises(ValueError):
+        get_serializer("pickle")
+    with pytest.raises(ValueError):
+        ALM(agent_id="a", serializer="pickle")
+
+
+def test_http_batch_is_compact_json(envelope):
+    """Test that a batch under max_batch_bytes becomes a single compact body."""
+    client = EventClient(mode="http", endpoint="http://localhost", serializer="json")
+    events = [
+        run_start_event(
+            envelope,
+            event_id=f"event-{i}",
+            timestamp="2026-01-01T00:00:00.000Z",
+            run_id="run-1",
+            purpose="héllo",
+        )
+        for i in range(3)
+    ]
+    requests = client._http_requests(events)
+
+    assert len(requests) == 1
+    body = requests[0][0]
+    assert b", " not in body
+    assert [e["event_id"] for e in json.loads(body)["events"]] == ["event-0", "event-1", "event-2"]
+    assert "héllo".encode("utf-8") in body
+    client.close()
+
+
+@pytest.mark.parametrize("name", _available())
+def test_integers_beyond_64_bits(name):
+    """Test that huge integers encode like the json module instead of failing the batch."""
+    value = {"metadata": {"result": 2**70, "text": "héllo"}}
+    assert get_serializer(name).dumps(value) == get_serializer("json").dumps(value)
@@ -0,0 +1,141 @@
+"""Test the on-disk spool for undeliverable batches."""
+import asyncio
+import json
+import time
+
+import httpx
+
+from r3fresh.aio import AsyncEventClient
+from r3fresh.client import EventClient
+from r3fresh.spool import DiskSpool
+
+
+def test_spool_survives_reopen(tmp_path):
+    """Test that undelivered batches persist across spool instances in order."""
+    spool = DiskSpool(str(tmp_path))
+    spool.append(b"first", {"Content-Type": "application/json"})
+    spool.append(b"second", {"Content-Type": "application/json"})
+
+    position, body, headers = spool.peek()
+    assert body == b"first"
+    assert headers == {"Content-Type": "application/json"}
+    spool.commit(position)
+    spool.close()
+
+    reopened = DiskSpool(str(tmp_path))
+    position, body, _ = reopened.peek()
+    assert body == b"second"
+    reopened.commit(position)
+    assert reopened.peek() is None
+    reopened.close()
+
+
+def test_spool_retention_limits(tmp_path):
+    """Test that max_bytes drops the oldest batches and max_age expires stale ones."""
+    spool = DiskSpool(str(tmp_path), max_bytes=300, segment_bytes=100)
+    for i in range(10):
+        spool.append(f"batch-{i}".encode() * 5, {})
+    assert spool.pending_bytes() <= 300
+    assert spool.dropped_batches > 0
+    _, body, _ = spool.peek()
+    assert body != b"batch-0" * 5
+    spool.close()
+
+    expired = DiskSpool(str(tmp_path / "aged"), max_age=0.01)
+    expired.append(b"stale", {})
+    time.sleep(0.02)
+    assert expired.peek() is None
+    assert expired.dropped_batches == 1
+    expired.close()
+
+
+def test_failed_batch_is_spooled_and_drained(tmp_path, make_handoffs):
+    """Test that a batch failing with 503 is persisted and resent once the endpoint recovers."""
+    received = []
+    status = {"code": 503}
+
+    def handler(request):
+        if status["code"] == 200:
+            received.append(json.loads(request.content))
+        return httpx.Response(status["code"])
+
+    client = EventClient(
+        mode="http",
+        endpoint="http://collector",
+        spool_dir=str(tmp_path),
+        spool_retry_interval=0.01,
+    )
+    client._http_client = httpx.Client(
+        base_url="http://collector",
+        transport=httpx.MockTransport(handler),
+    )
+
+    client.emit(make_handoffs(1)[0])
+    client.flush()
+    assert received == []
+    assert client._spool.pending_bytes() > 0
+
+    status["code"] = 200
+    deadline = time.monotonic() + 5
+    while not received and time.monotonic() < deadline:
+        time.sleep(0.01)
+    client.close()
+
+    assert received[0]["events"][0]["event_id"] == "event-0"
+    assert DiskSpool(str(tmp_path)).peek() is None
+
+
+def test_commit_after_segment_eviction(tmp_path):
+    """Test that committing a record whose segment was evicted meanwhile is ignored."""
+    spool = DiskSpool(str(tmp_path), max_bytes=300, segment_bytes=100)
+    spool.append(b"a" * 60, {})
+    position, body, _ = spool.peek()
+    assert body == b"a" * 60
+    # While the peeked batch is being posted, new appends evict its segment
+    for i in range(10):
+        spool.append(f"batch-{i}".encode() * 5, {})
+    spool.commit(position)
+
+    _, body, _ = spool.peek()
+    assert body != b"a" * 60
+    assert spool.pending_bytes() <= 300
+    spool.close()
+
+
+def test_async_client_drains_spool_while_busy(tmp_path, make_handoffs):
+    """Test that the async sender resends spooled batches even when emits keep it awake."""
+    received = []
+
+    def handler(request):
+        received.extend(e["event_id"] for e in json.loads(request.content)["events"])
+        return httpx.Response(200)
+
+    async def run():
+        client = AsyncEventClient(
+            mode="http",
+            endpoint="http://collector",
+            batch_size=1,
+            spool_dir=str(tmp_path),
+            spool_retry_interval=0.05,
+        )
+        client._start(asyncio.get_running_loop())
+        await client._http_client.aclose()
+        client._http_client = httpx.AsyncClient(
+            base_url="http://collector",
+            transport=httpx.MockTransport(handler),
+        )
+        for i, event in enumerate(make_handoffs(200)):
+            if i == 20:
+                # As if an earlier upload had failed while the sender stays busy
+                client._spool.append(
+                    b'{"events":[{"event_id":"spooled"}]}', {"Content-Type": "application/json"}
+                )
+            client.emit(event)
+            await asyncio.sleep(0.001)
+        await client.flush()
+        await client.aclose()
+
+    asyncio.run(run())
+
+    assert "spooled" in received
+    assert DiskSpool(str(tmp_path)).peek() is None
@@ -0,0 +1,55 @@
+"""Test the batched stdout sink."""
+import io
+import json
+import sys
+
+from r3fresh.client import EventClient
+
+
+class _CountingBuffer(io.BytesIO):
+    def __init__(self):
+        super().__init__()
+        self.writes = 0
+
+    def write(self, data):
+        self.writes += 1
+        return super().write(data)
+
+
+class _BinaryStdout(io.TextIOWrapper):
+    """Text stdout backed by a buffer that counts write calls."""
+
+    def __init__(self):
+        super().__init__(_CountingBuffer(), encoding="utf-8")
+
+
+def _capture(client, events):
+    old_stdout = sys.stdout
+    sys.stdout = _BinaryStdout()
+    try:
+        for event in events:
+            client.emit(event)
+        client.flush()
+        buffer = sys.stdout.buffer
+        return buffer.writes, buffer.getvalue()
+    finally:
+        sys.stdout = old_stdout
+
+
+def test_batch_written_with_single_write(make_handoffs):
+    """Test that a batch costs one write on the binary buffer."""
+    writes, data = _capture(EventClient(mode="stdout", batch_size=100), make_handoffs(50))
+
+    assert writes == 1
+    lines = data.decode("utf-8").splitlines()
+    assert [json.loads(line)["event_id"] for line in lines] == [f"event-{i}" for i in range(50)]
+
+
+def test_line_buffered_writes_each_event(make_handoffs):
+    """Test that stdout_line_buffered writes events one line at a time."""
+    writes, data = _capture(
+        EventClient(mode="stdout", batch_size=100, stdout_line_buffered=True), make_handoffs(5)
+    )
+
+    assert writes == 5
+    assert len(data.splitlines()) == 5
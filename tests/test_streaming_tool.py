@@ -0,0 +1,211 @@
+"""Test generator and async generator tools."""
+import asyncio
+import inspect
+import time
+
+import pytest
+
+from r3fresh import ALM, AsyncALM
+
+
+def _responses(events):
+    return [e["metadata"] for e in events if e["event_type"] == "tool.response"]
+
+
+def test_generator_tool_reports_stream_stats(stdout_events):
+    """Test that items pass through and the response carries stream statistics."""
+    alm = ALM(agent_id="test-agent", env="test", mode="stdout")
+
+    @alm.tool("tokens")
+    def tokens(text: str):
+        time.sleep(0.02)
+        for word in text.split():
+            yield word
+
+    assert inspect.isgeneratorfunction(tokens)
+
+    def main():
+        with alm.run():
+            stream = tokens("héllo big world")
+            # Nothing is emitted until iteration starts
+            alm.flush()
+            return list(stream)
+
+    result = main()
+
+    events = stdout_events()
+
+    assert result == ["héllo", "big", "world"]
+    types = [e["event_type"] for e in events]
+    assert types.index("tool.request") > types.index("run.start")
+    (response,) = _responses(events)
+    assert response["status"] == "success"
+    assert "result" not in response
+    stream = response["stream"]
+    assert stream["items"] == 3
+    assert stream["bytes"] == len("héllobigworld".encode("utf-8"))
+    assert stream["completed"] is True
+    assert stream["time_to_first_item_ms"] >= 15
+    assert stream["duration_ms"] >= stream["time_to_first_item_ms"]
+    summary = events[-1]["metadata"]["summary"]["tool_calls"]
+    assert (summary["total"], summary["allowed"]) == (1, 1)
+
+
+def test_generator_closed_early_and_error(stdout_events):
+    """Test that an abandoned stream and a failing stream each emit one response."""
+    alm = ALM(agent_id="test-agent", env="test", mode="stdout")
+    closed = []
+
+    @alm.tool("counter")
+    def counter():
+        try:
+            for i in range(100):
+                yield i
+        finally:
+            closed.append(True)
+
+    @alm.tool("broken")
+    def broken():
+        yield b"abc"
+        raise ValueError("boom")
+
+    def main():
+        with alm.run():
+            stream = counter()
+            assert [next(stream), next(stream)] == [0, 1]
+            stream.close()
+            with pytest.raises(ValueError):
+                list(broken())
+
+    main()
+
+    events = stdout_events()
+
+    assert closed == [True]
+    early, failed = _responses(events)
+    assert early["status"] == "success"
+    assert (early["stream"]["items"], early["stream"]["completed"]) == (2, False)
+    assert failed["status"] == "error"
+    assert failed["error"]["message"] == "boom"
+    assert (failed["stream"]["items"], failed["stream"]["bytes"]) == (1, 3)
+    summary = events[-1]["metadata"]["summary"]["tool_calls"]
+    assert (summary["total"], summary["allowed"], summary["error"]) == (2, 2, 1)
+
+
+def test_denied_generator_raises_on_first_item(stdout_events):
+    """Test that a denied stream raises PermissionError when iteration starts."""
+    alm = ALM(agent_id="test-agent", env="test", mode="stdout", denied_tools={"blocked"})
+
+    @alm.tool("blocked")
+    def blocked():
+        raise AssertionError("must not run")
+        yield
+
+    def main():
+        stream = blocked()
+        with pytest.raises(PermissionError):
+            next(stream)
+        alm.flush()
+
+    main()
+
+    events = stdout_events()
+
+    (response,) = _responses(events)
+    assert response["status"] == "denied"
+    assert "stream" not in response
+
+
+def test_async_generator_tool(stdout_events):
+    """Test that async generator tools are instrumented the same way."""
+    async def main():
+        async with AsyncALM(agent_id="test-agent", env="test", mode="stdout") as alm:
+
+            @alm.tool("chunks")
+            async def chunks(n: int):
+                for i in range(n):
+                    await asyncio.sleep(0)
+                    yield f"chunk-{i}"
+
+            assert inspect.isasyncgenfunction(chunks)
+            async with alm.run():
+                return [chunk async for chunk in chunks(4)]
+
+    result = asyncio.run(main())
+
+    events = stdout_events()
+
+    assert result == ["chunk-0", "chunk-1", "chunk-2", "chunk-3"]
+    (response,) = _responses(events)
+    assert response["stream"]["items"] == 4
+    assert response["stream"]["bytes"] == 28
+    assert response["stream"]["completed"] is True
+
+
+def test_generator_send_and_throw_are_forwarded(stdout_events):
+    """Test that send() values, throw() exceptions and the return value reach the tool."""
+    alm = ALM(agent_id="test-agent", env="test", mode="stdout")
+
+    @alm.tool("accumulate")
+    def accumulate():
+        total = 0
+        while True:
+            try:
+                value = yield total
+            except ValueError:
+                value = -total
+            if value is None:
+                return total
+            total += value
+
+    def main():
+        stream = accumulate()
+        assert next(stream) == 0
+        assert stream.send(5) == 5
+        assert stream.throw(ValueError("reset")) == 0
+        with pytest.raises(StopIteration) as stop:
+            stream.send(None)
+        alm.flush()
+        return stop.value.value
+
+    result = main()
+
+    events = stdout_events()
+
+    assert result == 0
+    (response,) = _responses(events)
+    assert response["status"] == "success"
+    assert (response["stream"]["items"], response["stream"]["completed"]) == (3, True)
+
+
+def test_async_generator_asend_and_athrow_are_forwarded(stdout_events):
+    """Test that asend() and athrow() reach an async generator tool."""
+
+    async def main():
+        alm = AsyncALM(agent_id="test-agent", env="test", mode="stdout")
+
+        @alm.tool("echo")
+        async def echo():
+            received = None
+            while True:
+                try:
+                    received = yield received
+                except KeyError:
+                    received = "caught"
+
+        stream = echo()
+        assert await stream.__anext__() is None
+        assert await stream.asend("hi") == "hi"
+        assert await stream.athrow(KeyError("k")) == "caught"
+        with pytest.raises(RuntimeError):
+            await stream.athrow(RuntimeError("boom"))
+        await alm.aclose()
+
+    asyncio.run(main())
+
+    events = stdout_events()
+
+    (response,) = _responses(events)
+    assert response["status"] == "error"
+    assert response["error"]["message"] == "boom"
+    assert response["stream"]["items"] == 3